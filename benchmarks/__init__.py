@@ -0,0 +1,28 @@
+"""Benchmarks of the project. Every benchmark is a module of this package, and is run from the repository root with
+
+    python -m benchmarks.<benchmark> [arguments]
+
+e.g. python -m benchmarks.bench_records 10000; the arguments of each benchmark are given in the docstring of its module. Note that the benchmarks need the same packages as the project itself, and
+that bench_schema writes to the database chosen with BBC_BACKEND and BBC_DATABASE (e.g. BBC_BACKEND=sqlite), and that bench_ui_startup needs a display (on a server, run it
+under xvfb-run).
+"""
+
+import os
+import sys
+import types
+
+
+# the modules of the project are imported both as 'data.<module>' and 'admin.session' (as laid out on the server) and as top-level modules (as the user interface imports them). As for the tests,
+# the repository root is therefore put on the path, and registered as both packages, so that the benchmarks run from a plain checkout
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+for name in ('data', 'admin'):
+    if name not in sys.modules:
+        package = types.ModuleType(name)
+        package.__path__ = [ROOT]
+
+        sys.modules[name] = package
@@ -0,0 +1,129 @@
+"""Micro-benchmark comparing the original decoding of the scorer blocks in Fixture.process_data()/Event.process_element() with the single pass decoder in event_decoder. Both stages are timed:
+retrieving the event string from the per-character spans of a block, and decoding the string into (time, type) tuples.
+
+usage: python -m benchmarks.bench_event_decoder [number of scorer blocks]
+"""
+
+import sys
+import random
+import timeit
+from bs4 import BeautifulSoup
+from data.event_decoder import decode_events
+
+
+def legacy_text(block):
+    """The event string as originally assembled by Fixture.process_data(), i.e. by concatenating the text of every single span"""
+
+    player_name, *details = block.find_all('span')
+
+    event = ''
+
+    for detail in details:
+        event += detail.get_text()
+
+    return event
+
+
+def block_text(block):
+    """The event string as assembled by gather_data.fixture_record(), i.e. from a single get_text() call on the whole block"""
+
+    player_name = block.find('span').get_text()
+    text = block.get_text()
+
+    return text[text.find(player_name) + len(player_name):]
+
+
+def legacy_decode(event):
+    """The decoding as originally done by Fixture.process_data() and Event.process_element(); note that the added time is read as a single character, which drops the second digit of added times of
+    10 minutes or more, and adds the first digit of the minute for events without added time"""
+
+    events = []
+
+    for element in event.split(','):
+        element = element[:len(element)//2 + 1].replace('(', '').strip()
+
+        if not element:
+            continue
+
+        if element.find('pen') != -1:
+            kind = 'penalty'
+        elif element.find('Dismissed') != -1:
+            kind = 'red_card'
+            element = element.replace('Dismissed at ', '')
+        else:
+            kind = 'goal'
+
+        added_time = element[element.find('+') + 1]
+
+        time = int(element.split('\'')[0])
+
+        if added_time:
+            time += int(added_time)
+
+        events.append((time, kind))
+
+    return events
+
+
+def sample_events(n, seed=0):
+    """Function that generates n duplicated event strings of the form found in the HTML source"""
+
+    rnd = random.Random(seed)
+    samples = []
+
+    for _ in range(n):
+        elements = []
+
+        for _ in range(rnd.randint(1, 3)):
+            element = "{}'".format(rnd.randint(1, 90))
+
+            if rnd.random() < 0.2:
+                element += " +{}'".format(rnd.randint(1, 12))
+
+            kind = rnd.random()
+
+            if kind < 0.1:
+                element = 'Dismissed at ' + element
+            elif kind < 0.25:
+                element += ' pen'
+
+            elements.append(element + element)
+
+        samples.append(', '.join(elements))
+
+    return samples
+
+
+def time_stage(title, candidates, samples, repeat):
+
+    print(title)
+
+    for name, func in candidates:
+        best = min(timeit.repeat(lambda: [func(sample) for sample in samples], number=1, repeat=repeat))
+        print('    {:<8} {:>8.2f} ms   {:>6.2f} us per block'.format(name, best * 1e3, best * 1e6 / len(samples)))
+
+
+def main(n=10000, repeat=5):
+
+    samples = sample_events(n)
+
+    # the scorer blocks are built the way they appear in the HTML source, with one span for the player name and one span per character
+
+    html = ''.join('<li><span>Player {}</span>{}</li>'.format(i, ''.join('<span>{}</span>'.format(char) for char in sample)) for i, sample in enumerate(samples))
+    blocks = BeautifulSoup(html, 'lxml').find_all('li')
+
+    assert [legacy_text(block) for block in blocks] == [block_text(block) for block in blocks] == samples
+
+    time_stage('event string', (('legacy', legacy_text), ('decoder', block_text)), blocks, repeat)
+    time_stage('decoding', (('legacy', legacy_decode), ('decoder', decode_events)), samples, repeat)
+
+    # note that the two decoders only agree on events with single digit added time; for all other events, the legacy decoding adds the first digit of the minute (no added time) or drops the second
+    # digit of the added time
+
+    different = [sample for sample in samples if legacy_decode(sample) != decode_events(sample)]
+
+    print('blocks decoded differently: {} of {} ({} of which contain added time)'.format(len(different), n, sum('+' in sample for sample in different)))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:2]))
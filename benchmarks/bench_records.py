@@ -0,0 +1,82 @@
+"""Benchmark comparing the memory footprint and throughput of the descriptor based Fixture/Event classes with the __slots__ based FixtureRecord/EventRecord classes.
+
+usage: python -m benchmarks.bench_records [number of fixtures]
+"""
+
+import sys
+import pickle
+import time
+import random
+import tracemalloc
+from data.gather_data import Fixture
+from data.records import FixtureRecord
+
+
+def sample_records(n, seed=0):
+    """Function that generates n plain fixture records, with duplicated event strings of the form found in the HTML source"""
+
+    rnd = random.Random(seed)
+    records = []
+
+    for i in range(n):
+        scorers = []
+
+        for j in range(rnd.randint(0, 5)):
+            elements = ["{}'".format(rnd.randint(1, 90)) for _ in range(rnd.randint(1, 2))]
+            scorers.append(('Player {}'.format(rnd.randint(0, 5000)), ', '.join(element + element for element in elements), rnd.random() < 0.5))
+
+        records.append({'home_team': 'Team {}'.format(i % 20), 'home_score': str(rnd.randint(0, 5)),
+                        'away_team': 'Team {}'.format((i + 7) % 20), 'away_score': str(rnd.randint(0, 5)), 'scorers': scorers})
+
+    return records
+
+
+def build(name, factory, records, events):
+
+    # the objects are built twice; once to time the construction, and once to trace the memory, since tracing slows down the construction considerably
+
+    start = time.perf_counter()
+    objects = [factory('2019-02-23', record) for record in records]
+    elapsed = time.perf_counter() - start
+
+    del objects
+
+    tracemalloc.start()
+    objects = [factory('2019-02-23', record) for record in records]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # the read throughput is measured by visiting every attribute a loader needs, i.e. the teams and scores of every fixture and the player, time and type of every event
+
+    start = time.perf_counter()
+
+    for obj in objects:
+        (obj.home_team, obj.away_team, obj.home_score, obj.away_score, obj.result, obj.date)
+
+        for event in events(obj):
+            (event.player, event.time, event.type)
+
+    read = time.perf_counter() - start
+
+    events = sum(len(obj.time_line) for obj in objects)
+
+    print('{:<14} build {:>8.1f} ms   read {:>7.1f} ms   memory {:>8.1f} KiB   ({:.0f} bytes per event)'.format(
+        name, elapsed * 1e3, read * 1e3, size / 1024, size / max(events, 1)))
+
+    return objects
+
+
+def main(n=50000):
+
+    records = sample_records(n)
+
+    fixtures = build('Fixture', Fixture, records, lambda fixture: fixture.time_line.values())
+    compact = build('FixtureRecord', FixtureRecord.from_record, records, lambda record: record.events)
+
+    assert [str(fixture) for fixture in fixtures] == [str(record) for record in compact]
+    assert [FixtureRecord.from_fixture(fixture) for fixture in fixtures] == compact
+    assert pickle.loads(pickle.dumps(compact)) == compact
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:2]))
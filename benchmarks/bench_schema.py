@@ -0,0 +1,131 @@
+"""Benchmark comparing typical queries against the previous layout (three tables per league and one table per team) with the same queries against the normalized schema. Note that the benchmark
+needs a database holding both layouts, i.e. a database that has been migrated with 'python -m data.schema migrate' (without --drop); with --synthetic, the database is first filled with synthetic
+leagues in the previous layout and migrated. The backend is chosen with the BBC_BACKEND and BBC_DATABASE environment variables.
+
+usage: python -m benchmarks.bench_schema [number of repeats] [--synthetic]
+"""
+
+import sys
+import time
+import random
+import datetime
+from admin.session import get_backend
+from data import schema
+from data.records import FixtureRecord, EventRecord
+from data.store_data import Session
+
+
+def timed(name, func, repeats):
+
+    start = time.perf_counter()
+
+    for _ in range(repeats):
+        rows = func()
+
+    elapsed = (time.perf_counter() - start) / repeats
+
+    print('{:<34} {:>9.2f} ms   ({} rows)'.format(name, elapsed * 1e3, len(rows)))
+
+    return rows
+
+
+def populate(backend, leagues=5, teams=20, seasons=3):
+    """Function that loads synthetic leagues into the previous layout, in which every team plays every other team at home and away in every season, and then migrates them"""
+
+    rng = random.Random(0)
+
+    for s in range(seasons):
+
+        start = datetime.date(2016 + s, 8, 1)
+        batch = {}
+
+        for l in range(leagues):
+
+            names = ['League{} Team {}'.format(l, t) for t in range(teams)]
+            fixtures = []
+
+            for i, home in enumerate(names):
+                for j, away in enumerate(names):
+                    if i == j:
+                        continue
+
+                    home_score, away_score = rng.randint(0, 4), rng.randint(0, 4)
+
+                    events = [EventRecord('{} Player {}'.format(home, rng.randint(1, 11)), 5 * k + 1, 'goal', True) for k in range(home_score)]
+                    events += [EventRecord('{} Player {}'.format(away, rng.randint(1, 11)), 5 * k + 3, 'goal', False) for k in range(away_score)]
+
+                    date = start + datetime.timedelta(days=7 * ((i + 2 * j) % (2 * teams - 2)))
+
+                    fixtures.append(FixtureRecord(str(date), home, str(home_score), away, str(away_score), events))
+
+            batch['League {}'.format(l)] = fixtures
+
+        with Session(backend) as sess:
+            sess.bulk_update_database(batch)
+
+    schema.migrate(backend)
+
+
+def main(repeats=20, synthetic=False):
+
+    backend = get_backend()
+
+    if synthetic:
+        populate(backend)
+
+    with backend.borrow() as connection:
+
+        cursor = backend.cursor(connection)
+
+        tables = backend.tables(cursor)
+
+        leagues = schema.legacy_leagues(tables)
+
+        if not leagues or not all(table in tables for table in schema.TABLES):
+            print('The database has to hold both layouts; run python -m data.schema migrate first')
+            return
+
+        league = leagues[0]
+
+        cursor.execute('SELECT LeagueId FROM leagues WHERE Name = %s ORDER BY Season DESC LIMIT 1', (league,))
+        league_id = cursor.fetchall()[0][0]
+
+        cursor.execute('SELECT HomeTeam, Date FROM {}Fixtures ORDER BY Date DESC LIMIT 1'.format(league))
+        team, date = cursor.fetchall()[0]
+
+        print('{} tables in the database, {} legacy leagues; league {}, team {}, date {}\n'.format(len(tables), len(leagues), league, team, date))
+
+        def query(sql, args=()):
+            cursor.execute(sql, args)
+            return cursor.fetchall()
+
+        # the league table is stored in the previous layout, and derived from the fixtures in the normalized schema
+
+        timed('standings (legacy)', lambda: query('SELECT * FROM {} ORDER BY Pts DESC, GD DESC, GF DESC'.format(league)), repeats)
+        timed('standings (normalized)', lambda: schema.standings(cursor, league_id), repeats)
+
+        timed('top scorers (legacy)', lambda: query('SELECT * FROM {}Players ORDER BY Goals + Penalties DESC LIMIT 20'.format(league)), repeats)
+        timed('top scorers (normalized)', lambda: schema.top_scorers(cursor, league_id), repeats)
+
+        # in the previous layout, the fixtures of a team can only be found by scanning the fixtures table of every league
+
+        def legacy_team_fixtures():
+
+            rows = []
+
+            for name in leagues:
+                rows += query('SELECT Date, HomeTeam, AwayTeam, HomeScore, AwayScore FROM {}Fixtures WHERE HomeTeam = %s OR AwayTeam = %s'.format(name), (team, team))
+
+            return rows
+
+        timed('team fixtures (legacy)', legacy_team_fixtures, repeats)
+        timed('team fixtures (normalized)', lambda: schema.team_fixtures(cursor, team), repeats)
+
+        timed('fixtures on a date (legacy)', lambda: sum((query('SELECT * FROM {}Fixtures WHERE Date = %s'.format(name), (date,)) for name in leagues), []), repeats)
+        timed('fixtures on a date (normalized)', lambda: query('SELECT * FROM fixtures WHERE Date = %s', (date,)), repeats)
+
+        cursor.close()
+
+
+if __name__ == '__main__':
+    main(*map(int, [arg for arg in sys.argv[1:2] if arg.isdigit()]), synthetic='--synthetic' in sys.argv)
@@ -0,0 +1,76 @@
+"""Benchmark of the cold start of the user interface, i.e. the time taken to import the user interface module before the window can be drawn. The import is run in a fresh interpreter with
+-X importtime; the benchmark fails (with exit status 1) if the import takes longer than the budget, or if any of the modules only needed once a league is displayed is imported at startup.
+
+usage: python -m benchmarks.bench_ui_import [budget in ms] [number of runs]
+"""
+
+import sys
+import subprocess
+from benchmarks import ROOT
+
+
+# modules that must not be imported before the window is drawn; these are imported when the first league is loaded or displayed
+
+DEFERRED = ('numpy', 'pandas', 'get_data', 'standings')
+
+
+def importtime(module='user_interface'):
+    """Function that imports a module in a fresh interpreter, and returns the cumulative import time in microseconds of every module imported, as a dictionary of form {module: time}; if module is
+    None, nothing but the modules imported by the interpreter itself is imported"""
+
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import {}'.format(module) if module else 'pass'], cwd=ROOT, capture_output=True, text=True)
+
+    if result.returncode:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+    times = {}
+
+    # each line is of form 'import time: self [us] | cumulative | imported package', with nested imports indented
+
+    for line in result.stderr.splitlines():
+
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+
+        own, cumulative, name = line[len('import time:'):].split('|')
+
+        times[name.strip()] = int(cumulative)
+
+    return times
+
+
+def main(budget=100, runs=5):
+
+    # the fastest of several runs is used, so that the result does not depend on other load of the machine. Note that the modules imported by the interpreter itself (e.g. by site) are left out
+
+    interpreter = importtime(None)
+
+    runs = [importtime() for _ in range(runs)]
+
+    times = min(runs, key=lambda times: times['user_interface'])
+    times = {name: cumulative for name, cumulative in times.items() if name not in interpreter}
+
+    total = times['user_interface'] / 1e3
+
+    print('{:<30} {:>9.2f} ms   (budget {} ms)\n'.format('import user_interface', total, budget))
+
+    for name, cumulative in sorted(times.items(), key=lambda item: -item[1])[1:11]:
+        print('{:<30} {:>9.2f} ms'.format(name, cumulative / 1e3))
+
+    deferred = [name for name in times if name.split('.')[0] in DEFERRED]
+
+    failed = False
+
+    if deferred:
+        print('\nimported at startup, but should be deferred: {}'.format(', '.join(sorted(deferred))))
+        failed = True
+
+    if total > budget:
+        print('\nstartup exceeds the budget by {:.2f} ms'.format(total - budget))
+        failed = True
+
+    return failed
+
+
+if __name__ == '__main__':
+    sys.exit(1 if main(*map(int, sys.argv[1:3])) else 0)
@@ -0,0 +1,149 @@
+"""Benchmark comparing the time taken to build and update league tables with the original LeagueTableWidget (new Labels and Buttons on every display) with the time taken by the Treeview based
+LeagueTableWidget. The tables are built from synthetic standings, so that no league data is needed; note that a display is needed, since the widgets have to be created.
+
+usage: python -m benchmarks.bench_ui_startup [number of leagues] [number of teams]
+"""
+
+import sys
+import time
+import random
+import tkinter as tk
+from tkinter import ttk
+from standings import Standings
+from widgets import LeagueTableWidget
+
+
+class Fixture():
+
+    def __init__(self, date, home_team, away_team, home_score, away_score):
+
+        self.date = date
+        self.home_team = home_team
+        self.away_team = away_team
+        self.home_score = home_score
+        self.away_score = away_score
+
+
+class Cache():
+
+    def __init__(self, standings):
+        self.standings = standings
+
+
+class Container(tk.Frame):
+    """Stand-in for the MainPage, which only provides the cache read by the table widgets"""
+
+    def __init__(self, parent, cache):
+
+        super().__init__(parent)
+
+        self.cache = cache
+
+
+class LegacyTableWidget(tk.Frame):
+    """The original league table widget, which creates a new Label for every cell and a new Button for every team each time a league is displayed. Only select_league() differs from the
+    original, which read the table from a file under a hard-coded path; the table is taken from the cache instead"""
+
+    def __init__(self, parent, controller, league):
+
+        super().__init__(parent, relief=tk.RAISED, borderwidth=1)
+
+        self.grid_rowconfigure(0, weight=1)
+
+        for i in range(9):
+            self.grid_columnconfigure(i, weight=1)
+
+        self.select_league(league)
+
+    def display_league(self):
+
+        self.teams = []
+
+        for i, column in enumerate(self.data, start=1):
+
+            label = ttk.Label(self, text=column, font=('Verdana', 6, 'bold'))
+            label.grid(column=i, row=0)
+
+        for j in range(self.data.shape[0]):
+            team = self.data.iloc[j, :]
+            self.grid_rowconfigure(j + 1, weight=1)
+
+            self.teams.append(ttk.Button(self, text=team.name))
+            self.teams[j].grid(row=j + 1, column=0, sticky='nsew')
+
+            for k, val in enumerate(team):
+                label = ttk.Label(self, text=str(val), font=('Verdana', 8))
+                label.grid(row=j+1, column=k + 1)
+
+    def select_league(self, league, date=None):
+
+        self.data = self.master.cache.standings[league].frame(date)
+
+        self.display_league()
+
+
+def synthetic_standings(league, teams):
+    """Function that returns the standings of a league in which every team has played every other team twice"""
+
+    names = ['{} Team {}'.format(league, i) for i in range(teams)]
+
+    fixtures = []
+
+    for i, home in enumerate(names):
+        for j, away in enumerate(names):
+            if i != j:
+                fixtures.append(Fixture('2019-{:02d}-{:02d}'.format(1 + (i + j) % 12, 1 + (i * j) % 28), home, away, random.randint(0, 4), random.randint(0, 4)))
+
+    return Standings.from_fixtures(fixtures, league)
+
+
+def timed(name, func, root):
+
+    start = time.perf_counter()
+
+    func()
+
+    # the time taken to draw the widgets is included
+
+    root.update()
+
+    print('{:<40} {:>9.2f} ms'.format(name, (time.perf_counter() - start) * 1e3))
+
+
+def main(leagues=10, teams=20):
+
+    try:
+        root = tk.Tk()
+    except tk.TclError as err:
+        print('No display available, the benchmark is skipped ({})'.format(err))
+        return
+
+    names = ['League {}'.format(i) for i in range(leagues)]
+
+    cache = Cache({name: synthetic_standings(name, teams) for name in names})
+
+    dates = ['2019-{:02d}-28'.format(month) for month in range(1, 13)]
+
+    for widget in (LegacyTableWidget, LeagueTableWidget):
+
+        container = Container(root, cache)
+        container.pack()
+
+        tables = []
+
+        timed('build {} tables ({})'.format(leagues, widget.__name__), lambda: tables.extend(widget(container, root, name) for name in names), root)
+
+        def select_dates():
+            for table, name in zip(tables, names):
+                for date in dates:
+                    table.select_league(name, date)
+
+        timed('select {} dates per table ({})'.format(len(dates), widget.__name__), select_dates, root)
+
+        container.destroy()
+
+    root.destroy()
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:3]))
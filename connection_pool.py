@@ -0,0 +1,79 @@
+import time
+from data.resource_pool import ResourcePool
+
+
+class ConnectionPool(ResourcePool):
+    """Pool of database connections shared by all sessions. Opening a connection to the MySQL server requires a full handshake and login, hence connections are kept open and lent out to whoever
+    needs to run a query. Note that connections are only opened when they are first needed, and that the pool never holds more than 'size' connections at once
+
+    Parameters
+    ----------
+    factory: func object
+        function that takes no arguments and returns a new connection
+    size: int
+        maximum number of connections open at the same time
+    recycle: float
+        number of seconds after which a connection is closed and replaced by a new one; this avoids using connections that the server has already timed out
+    health_check: boolean
+        if True, idle connections are pinged before they are lent out, and replaced if they no longer respond
+
+    Attributes
+    ----------
+    self.opened: dict
+        dictionary of form {id(connection): time the connection was opened}
+
+    """
+
+    def __init__(self, factory, size=5, recycle=3600, health_check=True):
+
+        self.recycle = recycle
+        self.health_check = health_check
+
+        self.opened = {}
+
+        super().__init__(factory, size)
+
+    def created(self, connection):
+        self.opened[id(connection)] = time.monotonic()
+
+    def usable(self, connection):
+
+        # connections that are too old, or that have been dropped by the server while idle, are discarded
+
+        return not self.expired(connection) and (not self.health_check or self.is_healthy(connection))
+
+    def reusable(self, connection):
+
+        if self.expired(connection):
+            return False
+
+        # any transaction left open is rolled back, so that the next user of the connection starts from a clean state
+
+        try:
+            connection.rollback()
+            return True
+
+        except Exception:
+            return False
+
+    def forget(self, connection):
+        self.opened.pop(id(connection), None)
+
+    def close(self, connection):
+        connection.close()
+
+    def expired(self, connection):
+        """Method that checks whether a connection has been open for longer than the recycle time"""
+
+        return time.monotonic() - self.opened.get(id(connection), 0) >= self.recycle
+
+    @staticmethod
+    def is_healthy(connection):
+        """Method that checks whether a connection still responds; the ping raises once the server has closed the connection"""
+
+        try:
+            connection.ping(reconnect=False)
+            return True
+
+        except Exception:
+            return False
@@ -0,0 +1,64 @@
+from data.resource_pool import ResourcePool
+
+
+class DriverPool(ResourcePool):
+    """Pool of long-lived browser drivers. Starting a Chrome instance takes far longer than rendering a single page, hence drivers are kept alive and lent out to whoever needs to render a page. Note
+    that drivers are only started when they are first needed, and that the pool never holds more than 'size' drivers at once
+
+    Parameters
+    ----------
+    factory: func object
+        function that takes no arguments and returns a new driver
+    size: int
+        maximum number of drivers alive at the same time
+    max_pages: int
+        number of pages a driver renders before it is recycled; this keeps the memory usage of long running browsers in check
+
+    Attributes
+    ----------
+    self.pages: dict
+        dictionary of form {id(driver): number of pages rendered}
+
+    """
+
+    def __init__(self, factory, size=3, max_pages=50):
+
+        self.max_pages = max_pages
+
+        self.pages = {}
+
+        super().__init__(factory, size)
+
+    def created(self, driver):
+        self.pages[id(driver)] = 0
+
+    def usable(self, driver):
+
+        # drivers that have crashed or been closed while idle are discarded
+
+        return self.is_healthy(driver)
+
+    def reusable(self, driver):
+
+        # the driver is recycled once it has rendered max_pages pages
+
+        self.pages[id(driver)] = self.pages.get(id(driver), 0) + 1
+
+        return self.pages[id(driver)] < self.max_pages
+
+    def forget(self, driver):
+        self.pages.pop(id(driver), None)
+
+    def close(self, driver):
+        driver.quit()
+
+    @staticmethod
+    def is_healthy(driver):
+        """Method that checks whether a driver still responds; any call to the driver raises once the browser has crashed or the session has expired"""
+
+        try:
+            driver.current_url
+            return True
+
+        except Exception:
+            return False
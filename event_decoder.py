@@ -0,0 +1,83 @@
+import re
+
+
+# pattern matching a single event, e.g. "45'", "90' +10'", "23' pen" or "Dismissed at 67'". Note that the data from the HTML source is duplicated for every event; hence, the pattern also consumes an
+# immediate repeat of the same event (via the back reference to the 'event' group), so that each event is only read once
+
+EVENT = re.compile(r"(?P<event>(?P<dismissed>Dismissed at\s*)?(?P<minute>\d+)'(?:\s*\+\s*(?P<added>\d+)'?)?(?P<penalty>\s*pen)?)(?:\s*(?P=event))?")
+
+
+def deduplicate(text):
+    """Function that removes a duplication of the whole event string; the string is only halved if both halves are identical, and is returned unchanged otherwise
+
+    Parameters
+    ----------
+    text: str
+        raw event string
+
+    """
+
+    half = len(text) // 2
+
+    if half and text[:half].strip() == text[half:].strip():
+        return text[:half]
+
+    return text
+
+
+def event_type(dismissed, penalty):
+    """Function that returns the type of an event from the 'dismissed' and 'penalty' groups of the EVENT pattern; note that penalties take precedence over red cards, as was the case in the original
+    decoding"""
+
+    if penalty:
+        return 'penalty'
+
+    if dismissed:
+        return 'red_card'
+
+    return 'goal'
+
+
+def decode_event(element):
+    """Function that extracts the time and type of a single event
+
+    Parameters
+    ----------
+    element: str
+        string containing the information about the event
+
+    Returns
+    -------
+    (time, type): tuple
+        minute of the event (including any added time) and one of 'goal', 'penalty' or 'red_card'; None if the element does not describe an event
+
+    """
+
+    match = EVENT.search(element)
+
+    if match is None:
+        return None
+
+    _, dismissed, minute, added, penalty = match.groups()
+
+    return int(minute) + int(added or 0), event_type(dismissed, penalty)
+
+
+def decode_events(text):
+    """Function that decodes the whole event string of a player in a single pass; the sub events (which are seperated by commas in the HTML source) are found by scanning the string once with the
+    EVENT pattern
+
+    Parameters
+    ----------
+    text: str
+        all text of a scorer block, excluding the name of the player
+
+    Returns
+    -------
+    events: list
+        list of (time, type) tuples
+
+    """
+
+    return [(int(minute) + int(added or 0), event_type(dismissed, penalty))
+            for _, dismissed, minute, added, penalty in EVENT.findall(deduplicate(text.strip()))]
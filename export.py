@@ -0,0 +1,124 @@
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.fs
+from data.standings import season
+
+
+# the fixtures and events are written as two seperate datasets, each partitioned by league and season; i.e. every league season is stored in its own directory, so that a scan of one season never
+# touches the files of any other season
+
+PARTITIONING = ds.partitioning(pa.schema([('league', pa.string()), ('season', pa.string())]), flavor='hive')
+
+# note that the team and player names (as well as all other columns with few distinct values) are dictionary encoded; each name is then stored once per file, and the column itself only holds
+# small integer indices
+
+FIXTURES = pa.schema([
+    ('league', pa.string()),
+    ('season', pa.string()),
+    ('date', pa.string()),
+    ('home_team', pa.dictionary(pa.int32(), pa.string())),
+    ('away_team', pa.dictionary(pa.int32(), pa.string())),
+    ('home_score', pa.int16()),
+    ('away_score', pa.int16()),
+    ('result', pa.dictionary(pa.int8(), pa.string()))
+])
+
+EVENTS = pa.schema([
+    ('league', pa.string()),
+    ('season', pa.string()),
+    ('date', pa.string()),
+    ('home_team', pa.dictionary(pa.int32(), pa.string())),
+    ('away_team', pa.dictionary(pa.int32(), pa.string())),
+    ('player', pa.dictionary(pa.int32(), pa.string())),
+    ('team', pa.dictionary(pa.int32(), pa.string())),
+    ('minute', pa.int16()),
+    ('type', pa.dictionary(pa.int8(), pa.string())),
+    ('home', pa.bool_())
+])
+
+
+def to_tables(processed_data):
+    """Function that converts processed fixtures into one table of fixtures and one table of events
+
+    Parameters
+    ----------
+    processed_data: dict
+        dictionary of form {league_name: {i: Fixture}}, as returned by gather_data.process_data(); FixtureRecord objects may be used instead of Fixture objects
+
+    Returns
+    -------
+    (fixtures, events): tuple
+        pyarrow tables following the FIXTURES and EVENTS schemas
+
+    """
+
+    fixtures = {name: [] for name in FIXTURES.names}
+    events = {name: [] for name in EVENTS.names}
+
+    for league, data in processed_data.items():
+        for fixture in (data.values() if isinstance(data, dict) else data):
+
+            row = (league, season(fixture.date), fixture.date, fixture.home_team, fixture.away_team)
+
+            for name, value in zip(FIXTURES.names, row + (int(fixture.home_score), int(fixture.away_score), fixture.result)):
+                fixtures[name].append(value)
+
+            for time, event in sorted(fixture.time_line.items()):
+
+                team = fixture.home_team if event.home else fixture.away_team
+
+                for name, value in zip(EVENTS.names, row + (event.player, team, event.time, event.type, event.home)):
+                    events[name].append(value)
+
+    return pa.table(fixtures, schema=FIXTURES), pa.table(events, schema=EVENTS)
+
+
+def export(processed_data, directory, tag):
+    """Function that writes processed fixtures and their events to the partitioned Parquet datasets in the given directory. Every call writes one file per league season and dataset, named after the
+    tag; hence, exporting the same day again (with the date as tag) replaces the files of that day rather than duplicating them
+
+    Parameters
+    ----------
+    processed_data: dict
+        dictionary of form {league_name: {i: Fixture}}, as returned by gather_data.process_data()
+    directory: str
+        root directory of the datasets; the fixtures are written to directory/fixtures and the events to directory/events
+    tag: str
+        name of the files written, typically the date of the fixtures
+
+    Returns
+    -------
+    (fixtures, events): tuple
+        number of fixtures and events written
+
+    """
+
+    fixtures, events = to_tables(processed_data)
+
+    for name, table in (('fixtures', fixtures), ('events', events)):
+
+        if not table.num_rows:
+            continue
+
+        ds.write_dataset(table, '{}/{}'.format(directory, name), format='parquet', partitioning=PARTITIONING, basename_template='{}-{{i}}.parquet'.format(tag),
+                         existing_data_behavior='overwrite_or_ignore')
+
+    return fixtures.num_rows, events.num_rows
+
+
+def dataset(directory, name='fixtures'):
+    """Function that opens one of the exported datasets. The files are memory-mapped, nothing is read until the dataset is scanned, and only the partitions matching a filter are read, e.g.
+
+        dataset('export').to_table(filter=(ds.field('league') == 'Premier League') & (ds.field('season') == '2018/2019'))
+
+    Parameters
+    ----------
+    directory: str
+        root directory of the datasets, as passed to export()
+    name: str
+        either 'fixtures' or 'events'
+
+    """
+
+    return ds.dataset('{}/{}'.format(directory, name), format='parquet', partitioning=PARTITIONING, schema=FIXTURES if name == 'fixtures' else EVENTS,
+                      filesystem=pyarrow.fs.LocalFileSystem(use_mmap=True))
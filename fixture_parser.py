@@ -0,0 +1,177 @@
+import io
+from lxml import etree
+
+
+def has_class(name):
+    """Function that returns an XPath predicate matching elements that have the given class among their classes; this mirrors how BeautifulSoup matches a single class name"""
+
+    return "contains(concat(' ', normalize-space(@class), ' '), ' {} ')".format(name)
+
+
+# all XPath expressions are compiled once, when the module is imported. Note that classes given as a string with several class names are matched exactly, as BeautifulSoup does
+
+MATCH_BLOCK = etree.XPath('ancestor::div[{}][1]'.format(has_class('qa-match-block')))
+
+IS_FIXTURE = etree.XPath('boolean(self::article[{}])'.format(has_class('sp-c-fixture')))
+
+HOME_TEAM = etree.XPath('string((.//span[normalize-space(@class)="sp-c-fixture__team sp-c-fixture__team--home"])[1]//abbr)')
+
+AWAY_TEAM = etree.XPath('string((.//span[normalize-space(@class)="sp-c-fixture__team sp-c-fixture__team--away"])[1]//abbr)')
+
+HOME_SCORE = etree.XPath(
+    'string(.//span[normalize-space(@class)="sp-c-fixture__number sp-c-fixture__number--home sp-c-fixture__number--ft"])')
+
+AWAY_SCORE = etree.XPath(
+    'string(.//span[normalize-space(@class)="sp-c-fixture__number sp-c-fixture__number--away sp-c-fixture__number--ft"])')
+
+SCORER_BLOCKS = etree.XPath('(.//aside[{}])[1]//li'.format(has_class('sp-c-fixture__aside')))
+
+SCORER_LISTS = etree.XPath('(.//aside[{}])[1]//ul'.format(has_class('sp-c-fixture__aside')))
+
+SCORER_LIST = etree.XPath('ancestor::ul[1]')
+
+SIDE_MARKER = etree.XPath("ancestor::*[ancestor::aside][contains(@class, '--home') or contains(@class, '--away')][1]/@class")
+
+PLAYER_NAME = etree.XPath('string((.//span)[1])')
+
+TEXT = etree.XPath('string()')
+
+
+def fixture_record(element):
+    """Function that reduces the lxml element of a fixture to a plain record; the record is identical to the one produced by gather_data.fixture_record() for the BeautifulSoup tag of the same fixture
+
+    Parameters
+    ----------
+    element: lxml.etree.Element
+        'article' element containing the data for an individual fixture
+
+    """
+
+    record = {
+        'home_team': HOME_TEAM(element),
+        'home_score': HOME_SCORE(element),
+        'away_team': AWAY_TEAM(element),
+        'away_score': AWAY_SCORE(element),
+        'scorers': []
+    }
+
+    # the text of each scorer block is retrieved in one go, and the name of the player (i.e. the text of the first span) is then cut off
+
+    lists = SCORER_LISTS(element)
+
+    for block in SCORER_BLOCKS(element):
+        player_name, text = PLAYER_NAME(block), TEXT(block)
+
+        record['scorers'].append((player_name, text[text.find(player_name) + len(player_name):], is_home_block(block, lists)))
+
+    return record
+
+
+def is_home_block(block, lists):
+    """Function that determines whether a scorer block belongs to the home team, following the same rules as gather_data.is_home_block()
+
+    Parameters
+    ----------
+    block: lxml.etree.Element
+        'li' element of the scorer block
+    lists: list
+        all 'ul' elements within the aside of the fixture
+
+    """
+
+    marker = SIDE_MARKER(block)
+
+    if marker:
+        return '--home' in marker[0]
+
+    parent = SCORER_LIST(block)
+
+    return not lists or (bool(parent) and parent[0] is lists[0])
+
+
+def iter_fixtures(source, interest_leagues=None):
+    """Generator that streams through the HTML source of a page and yields each fixture as soon as it has been parsed. Note that only the 'h3' and 'article' elements are inspected, and each fixture is
+    freed once it has been processed, so that the whole tree is never held in memory
+
+    Parameters
+    ----------
+    source: str or bytes
+        HTML source of a page or of a single league block
+    interest_leagues: iterable
+        uppercase names of the leagues that should be kept; all leagues are kept if None
+
+    Yields
+    ------
+    (league_name, record): tuple
+        name of the league the fixture belongs to and the fixture record; note that (league_name, None) is yielded when the block of a league starts, so that leagues without fixtures are not lost
+
+    """
+
+    if isinstance(source, str):
+        source = source.encode('utf-8')
+
+    block, league = None, None
+
+    for _, element in etree.iterparse(io.BytesIO(source), events=('end',), tag=('h3', 'article'), html=True, encoding='utf-8'):
+
+        # the title of a league is the first 'h3' element in its match block
+
+        if element.tag == 'h3':
+            parent = MATCH_BLOCK(element)
+
+            if parent and parent[0] is not block:
+                block, league = parent[0], TEXT(element)
+
+                if interest_leagues is None or league.upper() in interest_leagues:
+                    yield league, None
+
+            continue
+
+        if not IS_FIXTURE(element):
+            continue
+
+        parent = MATCH_BLOCK(element)
+
+        if block is not None and parent and parent[0] is block:
+            if interest_leagues is None or league.upper() in interest_leagues:
+                yield league, fixture_record(element)
+
+        # the fixture is no longer needed; hence, it is cleared along with any siblings that have already been processed
+
+        element.clear()
+
+        while element.getprevious() is not None:
+            del element.getparent()[0]
+
+
+def parse_leagues(source, interest_leagues=None):
+    """Function that groups the fixtures of a page by league
+
+    Parameters
+    ----------
+    source: str or bytes
+        HTML source of the page
+    interest_leagues: iterable
+        uppercase names of the leagues that should be kept; all leagues are kept if None
+
+    Returns
+    -------
+    league_dict: dict
+        dictionary of form {league_name: [record, ...]}; None if the page contains no match blocks at all
+
+    """
+
+    league_dict = {}
+
+    # note that if two blocks share the same title, the latter block replaces the former, as is the case for gather_data.find_leagues()
+
+    for league, record in iter_fixtures(source, interest_leagues):
+        if record is None:
+            league_dict[league] = []
+        else:
+            league_dict[league].append(record)
+
+    if not league_dict and b'qa-match-block' not in (source.encode('utf-8') if isinstance(source, str) else source):
+        return None
+
+    return league_dict
@@ -0,0 +1,115 @@
+import datetime
+from bisect import bisect_left, bisect_right
+
+
+def ordinal(date):
+    """Function that converts a date into its proleptic Gregorian ordinal (see datetime.date.toordinal()), so that dates can be compared and bisected as integers
+
+    Parameters
+    ----------
+    date: str or datetime.date
+        date of form 'YYYY-MM-DD', or a date object
+
+    """
+
+    if isinstance(date, str):
+        date = datetime.date.fromisoformat(date)
+
+    return date.toordinal()
+
+
+class FixtureStore():
+    """Date-indexed store of the fixtures of a single league. The match days are held as a sorted list of ordinal dates, with the fixtures of each match day at the same position of a second list;
+    hence, finding the fixtures on a date, the next or previous match day, or all match days within a window, is a single bisection of the ordinals rather than a scan over the fixtures. Note that
+    the store covers every season of the league, so that the next or previous match day may well be in another season
+
+    Parameters
+    ----------
+    fixtures: dict
+        dictionary of form {date: {i: Fixture}}, i.e. the fixtures attribute of a League object
+
+    Attributes
+    ----------
+    self.dates: list
+        sorted match days, as 'YYYY-MM-DD' strings
+    self.ordinals: list
+        ordinals of self.dates
+    self.fixtures: list
+        lists of Fixture objects, one for each entry of self.dates
+
+    """
+
+    def __init__(self, fixtures=None):
+
+        self.dates = []
+        self.ordinals = []
+        self.fixtures = []
+
+        # match days without any fixtures are left out, so that the next and previous match days always have fixtures to display
+
+        for date, day in sorted((str(date), day) for date, day in (fixtures or {}).items() if day):
+
+            self.dates.append(date)
+            self.ordinals.append(ordinal(date))
+            self.fixtures.append(list(day.values()) if isinstance(day, dict) else list(day))
+
+    def __len__(self):
+        return len(self.dates)
+
+    def __contains__(self, date):
+        return self.on(date) is not None
+
+    def on(self, date):
+        """Method that returns the fixtures on a date, or None if there are no fixtures on that date
+
+        Parameters
+        ----------
+        date: str or datetime.date
+            date of form 'YYYY-MM-DD', or a date object
+
+        """
+
+        key = ordinal(date)
+
+        i = bisect_left(self.ordinals, key)
+
+        if i < len(self.ordinals) and self.ordinals[i] == key:
+            return self.fixtures[i]
+
+        return None
+
+    def next(self, date):
+        """Method that returns the first match day strictly after the given date as a 'YYYY-MM-DD' string, or None if there is no later match day"""
+
+        i = bisect_right(self.ordinals, ordinal(date))
+
+        return self.dates[i] if i < len(self.dates) else None
+
+    def previous(self, date):
+        """Method that returns the last match day strictly before the given date as a 'YYYY-MM-DD' string, or None if there is no earlier match day"""
+
+        i = bisect_left(self.ordinals, ordinal(date))
+
+        return self.dates[i - 1] if i else None
+
+    def window(self, start, end):
+        """Method that returns all match days within a window of dates
+
+        Parameters
+        ----------
+        start: str or datetime.date
+            first date of the window
+        end: str or datetime.date
+            last date of the window; note that the window includes both the first and the last date
+
+        Returns
+        -------
+        days: list
+            list of (date, fixtures) tuples, sorted by date
+
+        """
+
+        i = bisect_left(self.ordinals, ordinal(start))
+        j = bisect_right(self.ordinals, ordinal(end))
+
+        return list(zip(self.dates[i:j], self.fixtures[i:j]))
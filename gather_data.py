@@ -1,4 +1,5 @@
 import requests
+import requests.adapters
 from bs4 import BeautifulSoup
 import pymysql
 import datetime
@@ -7,6 +8,15 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 import re
+import json
+import time
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from itertools import repeat
+from data.driver_pool import DriverPool
+from data import fixture_parser
+from data.event_decoder import decode_events, decode_event
 
 
 class Typed():
@@ -111,70 +121,115 @@ class Fixture():
 
         Parameters
         ----------
-        data: list
-            list of BeautifulSoup tag items containing the data for an individual fixture
+        data: BeautifulSoup tag or dict
+            BeautifulSoup tag containing the data for an individual fixture, or a fixture record as returned by fixture_record() or fixture_parser.fixture_record()
 
         """
 
+        # the raw fixture is first reduced to a plain record; note that records produced by the lxml backend are passed in directly
+
+        if not isinstance(data, dict):
+            data = fixture_record(data)
+
         # first, the home team and away team's are determined, along with the home and away scores
 
-        self.home_team = data.find(
-            'span', {'class': 'sp-c-fixture__team sp-c-fixture__team--home'}).find('abbr').get_text()
+        self.home_team = data['home_team']
+        self.home_score = data['home_score']
 
-        self.home_score = data.find(
-            'span', {'class': "sp-c-fixture__number sp-c-fixture__number--home sp-c-fixture__number--ft"}).get_text()
+        self.away_team = data['away_team']
+        self.away_score = data['away_score']
 
-        self.away_team = data.find(
-            'span', {'class': 'sp-c-fixture__team sp-c-fixture__team--away'}).find('abbr').get_text()
+        # the events data (i.e. goals, red cards etc) is split into seperate blocks, one for each player
 
-        self.away_score = data.find(
-            'span', {'class': "sp-c-fixture__number sp-c-fixture__number--away sp-c-fixture__number--ft"}).get_text()
+        for player_name, event, home in data['scorers']:
 
-        # the events data (i.e. goals, red cards etc) is then found
+            # the event string is decoded into the individual sub events in a single pass. Each sub event is then transformed into an Event instance, which is stored on the timeline dictionary. Note
+            # the actual storage is done in the Event class itself
 
-        events = data.find(
-            'aside', {'class': 'sp-c-fixture__aside'}).find_all('li')
+            for element in decode_events(event):
+                Event(self, player_name, element, home)
 
-        # The events are split into seperate blocks, one for each player
+    def __str__(self):
 
-        for block in events:
-            player_name, *details = block.find_all('span')
+        string = '{0.date}: {0.home_team} vs {0.away_team} --> {0.home_score}:{0.away_score}\n'.format(
+            self)
 
-            # each block consists of a series of sub events associated with each player; these are cleaned and sorted, then placed in the timeline
+        for time, event in sorted(self.time_line.items()):
+            string += (str(event) + '\n')
 
-            event = ''
+        return string
 
-            # the event item is first turned from a list of BeautifulSoup Tag items to a single string; note that, somewhat inconveniently, one tag exists for each character
 
-            for detail in details:
-                event += detail.get_text()
+def fixture_record(data):
+    """Function that reduces the BeautifulSoup tag of a fixture to a plain record; note that the record is a simple dictionary, and can hence be pickled and passed between processes
 
-            # each sub event is seperated by a comma
+    Parameters
+    ----------
+    data: BeautifulSoup tag
+        tag containing the data for an individual fixture
 
-            for element in event.split(','):
+    Returns
+    -------
+    record: dict
+        dictionary of form {'home_team', 'home_score', 'away_team', 'away_score', 'scorers'}, where 'scorers' is a list of (player_name, event_string, home) tuples
 
-                # note that the data from the HTML source is duplicated every time; hence, the string is first split in half and stripped of any trailing whitespace
+    """
 
-                element = element[:len(element)//2 + 1].replace('(', '').strip()
+    record = {
+        'home_team': data.find('span', {'class': 'sp-c-fixture__team sp-c-fixture__team--home'}).find('abbr').get_text(),
+        'home_score': data.find('span', {'class': "sp-c-fixture__number sp-c-fixture__number--home sp-c-fixture__number--ft"}).get_text(),
+        'away_team': data.find('span', {'class': 'sp-c-fixture__team sp-c-fixture__team--away'}).find('abbr').get_text(),
+        'away_score': data.find('span', {'class': "sp-c-fixture__number sp-c-fixture__number--away sp-c-fixture__number--ft"}).get_text(),
+        'scorers': []
+    }
 
-                # if the element is not an empty string (which occasionally occur), it is transformed into an Event instance, which is stored on the timeline dictionary. Note the actual storage is done in the
-                # Event class itself, since the time data needs to be extracted first
+    # The events are split into seperate blocks, one for each player
 
-                if element:
-                    element = Event(self, player_name.get_text(), element)
+    aside = data.find('aside', {'class': 'sp-c-fixture__aside'})
+    lists = aside.find_all('ul')
 
-    def __str__(self):
+    for block in aside.find_all('li'):
+        player_name = block.find('span').get_text()
 
-        string = '{0.date}: {0.home_team} vs {0.away_team} --> {0.home_score}:{0.away_score}\n'.format(
-            self)
+        # somewhat inconveniently, one tag exists for each character of the event string; hence, the text of the whole block is retrieved in one go and the name of the player is then cut off
 
-        for time, event in sorted(self.time_line.items()):
-            string += (str(event) + '\n')
+        text = block.get_text()
 
-        return string
+        record['scorers'].append((player_name, text[text.find(player_name) + len(player_name):], is_home_block(block, aside, lists)))
 
+    return record
 
-@typeassert(player=(str, False), fixture=(Fixture, False))
+
+def is_home_block(block, aside, lists):
+    """Function that determines whether a scorer block belongs to the home team. The closest parent with a '--home' or '--away' modifier class decides; failing that, the block is assumed to belong
+    to the home team if it is in the first list of the aside, since the home scorers are listed before the away scorers
+
+    Parameters
+    ----------
+    block: BeautifulSoup tag
+        'li' tag of the scorer block
+    aside: BeautifulSoup tag
+        'aside' tag containing all scorer blocks of the fixture
+    lists: list
+        all 'ul' tags within the aside
+
+    """
+
+    for parent in block.parents:
+        if parent is aside:
+            break
+
+        classes = ' '.join(parent.get('class', []))
+
+        if '--home' in classes:
+            return True
+        if '--away' in classes:
+            return False
+
+    return not lists or block.find_parent('ul') is lists[0]
+
+
+@typeassert(player=(str, False), fixture=(Fixture, False), home=(bool, False))
 class Event():
     """Class defining an event (goal, penalty, or red card)
 
@@ -184,15 +239,18 @@ class Event():
         the fixture in which the event occured
     player: str
         name of player associated with event
-    element: str
-        string containing the raw information about the event (time of event and type of event)
+    element: str or tuple
+        string containing the raw information about the event (time of event and type of event), or the (time, type) tuple already decoded by event_decoder.decode_events()
+    home: boolean
+        True if the player plays for the home team, False otherwise
 
     """
 
-    def __init__(self, fixture, player, element):
+    def __init__(self, fixture, player, element, home=True):
 
         self.player = player
         self.fixture = fixture
+        self.home = home
 
         # the raw data is then processed
 
@@ -203,44 +261,316 @@ class Event():
         fixture.time_line[self.time] = self
 
     def process_element(self, element):
-        """Method to process the raw data passed down the the object
+        """Method to process the raw data passed down the the object; note that the actual decoding is done by event_decoder.decode_event(), which takes events that occur in overtime
+        (i.e. of form str(time' + overtime)) into account
 
         Parameters
         ----------
-        element: str
-            string containing the information about the event
+        element: str or tuple
+            string containing the information about the event, or the already decoded (time, type) tuple
         """
 
-        # first, the type of event is determined by searching the 'element' string for certain keywords. Note that the .find() function returns a -1 if the substring was not found within the parent string
+        if isinstance(element, tuple):
+            return element
+
+        event = decode_event(element)
+
+        if event is None:
+            raise ValueError('Unable to decode event: {}'.format(element))
+
+        return event
+
+    def __str__(self):
+        return 'Time: {0.time} Player: {0.player} Type: {0.type}'.format(self)
+
+
+CHROMEDRIVER_PATH = r'C:\Users\Six\Downloads\chromedriver_win32\chromedriver.exe'
+
+BASE_URL = 'https://www.bbc.co.uk/sport/football/scores-fixtures/{}'
+
+DEFAULT_LEAGUES = ['PREMIER LEAGUE', 'GERMAN BUNDESLIGA',
+                   'SPANISH LA LIGA', 'CHAMPIONS LEAGUE', 'ITALIAN SERIE A']
+
+# the module wide driver pool; drivers are recycled after POOL_MAX_PAGES pages
+
+POOL_SIZE = 3
+POOL_MAX_PAGES = 50
+
+_pool = None
+_pool_lock = threading.Lock()
+
+_stats_lock = threading.Lock()
+
+# patterns used to find the JSON payloads embedded in the initial HTTP response
+
+INITIAL_DATA = re.compile(r'window\.__INITIAL_DATA__\s*=\s*("(?:[^"\\]|\\.)*"|\{.*?\})\s*;\s*</script>', re.S)
+JSON_SCRIPT = re.compile(r'<script[^>]*type="application/(?:ld\+)?json"[^>]*>(.*?)</script>', re.S)
+
+
+def create_driver():
+    """Function used to start a new Chrome driver instance"""
+
+    return webdriver.Chrome(executable_path=CHROMEDRIVER_PATH)
+
+
+def get_pool():
+    """Function that returns the module wide DriverPool, which is created on first use"""
+
+    global _pool
+
+    with _pool_lock:
+        if _pool is None or _pool.closed:
+            _pool = DriverPool(create_driver, size=POOL_SIZE, max_pages=POOL_MAX_PAGES)
+
+    return _pool
+
+
+def shutdown_pool():
+    """Function used to close all drivers in the module wide pool; note that this is also done automatically when the interpreter exits"""
+
+    global _pool
+
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown()
+            _pool = None
+
+
+def render_page(driver, url, timeout=30):
+    """Function that loads a page with the given driver, triggers the JavaScript that exposes the scorers and returns the resulting HTML source. Note that a failure to load the match blocks is NOT
+    caught here, so that the caller can decide whether or not the date should be retried
+
+    Parameters
+    ----------
+    driver: webdriver.Chrome object
+        driver used to render the page
+    url: str
+        url of the page
+    timeout: int
+        number of seconds to wait for the match blocks to appear
+
+    Returns
+    -------
+    page_source: str
+        HTML source of the rendered page
+
+    """
+
+    driver.get(url)
+
+    driver.find_element_by_css_selector('button.qa-show-scorers-button').click()
+
+    WebDriverWait(driver, timeout).until(
+        EC.presence_of_element_located((By.CLASS_NAME, 'qa-match-block')))
+
+    return driver.page_source
+
+
+def parse_leagues(page_source, interest_leagues, backend='bs4'):
+    """Function that splits the HTML source of a page into the individual leagues
+
+    Parameters
+    ----------
+    page_source: str
+        HTML source of the rendered page
+    interest_leagues: iterable
+        uppercase names of the leagues that should be kept
+    backend: str
+        either 'bs4', in which case the full page is parsed by BeautifulSoup, or 'lxml', in which case the fixtures are streamed out of the page by the fixture_parser module
+
+    Returns
+    -------
+    league_dict: dict
+        dictionary of form {league_name: BeautifulSoup tag} for the 'bs4' backend, or {league_name: [record, ...]} for the 'lxml' backend
+
+    """
+
+    if backend == 'lxml':
+        return fixture_parser.parse_leagues(page_source, interest_leagues) or {}
+
+    return find_leagues(BeautifulSoup(page_source, 'lxml'), interest_leagues)
+
+
+def find_leagues(data, interest_leagues):
+    """Function that finds the blocks of the specified leagues in an already parsed page
+
+    Parameters
+    ----------
+    data: BeautifulSoup object
+        parsed HTML source of the page
+    interest_leagues: iterable
+        uppercase names of the leagues that should be kept
+
+    """
+
+    leagues = data.find_all('div', {'class': 'qa-match-block'})
+
+    # the data for each individual leauge is then found; note that each leagues has its own 'div' tag, which containts the date
+
+    league_dict = {}
+
+    # only the specified leagues are saved; note that the league_dict stores the tags containing each individual league. Note also that the title of the league is automatically capitalized so to avoid error
+    # due to lowercase/uppercase mixups
+
+    for league in leagues:
+        league_name = league.find('h3').get_text()
+
+        if league_name.upper() in interest_leagues:
+            league_dict[league_name] = league
+
+    return league_dict
+
+
+def has_scorers(league_dict):
+    """Function that checks whether the scorers are present for every fixture of the given leagues. Note that a fixture only needs scorers if at least one goal was scored; red cards cannot be
+    checked for and hence a page with missing red cards but complete goals is (wrongly) accepted
+
+    Parameters
+    ----------
+    league_dict: dict
+        dictionary of form {league_name: BeautifulSoup tag} or {league_name: [record, ...]}
+
+    """
+
+    for league in league_dict.values():
+
+        # fixture records already contain the scores and scorers, and can hence be checked directly
+
+        if isinstance(league, list):
+            for record in league:
+                try:
+                    goals = int(record['home_score']) + int(record['away_score'])
+                except ValueError:
+                    return False
+
+                if goals and not record['scorers']:
+                    return False
+
+            continue
+
+        for fixture in league.find_all('article', {'class': 'sp-c-fixture'}):
+
+            scores = fixture.find_all('span', {'class': 'sp-c-fixture__number--ft'})
+
+            if len(scores) != 2:
+                return False
+
+            try:
+                goals = sum(int(score.get_text()) for score in scores)
+            except ValueError:
+                return False
+
+            aside = fixture.find('aside', {'class': 'sp-c-fixture__aside'})
+
+            if goals and (aside is None or aside.find('li') is None):
+                return False
+
+    return True
+
+
+def embedded_documents(html):
+    """Generator that yields every HTML fragment containing match blocks that is embedded in a JSON payload of the page, i.e. in the 'window.__INITIAL_DATA__' assignment or in a JSON script tag
+
+    Parameters
+    ----------
+    html: str
+        raw HTML source of the page
+
+    """
+
+    payloads = [match.group(1) for match in INITIAL_DATA.finditer(html)]
+    payloads += [match.group(1) for match in JSON_SCRIPT.finditer(html)]
+
+    for payload in payloads:
+
+        # note that the payload is sometimes a JSON encoded string that itself contains JSON; hence, the payload is decoded until it is no longer a string
+
+        try:
+            data = json.loads(payload)
+
+            while isinstance(data, str) and data.lstrip()[:1] in ('{', '['):
+                data = json.loads(data)
+
+        except ValueError:
+            continue
+
+        stack = [data]
+
+        while stack:
+            item = stack.pop()
+
+            if isinstance(item, dict):
+                stack.extend(item.values())
+            elif isinstance(item, list):
+                stack.extend(item)
+            elif isinstance(item, str) and 'qa-match-block' in item:
+                yield item
+
+
+def extract_static(html, interest_leagues, backend='bs4'):
+    """Function that attempts to extract the league data from the initial HTTP response, without rendering the page. The HTML itself is tried first, then any HTML embedded in JSON payloads
+
+    Parameters
+    ----------
+    html: str
+        raw HTML source of the page
+    interest_leagues: iterable
+        uppercase names of the leagues that should be kept
+    backend: str
+        parser backend, see parse_leagues()
+
+    Returns
+    -------
+    (path, document, league_dict): tuple
+        path is one of 'static' or 'embedded' and document is the HTML the leagues were found in; league_dict is None if the scorers could not be found, in which case the page needs to be rendered
+        in the browser
+
+    """
+
+    documents = [('static', html)] + [('embedded', document) for document in embedded_documents(html)]
+
+    for path, document in documents:
+
+        # pages without any match blocks have most likely not been rendered server side, and are hence not trusted
+
+        if backend == 'lxml':
+            league_dict = fixture_parser.parse_leagues(document, interest_leagues)
+
+            if league_dict is None:
+                continue
 
-        if element.find('pen') is not -1:
-            self.type = 'penalty'
-        elif element.find('Dismissed') is not -1:
-            self.type = 'red_card'
-            element = element.replace('Dismissed at ', '')
         else:
-            self.type = 'goal'
+            data = BeautifulSoup(document, 'lxml')
 
-        # the time then needs to be determined
+            if data.find('div', {'class': 'qa-match-block'}) is None:
+                continue
 
-        # note that events that occur in overtime are of form str(time' + overtime) and need to be taken into account
+            league_dict = find_leagues(data, interest_leagues)
 
-        added_time = element[element.find('+') + 1]
+        if has_scorers(league_dict):
+            return path, document, league_dict
 
-        self.time = int(element.split('\'')[0])
+    return None, None, None
 
-        # if the event occured in overtime, the overtime is added to the event time
 
-        if added_time:
-            self.time += int(added_time)
+def validators(response):
+    """Function that returns the (ETag, Last-Modified) headers of a response, which are used to revalidate cached pages; both are None if there is no response"""
 
-        return (self.time, self.type)
+    if response is None:
+        return None, None
 
-    def __str__(self):
-        return 'Time: {0.time} Player: {0.player} Type: {0.type}'.format(self)
+    return response.headers.get('ETag'), response.headers.get('Last-Modified')
 
 
-def get_data(date=None, interest_leagues=['PREMIER LEAGUE', 'GERMAN BUNDESLIGA', 'SPANISH LA LIGA', 'CHAMPIONS LEAGUE', 'ITALIAN SERIE A']):
+def record_path(stats, path):
+    """Function that records which path was used to obtain the data for a date"""
+
+    if stats is not None:
+        with _stats_lock:
+            stats[path] += 1
+
+
+def get_data(date=None, interest_leagues=DEFAULT_LEAGUES, driver=None, http=None, pool=None, stats=None, cache=None, backend='bs4'):
     """Function used to retrieve all the data for a given day; problematically, the data on scorers can only be retreived by interacting with the JavaScript on the page. This is overcome using the Selenium
     module with the Chrome driver. Note that once Selenium has been used to Trigger the Javascript on the page, the HTML content is passed down to BeautifulSoup, which is then used to handle the rest of the data processing
 
@@ -250,6 +580,18 @@ def get_data(date=None, interest_leagues=['PREMIER LEAGUE', 'GERMAN BUNDESLIGA',
         string of form 'YYYY-MM-DD' specifiying day
     interest_leagues: iterable
         indicates what leagues the data should be gathered for
+    driver: webdriver.Chrome object
+        optional driver used to render the page; if none is given, a driver is borrowed from the pool
+    http: requests.Session object
+        optional HTTP session used for the initial request, which allows several threads to share one connection pool
+    pool: DriverPool object
+        pool the driver is borrowed from; defaults to the module wide pool returned by get_pool()
+    stats: collections.Counter object
+        optional counter in which the path used to obtain the data ('cache', 'static', 'embedded' or 'browser') is recorded
+    cache: PageCache object
+        optional cache of page sources; pages fetched at least cache.immutable_after days after their date are served without any network access, while all other pages are revalidated with a conditional request
+    backend: str
+        parser backend, see parse_leagues(); note that the league data returned has to be passed to process_data() with the same backend
 
     """
 
@@ -258,16 +600,39 @@ def get_data(date=None, interest_leagues=['PREMIER LEAGUE', 'GERMAN BUNDESLIGA',
     # if no date is given, then the program assumes that it should look for the data from the current dat
 
     if date is None:
-        date = datetime.date.today()
+        date = str(datetime.date.today())
 
     # the url is first defined
 
-    url = 'https://www.bbc.co.uk/sport/football/scores-fixtures/{}'.format(date)
+    url = BASE_URL.format(date)
+
+    # if the page has been cached long enough after its date to never change again, the cached page is used directly
+
+    cached, headers = None, {}
+
+    if cache is not None:
+        cached = cache.get(url)
+
+        if cached is not None:
+            if cache.is_immutable(url, date):
+                record_path(stats, 'cache')
+                return date, parse_leagues(cached, interest_leagues, backend)
+
+            headers = cache.validators(url)
 
     # the request for the data is then made
 
+    response = None
+
     try:
-        response = requests.get(url)
+        response = (http or requests).get(url, headers=headers)
+
+        # note that the server answers with '304 Not Modified' if the cached page is still up to date
+
+        if cached is not None and response.status_code == 304:
+            cache.touch(url, *validators(response))
+            record_path(stats, 'cache')
+            return date, parse_leagues(cached, interest_leagues, backend)
 
         if not response:
             print('HTTP Error: Status Code --> {}'.format(response.status_code))
@@ -275,44 +640,193 @@ def get_data(date=None, interest_leagues=['PREMIER LEAGUE', 'GERMAN BUNDESLIGA',
     except Exception as err:
         print('Something went wrong: ', err)
 
+    # the scorers are first looked for in the initial HTTP response, either in the HTML itself or in any JSON payload embedded in the page. If they are found, the browser is not needed at all
+
+    if response:
+        path, document, league_dict = extract_static(response.text, interest_leagues, backend)
+
+        if league_dict is not None:
+            if cache is not None:
+                cache.put(url, document, *validators(response))
+
+            record_path(stats, path)
+            return date, league_dict
+
     # problematically, the data on scorers can only be retreived by interacting with the JavaScript; this is done via Selenium
 
-    driver = webdriver.Chrome(
-        executable_path=r'C:\Users\Six\Downloads\chromedriver_win32\chromedriver.exe')
+    # note that drivers are borrowed from a long-lived pool rather than started for every call, since starting Chrome takes longer than rendering the page itself
 
-    driver.get(url)
+    if driver is None:
+        with (pool or get_pool()).borrow() as driver:
+            page_source = render_page(driver, url)
+    else:
+        page_source = render_page(driver, url)
 
-    driver.find_element_by_css_selector('button.qa-show-scorers-button').click()
+    if cache is not None:
+        cache.put(url, page_source, *validators(response))
+
+    record_path(stats, 'browser')
+
+    return date, parse_leagues(page_source, interest_leagues, backend)
+
+
+def date_range(start, end):
+    """Generator that yields every date between start and end (inclusive) as a string of form 'YYYY-MM-DD'
+
+    Parameters
+    ----------
+    start: str or datetime.date
+        first date of the range
+    end: str or datetime.date
+        last date of the range
+
+    """
+
+    start, end = (datetime.date(*map(int, str(day).split('-'))) for day in (start, end))
+
+    for i in range((end - start).days + 1):
+        yield str(start + datetime.timedelta(days=i))
+
+
+def get_data_range(start, end, interest_leagues=DEFAULT_LEAGUES, workers=3, retries=3, backoff=2.0, stats=None, cache=None, backend='bs4'):
+    """Generator used to retrieve the data for a whole range of dates. The dates are fetched concurrently by a bounded pool of worker threads; the workers borrow their Chrome drivers from a DriverPool
+    of the same size, so drivers stay alive across dates, and all workers share one HTTP session for the initial requests. Note that results are yielded as soon as each date finishes, and hence NOT necessarily in date order
+
+    Parameters
+    ----------
+    start: str or datetime.date
+        first date of the range
+    end: str or datetime.date
+        last date of the range
+    interest_leagues: iterable
+        indicates what leagues the data should be gathered for
+    workers: int
+        maximum number of dates fetched at the same time (and hence the maximum number of open browsers)
+    retries: int
+        number of times a failed date is retried before it is given up on
+    backoff: float
+        number of seconds to wait before the first retry; the wait is doubled after every failed attempt
+    stats: collections.Counter object
+        optional counter in which the number of dates that took each path is recorded; a summary is printed once the run is done
+    cache: PageCache object
+        optional cache of page sources, see get_data()
+    backend: str
+        parser backend, see parse_leagues()
+
+    Yields
+    ------
+    (date, league_dict): tuple
+        same output as get_data(); if a date could not be retrieved after all retries, an empty league_dict is yielded
+
+    """
+
+    if stats is None:
+        stats = Counter()
+
+    # the HTTP session is shared between the workers; the connection pool is sized so that no worker has to wait for a connection
+
+    http = requests.Session()
+    http.mount('https://', requests.adapters.HTTPAdapter(pool_connections=workers, pool_maxsize=workers))
+
+    # the drivers are kept in a pool of the same size as the number of workers, so that each worker always finds a driver
+
+    pool = DriverPool(create_driver, size=workers, max_pages=POOL_MAX_PAGES)
+
+    def fetch(date):
+
+        for attempt in range(retries + 1):
+
+            # note that a driver that raised an exception is discarded by the pool, so a fresh driver is used on the next attempt
+
+            try:
+                return get_data(date, interest_leagues, http=http, pool=pool, stats=stats, cache=cache, backend=backend)
+
+            except Exception as err:
+
+                if attempt == retries:
+                    print('Giving up on {}: {}'.format(date, err))
+                    return date, {}
+
+                print('Retrying {} (attempt {}): {}'.format(date, attempt + 1, err))
+                time.sleep(backoff * 2 ** attempt)
 
     try:
-        element = WebDriverWait(driver, 30).until(
-            EC.presence_of_element_located((By.CLASS_NAME, 'qa-match-block')))
-    except Exception as err:
-        print(err)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(fetch, date) for date in date_range(start, end)]
 
-    data = BeautifulSoup(driver.page_source, 'lxml')
+            # if the caller stops iterating early, any dates that have not been started yet are cancelled
 
-    driver.quit()
+            try:
+                for future in as_completed(futures):
+                    yield future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
 
-    leagues = data.find_all('div', {'class': 'qa-match-block'})
+    finally:
+        pool.shutdown()
 
-    # the data for each individual leauge is then found; note that each leagues has its own 'div' tag, which containts the date
+        if cache is not None:
+            cache.save()
 
-    league_dict = {}
+        print('Dates per path: ' + ', '.join('{} --> {}'.format(path, stats[path]) for path in ('cache', 'static', 'embedded', 'browser')))
+        http.close()
 
-    # only the specified leagues are saved; note that the league_dict stores the tags containing each individual league. Note also that the title of the league is automatically capitalized so to avoid error
-    # due to lowercase/uppercase mixups
 
-    for league in leagues:
-        league_name = league.find('h3').get_text()
+def replay(start, end, cache, interest_leagues=DEFAULT_LEAGUES, backend='bs4'):
+    """Generator that yields the data for a range of dates purely from the page cache, without any network access; dates that have not been cached are skipped. This allows the data to be reprocessed
+    without scraping it again
 
-        if league_name.upper() in interest_leagues:
-            league_dict[league_name] = league
+    Parameters
+    ----------
+    start: str or datetime.date
+        first date of the range
+    end: str or datetime.date
+        last date of the range
+    cache: PageCache object
+        cache the pages are read from
+    interest_leagues: iterable
+        indicates what leagues the data should be gathered for
+    backend: str
+        parser backend, see parse_leagues()
 
-    return date, league_dict
+    Yields
+    ------
+    (date, league_dict): tuple
+        same output as get_data()
 
+    """
 
-def process_data(date, league, data, parsed_data):
+    interest_leagues = [league.upper() for league in interest_leagues]
+
+    for date, page_source in cached_pages(start, end, cache):
+        yield date, parse_leagues(page_source, interest_leagues, backend)
+
+
+def cached_pages(start, end, cache):
+    """Generator that yields the (date, page_source) of every cached date within a range; dates that have not been cached are skipped
+
+    Parameters
+    ----------
+    start: str or datetime.date
+        first date of the range
+    end: str or datetime.date
+        last date of the range
+    cache: PageCache object
+        cache the pages are read from
+
+    """
+
+    for date in date_range(start, end):
+        page_source = cache.get(BASE_URL.format(date))
+
+        if page_source is not None:
+            yield date, page_source
+
+    cache.save()
+
+
+def process_data(date, league, data, parsed_data, backend='bs4'):
     """Function that processed the data from a particular league and converts it to a dictionary of Fixture objects. Note that the Fixture objects itself sorts through the data, not the function.
 
     Parameters
@@ -321,10 +835,13 @@ def process_data(date, league, data, parsed_data):
         string of form 'YYYY-MM-DD' giving date
     league: str
         name of league
-    data: BeautifulSoup tag object
-        tag object containing all fixtures for that particular day
+    data: BeautifulSoup tag object, list or str
+        for the 'bs4' backend, tag object containing all fixtures for that particular day. For the 'lxml' backend, either the list of fixture records returned by get_data(backend='lxml'), or the HTML
+        source of the league block (or of the whole page), from which the fixtures of the league are streamed
     parsed_data: dict
         dictionary to which the cleaned data is added to. This is then also returned by the function and is then passed down to the function again with the next league
+    backend: str
+        parser backend, either 'bs4' or 'lxml'; both backends produce identical Fixture objects
 
     Attributes
     ----------
@@ -340,11 +857,18 @@ def process_data(date, league, data, parsed_data):
 
     # individual fixtures are stored in an unordered list, and each list item corresponds to one fixture
 
-    fixtures = data.find_all('article', {'class': 'sp-c-fixture'})
+    if backend == 'lxml':
+        if isinstance(data, (str, bytes)):
+            data = (record for name, record in fixture_parser.iter_fixtures(data, [league.upper()]) if record is not None)
+
+        fixtures = list(data)
+
+    else:
+        fixtures = data.find_all('article', {'class': 'sp-c-fixture'})
 
     processed_data = {}
 
-    # all the individual fixture/list items are converted into Fixture Objects; note that the fixture object takes the BeautifulSoup tag as an input and then processes the data
+    # all the individual fixture/list items are converted into Fixture Objects; note that the fixture object takes the BeautifulSoup tag (or the fixture record) as an input and then processes the data
 
     processed_data = {i: Fixture(date, fixture)
                       for i, fixture in zip(range(len(fixtures)), fixtures)}
@@ -356,6 +880,96 @@ def process_data(date, league, data, parsed_data):
     return parsed_data
 
 
+def page_records(page_source, interest_leagues, backend='lxml'):
+    """Function that parses the HTML source of a whole page into fixture records, grouped by league; note that this is run in the worker processes of parallel_process_pages(), and hence only takes
+    and returns picklable objects
+
+    Parameters
+    ----------
+    page_source: str
+        HTML source of the page
+    interest_leagues: iterable
+        uppercase names of the leagues that should be kept
+    backend: str
+        parser backend, see parse_leagues()
+
+    Returns
+    -------
+    league_dict: dict
+        dictionary of form {league_name: [record, ...]}
+
+    """
+
+    league_dict = parse_leagues(page_source, interest_leagues, backend)
+
+    if backend == 'lxml':
+        return league_dict
+
+    return {league: [fixture_record(fixture) for fixture in data.find_all('article', {'class': 'sp-c-fixture'})] for league, data in league_dict.items()}
+
+
+def fixtures_from_records(date, league_dict):
+    """Function that converts fixture records into the nested dictionary of Fixture objects produced by process_data()
+
+    Parameters
+    ----------
+    date: str
+        string of form 'YYYY-MM-DD' giving date
+    league_dict: dict
+        dictionary of form {league_name: [record, ...]}
+
+    Returns
+    -------
+    parsed_data: dict
+        dictionary of form {league_name: {i: Fixture}}
+
+    """
+
+    parsed_data = {}
+
+    for league, records in league_dict.items():
+        parsed_data = process_data(date, league, records, parsed_data, backend='lxml')
+
+    return parsed_data
+
+
+def parallel_process_pages(pages, interest_leagues=DEFAULT_LEAGUES, workers=None, backend='lxml', chunksize=4):
+    """Generator used for multi-date backfills; whole pages are parsed in parallel by a pool of worker processes and the Fixture objects of each date are yielded in the order of the pages
+
+    Parameters
+    ----------
+    pages: iterable
+        iterable of (date, page_source) tuples, e.g. as yielded by cached_pages()
+    interest_leagues: iterable
+        indicates what leagues the data should be gathered for
+    workers: int
+        number of worker processes; defaults to the number of CPUs
+    backend: str
+        parser backend used by the workers, see parse_leagues()
+    chunksize: int
+        number of pages sent to a worker at once
+
+    Yields
+    ------
+    (date, parsed_data): tuple
+        date and dictionary of form {league_name: {i: Fixture}}
+
+    """
+
+    interest_leagues = [league.upper() for league in interest_leagues]
+    pages = list(pages)
+
+    # note that the executor submits all pages up front, hence the pages are collected first
+
+    dates, sources = zip(*pages) if pages else ((), ())
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        records = executor.map(page_records, sources, repeat(interest_leagues), repeat(backend), chunksize=chunksize)
+
+        for date, league_dict in zip(dates, records):
+            yield date, fixtures_from_records(date, league_dict)
+
+
 if __name__ == '__main__':
 
     date, raw_data = get_data(date='2019-02-23')
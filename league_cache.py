@@ -0,0 +1,99 @@
+import os
+import pickle
+import threading
+from fixture_store import FixtureStore
+
+
+# directory holding the pickled league objects; note that the directory can be changed with the BBC_DATA_DIR environment variable, or with the --data-dir option of the user interface
+
+DATA_DIR = os.environ.get('BBC_DATA_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data'))
+
+
+class LeagueCache():
+    """Cache of league objects shared by all widgets of the user interface. Leagues are only unpickled when they are first needed, and each league is unpickled at most once; the standings of each
+    league are materialized at the same time, and its fixtures are indexed by date. Note that leagues are loaded by the worker of the user interface (see worker.py); hence, the cache may be used from several threads at once
+
+    Parameters
+    ----------
+    directory: str
+        directory holding the pickled league objects; DATA_DIR is used if None
+
+    Attributes
+    ----------
+    self.leagues: dict
+        dictionary of form {league_name: League object} holding all leagues loaded so far
+    self.standings: dict
+        dictionary of form {league_name: Standings object}
+    self.fixtures: dict
+        dictionary of form {league_name: FixtureStore object}
+
+    """
+
+    def __init__(self, directory=None):
+
+        self.directory = directory or DATA_DIR
+
+        self.leagues = {}
+        self.standings = {}
+        self.fixtures = {}
+
+        # each league is loaded under its own lock; hence, a thread asking for a league that is already being loaded (e.g. by the prefetcher) waits for that load rather than starting another
+
+        self._lock = threading.Lock()
+        self._loading = {}
+
+    def path(self, league):
+        """Method that returns the path of the file holding a league"""
+
+        return os.path.join(self.directory, '{}.dat'.format(league.replace(' ', '')))
+
+    def is_loaded(self, league):
+        return league in self.leagues
+
+    def load(self, league):
+        """Method that returns a league, unpickling it first if it has not been loaded yet
+
+        Parameters
+        ----------
+        league: str
+            league name
+
+        """
+
+        if league in self.leagues:
+            return self.leagues[league]
+
+        with self._lock:
+            lock = self._loading.setdefault(league, threading.Lock())
+
+        with lock:
+
+            # the league may have been loaded by another thread while this thread was waiting for the lock
+
+            if league in self.leagues:
+                return self.leagues[league]
+
+            return self._load(league)
+
+    def _load(self, league):
+        """Method that unpickles a league and materializes its standings and fixture store; note that this is only called by load(), while holding the lock of the league"""
+
+        with open(self.path(league), 'rb') as f:
+            data = pickle.load(f)
+
+        # note that the standings module (and with it numpy) is only imported once the first league is loaded, so that the window of the user interface is drawn without waiting for it
+
+        from standings import Standings
+
+        # the league table is materialized from the fixtures of the league, so that the table widget never has to process the fixtures itself
+
+        standings = Standings.from_fixtures((fixture for fixtures in data.fixtures.values() for fixture in fixtures.values()), league)
+
+        fixtures = FixtureStore(data.fixtures)
+
+        with self._lock:
+            self.standings[league] = standings
+            self.fixtures[league] = fixtures
+            self.leagues[league] = data
+
+        return data
@@ -1,26 +1,54 @@
+import argparse
 from data import gather_data
 from data.store_data import Session
-from multiprocessing import Process
+from admin import session
 
-# the raw data is first obtained from the BBC site
 
-date, raw_data = gather_data.get_data(
-    date='2019-02-23', interest_leagues=['Premier League', 'Champions League', 'German Bundesliga', 'Spanish La Liga', 'Italian Serie A'])
+def main():
 
-processed_data = {}
+    # the storage backend is chosen at startup; MySQL is used by default
 
-# the data is then processed; note that the function is recursive and, when done, returns a nested dictionary. Each league has its own dictionary (with the league name as key) and the nested dicionary for each league consists
-# of a series of fixture objects
+    parser = argparse.ArgumentParser(description='Load the fixtures of a day into the database')
+    parser.add_argument('--backend', choices=sorted(session.BACKENDS), default=None, help='storage backend')
+    parser.add_argument('--database', default=None, help='database name (MySQL) or database file (SQLite)')
+    parser.add_argument('--export', default=None, metavar='DIRECTORY', help='also write the fixtures to partitioned Parquet datasets in this directory')
+    parser.add_argument('--standings', default=None, metavar='DIRECTORY', help='also add the fixtures to the materialized standings in this directory')
 
-for league in raw_data.keys():
+    args = parser.parse_args()
 
-    processed_data = gather_data.process_data(date, league, raw_data[league], processed_data)
+    session.configure(args.backend, args.database)
 
+    # the raw data is first obtained from the BBC site
 
-# a session object is then instantiated and the database is updated
+    date, raw_data = gather_data.get_data(
+        date='2019-02-23', interest_leagues=['Premier League', 'Champions League', 'German Bundesliga', 'Spanish La Liga', 'Italian Serie A'], backend='lxml')
 
-with Session() as sess:
+    # the data is then processed; note that the lxml backend has already parsed each league into plain fixture records, so a single day is processed serially, since sending a few leagues to worker
+    # processes costs more than parsing them. When done, a nested dictionary is returned; each league has its own dictionary (with the league name as key) and the nested dicionary for each league
+    # consists of a series of fixture objects
 
-    for league, data in processed_data.items():
+    processed_data = gather_data.fixtures_from_records(date, raw_data)
 
-        sess.update_database(league, data.values())
+    # if requested, the fixtures are also exported to Parquet; note that pyarrow is only needed (and hence only imported) in this case
+
+    if args.export:
+        from data import export
+
+        export.export(processed_data, args.export, date)
+
+    # the materialized standings of each league are updated in place, so that the league tables never have to be recomputed from all fixtures
+
+    if args.standings:
+        from data import standings
+
+        standings.update_standings(args.standings, processed_data)
+
+    # a session object is then instantiated and the database is updated; note that the whole day is loaded in a single transaction
+
+    with Session() as sess:
+
+        sess.bulk_update_database(processed_data)
+
+
+if __name__ == '__main__':
+    main()
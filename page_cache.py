@@ -0,0 +1,271 @@
+import os
+import json
+import gzip
+import time
+import hashlib
+import datetime
+import threading
+
+
+class PageCache():
+    """Local on-disk cache of rendered page sources. The pages are stored content-addressed (i.e. under the SHA-256 hash of the page itself) and gzip compressed, while an index maps each url to the
+    hash of its most recent page. Note that fixture pages of past dates never change; hence, pages that were fetched (or revalidated) at least 'immutable_after' days after their date are served
+    straight from the cache, while all other pages have to be revalidated with the server first. Changes to the index are appended to a journal, which is only merged into the index by save()
+
+    Parameters
+    ----------
+    directory: str
+        directory in which the cache is stored
+    max_bytes: int
+        maximum total size of the compressed pages; the least recently used pages are evicted once the limit is exceeded
+    immutable_after: int
+        number of days after its date from which the page of a date is assumed to never change again
+    compression: int
+        gzip compression level, from 0 (none) to 9 (best)
+
+    Attributes
+    ----------
+    self.index: dict
+        dictionary of form {url: entry}, where each entry stores the hash and size of the page, the times it was last fetched and last accessed and the validators sent by the server
+
+    """
+
+    def __init__(self, directory='page_cache', max_bytes=500 * 1024 ** 2, immutable_after=3, compression=6):
+
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.immutable_after = immutable_after
+        self.compression = compression
+
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.join(self.directory, 'objects'), exist_ok=True)
+
+        try:
+            with open(self.index_path, 'r') as f:
+                self.index = json.load(f)
+
+        except (OSError, ValueError):
+            self.index = {}
+
+        # any changes made since the index was last saved are replayed from the journal; note that a line cut short by a crash is ignored
+
+        try:
+            with open(self.journal_path, 'r') as f:
+                for line in f:
+                    try:
+                        url, entry = json.loads(line)
+                    except ValueError:
+                        continue
+
+                    if entry is None:
+                        self.index.pop(url, None)
+                    else:
+                        self.index[url] = entry
+
+        except OSError:
+            pass
+
+    @property
+    def index_path(self):
+        return os.path.join(self.directory, 'index.json')
+
+    @property
+    def journal_path(self):
+        return os.path.join(self.directory, 'journal.jsonl')
+
+    @property
+    def size(self):
+        """Total size in bytes of all compressed pages in the cache"""
+
+        return sum(entry['size'] for entry in self.blobs().values())
+
+    def blob_path(self, digest):
+        return os.path.join(self.directory, 'objects', digest[:2], digest + '.gz')
+
+    def blobs(self):
+        """Method that returns a dictionary of form {digest: entry} with one entry per stored page; note that several urls can share the same page"""
+
+        return {entry['digest']: entry for entry in self.index.values()}
+
+    def is_immutable(self, url, date):
+        """Method that checks whether the cached page of a date can never change again, i.e. whether it was fetched (or last confirmed by the server) at least immutable_after days after the date.
+        Note that a page fetched on the match day itself may hold a result that was still changing; such a page is revalidated however old the date is, until the server confirms it again
+
+        Parameters
+        ----------
+        url: str
+            url of the page
+        date: str
+            string of form 'YYYY-MM-DD'
+
+        """
+
+        fetched = self.index.get(url, {}).get('fetched')
+
+        if fetched is None:
+            return False
+
+        date = datetime.date(*map(int, str(date).split('-')))
+
+        return (datetime.date.fromtimestamp(fetched) - date).days >= self.immutable_after
+
+    def get(self, url):
+        """Method used to retrieve a page from the cache; returns None if the url has not been cached
+
+        Parameters
+        ----------
+        url: str
+            url of the page
+
+        """
+
+        with self._lock:
+            entry = self.index.get(url)
+
+            if entry is None:
+                return None
+
+            try:
+                with gzip.open(self.blob_path(entry['digest']), 'rt', encoding='utf-8') as f:
+                    page_source = f.read()
+
+            except OSError:
+
+                # pages that have gone missing from disk are simply dropped from the index
+
+                del self.index[url]
+                return None
+
+            entry['accessed'] = time.time()
+
+        return page_source
+
+    def validators(self, url):
+        """Method that returns the conditional request headers for a cached url, so that the server can answer with '304 Not Modified' if the page has not changed"""
+
+        entry = self.index.get(url, {})
+        headers = {}
+
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+
+        return headers
+
+    def put(self, url, page_source, etag=None, last_modified=None):
+        """Method used to store a page in the cache
+
+        Parameters
+        ----------
+        url: str
+            url of the page
+        page_source: str
+            HTML source of the page
+        etag: str
+            'ETag' header sent by the server, if any
+        last_modified: str
+            'Last-Modified' header sent by the server, if any
+
+        """
+
+        data = page_source.encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+
+        with self._lock:
+            path = self.blob_path(digest)
+
+            # identical pages are only stored once
+
+            if os.path.exists(path):
+                size = os.path.getsize(path)
+            else:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+
+                with open(path + '.tmp', 'wb') as f:
+                    f.write(gzip.compress(data, self.compression))
+
+                os.replace(path + '.tmp', path)
+                size = os.path.getsize(path)
+
+            old = self.index.get(url)
+
+            self.index[url] = {'digest': digest, 'size': size, 'accessed': time.time(), 'fetched': time.time(),
+                               'etag': etag, 'last_modified': last_modified}
+
+            self._log(url)
+
+            if old is not None and old['digest'] != digest:
+                self._remove_unreferenced(old['digest'])
+
+            self._evict()
+
+    def touch(self, url, etag=None, last_modified=None):
+        """Method called when the server confirms that a cached page is still up to date; the validators are refreshed if the server sent new ones"""
+
+        with self._lock:
+            entry = self.index.get(url)
+
+            if entry is not None:
+                entry['accessed'] = entry['fetched'] = time.time()
+                entry['etag'] = etag or entry['etag']
+                entry['last_modified'] = last_modified or entry['last_modified']
+
+                self._log(url)
+
+    def _evict(self):
+        """Method that removes the least recently used urls until the cache fits within max_bytes"""
+
+        total = sum(entry['size'] for entry in self.blobs().values())
+
+        for url, entry in sorted(self.index.items(), key=lambda item: item[1]['accessed']):
+
+            if total <= self.max_bytes:
+                break
+
+            del self.index[url]
+            self._log(url)
+
+            if self._remove_unreferenced(entry['digest']):
+                total -= entry['size']
+
+    def _remove_unreferenced(self, digest):
+        """Method that deletes a page from disk if no url refers to it anymore; returns True if the page was deleted"""
+
+        if any(entry['digest'] == digest for entry in self.index.values()):
+            return False
+
+        try:
+            os.remove(self.blob_path(digest))
+        except OSError:
+            pass
+
+        return True
+
+    def _log(self, url):
+        """Method that appends the current entry of a url (None if the url has been removed) to the journal; hence, storing a page costs a single appended line rather than a rewrite of the index"""
+
+        with open(self.journal_path, 'a') as f:
+            f.write(json.dumps([url, self.index.get(url)]) + '\n')
+
+    def _save(self):
+
+        with open(self.index_path + '.tmp', 'w') as f:
+            json.dump(self.index, f)
+
+        os.replace(self.index_path + '.tmp', self.index_path)
+
+        # the journal is only cleared once the index holding all of its changes has been written
+
+        try:
+            os.remove(self.journal_path)
+        except OSError:
+            pass
+
+    def save(self):
+        """Method used to write the index to disk and clear the journal; note that access times are only kept in memory until the next save"""
+
+        with self._lock:
+            self._save()
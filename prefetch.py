@@ -0,0 +1,178 @@
+import datetime
+import threading
+from collections import OrderedDict, namedtuple
+
+
+# a cell model holds the texts displayed by a FixtureCell, so that a cell can be reconfigured without going back to the Fixture object
+
+CellModel = namedtuple('CellModel', ['title', 'home_score', 'away_score'])
+
+# a view holds everything the main page displays for a league on a date, i.e. the league table and the models of the fixture cells
+
+View = namedtuple('View', ['table', 'cells'])
+
+
+def cell_models(fixtures):
+    """Function that converts a list of Fixture objects into the models of the cells displaying them
+
+    Parameters
+    ----------
+    fixtures: list
+        list of Fixture objects; None is treated as an empty list
+
+    """
+
+    return [CellModel('{} vs {}'.format(fixture.home_team, fixture.away_team), str(fixture.home_score), str(fixture.away_score)) for fixture in fixtures or []]
+
+
+class LRUCache():
+    """Thread-safe cache holding at most 'size' entries; once the cache is full, the least recently used entry is evicted
+
+    Parameters
+    ----------
+    size: int
+        maximum number of entries
+
+    """
+
+    def __init__(self, size=64):
+
+        self.size = size
+
+        self.entries = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key):
+        """Method that returns the entry of a key, or None if the key is not in the cache; the entry becomes the most recently used"""
+
+        with self._lock:
+            try:
+                self.entries.move_to_end(key)
+            except KeyError:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+
+            return self.entries[key]
+
+    def put(self, key, value):
+
+        with self._lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+
+            while len(self.entries) > self.size:
+                self.entries.popitem(last=False)
+
+
+class Prefetcher():
+    """Prefetcher of the user interface. After each navigation, the views the user is most likely to select next (i.e. the neighbouring dates of the selected league, and the same date in every
+    other league) are built by the worker and kept in an LRU cache; hence, the next click is usually displayed straight from the cache. Note that a prefetch is abandoned as soon as the user
+    navigates again, since its views are then less likely to be needed than those around the new selection
+
+    Parameters
+    ----------
+    cache: LeagueCache object
+        cache of the league objects and their standings
+    worker: Worker object
+        worker running the prefetch in the background
+    leagues: list
+        names of all leagues that can be selected
+    size: int
+        maximum number of views kept
+
+    """
+
+    def __init__(self, cache, worker, leagues, size=64):
+
+        self.cache = cache
+        self.worker = worker
+        self.leagues = list(leagues)
+
+        self.views = LRUCache(size)
+
+        self.generation = 0
+
+    def get(self, league, date):
+        """Method that returns the view of a league on a date if it has been built already, or None otherwise"""
+
+        return self.views.get((league, date))
+
+    def build(self, league, date):
+        """Method that builds the view of a league on a date and stores it in the cache; note that the league has to be loaded
+
+        Parameters
+        ----------
+        league: str
+            league name
+        date: str
+            date of form 'YYYY-MM-DD'
+
+        Returns
+        -------
+        view: View object
+            the league table as it stood at the end of the date, along with the models of the cells of the fixtures on the date
+
+        """
+
+        view = View(self.cache.standings[league].frame(date), cell_models(self.cache.fixtures[league].on(date)))
+
+        self.views.put((league, date), view)
+
+        return view
+
+    def targets(self, league, date):
+        """Method that returns the (league, date) pairs to prefetch after the given view has been selected, most likely first. If no date has been selected yet, the other leagues are only loaded"""
+
+        if date is None:
+            return [(other, None) for other in self.leagues if other != league]
+
+        day = datetime.date.fromisoformat(date)
+
+        dates = [str(day - datetime.timedelta(days=1)), str(day + datetime.timedelta(days=1))]
+
+        store = self.cache.fixtures.get(league)
+
+        if store is not None:
+            dates += [store.previous(date), store.next(date)]
+
+        targets = [(league, other) for other in dict.fromkeys(dates) if other is not None]
+
+        return targets + [(other, date) for other in self.leagues if other != league]
+
+    def prefetch(self, league, date):
+        """Method called after each navigation; the views around the selected one are built by the worker. Any prefetch still running for a previous selection is abandoned"""
+
+        self.generation += 1
+
+        self.worker.submit('prefetch', self.run, self.generation, self.targets(league, date))
+
+    def run(self, generation, targets):
+        """Method run in the worker thread, which loads the leagues and builds the views of the targets until all are built or a newer prefetch is started"""
+
+        for league, date in targets:
+
+            if generation != self.generation:
+                return
+
+            # leagues that cannot be loaded are skipped; the error is reported if the user selects the league
+
+            try:
+                self.cache.load(league)
+            except Exception:
+                continue
+
+            if date is not None and (league, date) not in self.views:
+                self.build(league, date)
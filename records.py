@@ -0,0 +1,157 @@
+from collections import namedtuple
+from data.event_decoder import decode_events
+
+
+def check_type(name, val, expected_type):
+    """Function used to validate an attribute of a record once, at construction; note that this replaces the Typed descriptor, which intercepts every single attribute access"""
+
+    if not isinstance(val, expected_type):
+        raise TypeError('Expecting argument of type {} for {}'.format(expected_type, name))
+
+
+class EventRecord(namedtuple('EventRecord', ('player', 'time', 'type', 'home'))):
+    """Compact, immutable record of an event (goal, penalty, or red card). Note that, unlike the Event class, the record holds no reference to its fixture
+
+    Parameters
+    ----------
+    player: str
+        name of player associated with event
+    time: int
+        minute of the event, including any added time
+    type: str
+        one of 'goal', 'penalty' or 'red_card'
+    home: boolean
+        True if the player plays for the home team, False otherwise
+
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, player, time, type, home=True):
+
+        check_type('player', player, str)
+        check_type('time', time, int)
+        check_type('type', type, str)
+        check_type('home', home, bool)
+
+        return super().__new__(cls, player, time, type, home)
+
+    @classmethod
+    def from_event(cls, event):
+        """Method used to convert an Event object into a record"""
+
+        return cls(event.player, event.time, event.type, event.home)
+
+    def __str__(self):
+        return 'Time: {0.time} Player: {0.player} Type: {0.type}'.format(self)
+
+
+class FixtureRecord(namedtuple('FixtureRecord', ('date', 'home_team', 'home_score', 'away_team', 'away_score', 'result', 'events'))):
+    """Compact, immutable record of a fixture; the events are stored as a tuple of EventRecord objects sorted by time, and the result is derived from the scores
+
+    Parameters
+    ----------
+    date: str
+        date of fixture
+    home_team: str
+        name of the home team
+    home_score: str
+        goals scored by the home team
+    away_team: str
+        name of the away team
+    away_score: str
+        goals scored by the away team
+    events: iterable
+        iterable of EventRecord objects
+
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, date, home_team, home_score, away_team, away_score, events=()):
+
+        for name, val in (('date', date), ('home_team', home_team), ('home_score', home_score), ('away_team', away_team), ('away_score', away_score)):
+            check_type(name, val, str)
+
+        events = tuple(sorted(events, key=lambda event: event.time))
+
+        for event in events:
+            check_type('event', event, EventRecord)
+
+        # note that the result is determined exactly as it is by the Fixture class
+
+        if home_score > away_score:
+            result = 'Home Win'
+        elif home_score < away_score:
+            result = 'Away Win'
+        else:
+            result = 'Draw'
+
+        return super().__new__(cls, date, home_team, home_score, away_team, away_score, result, events)
+
+    def __getnewargs__(self):
+        return self[:5] + (self.events,)
+
+    @property
+    def time_line(self):
+        """Dictionary of form {time: EventRecord}, for compatibility with the Fixture class"""
+
+        return {event.time: event for event in self.events}
+
+    @classmethod
+    def from_fixture(cls, fixture):
+        """Method used to convert a Fixture object (and all its Event objects) into a record"""
+
+        events = [EventRecord.from_event(event) for time, event in sorted(fixture.time_line.items())]
+
+        return cls(fixture.date, fixture.home_team, fixture.home_score, fixture.away_team, fixture.away_score, events)
+
+    @classmethod
+    def from_record(cls, date, record):
+        """Method used to build a record directly from a plain fixture record (as returned by gather_data.fixture_record() or fixture_parser.fixture_record()), without creating a Fixture object
+
+        Parameters
+        ----------
+        date: str
+            date of fixture
+        record: dict
+            plain fixture record
+
+        """
+
+        # note that only the last event of any given minute is kept, as is the case for the time line of the Fixture class
+
+        time_line = {}
+
+        for player_name, text, home in record['scorers']:
+            for time, kind in decode_events(text):
+                time_line[time] = EventRecord(player_name, time, kind, home)
+
+        return cls(date, record['home_team'], record['home_score'], record['away_team'], record['away_score'], time_line.values())
+
+    def __str__(self):
+
+        string = '{0.date}: {0.home_team} vs {0.away_team} --> {0.home_score}:{0.away_score}\n'.format(self)
+
+        for event in self.events:
+            string += (str(event) + '\n')
+
+        return string
+
+
+def to_records(parsed_data):
+    """Function used to convert the nested dictionary of Fixture objects returned by process_data() into the same structure of FixtureRecord objects
+
+    Parameters
+    ----------
+    parsed_data: dict
+        dictionary of form {league_name: {i: Fixture}}
+
+    Returns
+    -------
+    records: dict
+        dictionary of form {league_name: {i: FixtureRecord}}
+
+    """
+
+    return {league: {i: FixtureRecord.from_fixture(fixture) for i, fixture in fixtures.items()} for league, fixtures in parsed_data.items()}
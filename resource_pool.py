@@ -0,0 +1,193 @@
+import atexit
+import time
+import threading
+from contextlib import contextmanager
+
+
+class ResourcePool():
+    """Generic pool of long-lived resources (e.g. browser drivers or database connections), which are expensive to create and are hence kept alive and lent out to whoever needs them. Note that
+    resources are only created when they are first needed, and that the pool never holds more than 'size' resources at once. Subclasses decide when a resource may be lent out or returned, and how
+    it is closed, by overriding the hooks created(), usable(), reusable(), forget() and close()
+
+    Parameters
+    ----------
+    factory: func object
+        function that takes no arguments and returns a new resource
+    size: int
+        maximum number of resources alive at the same time
+
+    """
+
+    def __init__(self, factory, size):
+
+        self.factory = factory
+        self.size = size
+
+        self.closed = False
+
+        # the idle resources are held in a stack, so that the most recently used resource is lent out first. Note that the condition is notified whenever a resource is returned or a slot is freed
+        # up, so that a thread waiting in acquire() is woken as soon as it can be served
+
+        self._idle = []
+        self._alive = 0
+        self._cond = threading.Condition()
+
+        # the pool is closed automatically when the interpreter exits, so that no resources are left open; note that the registration is removed again by shutdown()
+
+        atexit.register(self.shutdown)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, tb):
+        self.shutdown()
+
+    def acquire(self, timeout=None):
+        """Method used to take a resource out of the pool. An idle resource is reused if one is available; otherwise a new resource is created, unless the pool is already full, in which case the
+        method blocks until another thread returns a resource or frees up a slot
+
+        Parameters
+        ----------
+        timeout: float
+            maximum number of seconds to wait for a resource; waits forever if None
+
+        Raises
+        ------
+        TimeoutError
+            if no resource became available within the timeout
+
+        """
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+
+            with self._cond:
+                while True:
+
+                    if self.closed:
+                        raise RuntimeError('{} has been shut down'.format(type(self).__name__))
+
+                    if self._idle:
+                        resource, create = self._idle.pop(), False
+                        break
+
+                    if self._alive < self.size:
+                        self._alive += 1
+                        resource, create = None, True
+                        break
+
+                    remaining = None if deadline is None else deadline - time.monotonic()
+
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError('No resource of the {} became available within {} seconds'.format(type(self).__name__, timeout))
+
+                    self._cond.wait(remaining)
+
+            if create:
+                try:
+                    resource = self.factory()
+                except Exception:
+                    self.free()
+                    raise
+
+                self.created(resource)
+
+                return resource
+
+            # resources that can no longer be used (e.g. that have crashed or expired while idle) are discarded, and the next one is tried
+
+            if self.usable(resource):
+                return resource
+
+            self.discard(resource)
+
+    def release(self, resource, discard=False):
+        """Method used to return a resource to the pool; the resource is closed instead if the caller asks for it to be discarded, or if it cannot be reused
+
+        Parameters
+        ----------
+        resource: object
+            resource previously obtained from acquire()
+        discard: boolean
+            if True, the resource is closed instead of being returned to the pool
+
+        """
+
+        if discard or self.closed or not self.reusable(resource):
+            self.discard(resource)
+            return
+
+        with self._cond:
+            self._idle.append(resource)
+            self._cond.notify()
+
+    def discard(self, resource):
+        """Method used to close a resource and free up its slot in the pool"""
+
+        self.forget(resource)
+        self.free()
+
+        try:
+            self.close(resource)
+        except Exception as err:
+            print(err)
+
+    def free(self):
+        """Method used to free up the slot of a resource that is no longer alive; a thread waiting for a resource is woken, and creates a new resource in its place"""
+
+        with self._cond:
+            self._alive -= 1
+            self._cond.notify()
+
+    @contextmanager
+    def borrow(self, timeout=None):
+        """Context manager that lends out a resource and returns it to the pool once the block is exited. If the block raises an exception, the resource is assumed to be in an unknown state and
+        is discarded"""
+
+        resource = self.acquire(timeout)
+
+        try:
+            yield resource
+
+        except BaseException:
+            self.release(resource, discard=True)
+            raise
+
+        self.release(resource)
+
+    def created(self, resource):
+        """Hook called once a new resource has been created"""
+
+    def usable(self, resource):
+        """Hook that checks whether an idle resource may be lent out"""
+
+        return True
+
+    def reusable(self, resource):
+        """Hook called when a resource is returned; the resource is closed rather than kept if False is returned"""
+
+        return True
+
+    def forget(self, resource):
+        """Hook called before a resource is closed, which drops any state kept about it"""
+
+    def close(self, resource):
+        """Hook that closes a resource"""
+
+    def shutdown(self):
+        """Method used to close all idle resources; resources that are currently lent out are closed as soon as they are returned"""
+
+        with self._cond:
+            self.closed = True
+
+            idle, self._idle = self._idle, []
+
+            # threads still waiting for a resource are woken, and raise since the pool is closed
+
+            self._cond.notify_all()
+
+        for resource in idle:
+            self.discard(resource)
+
+        atexit.unregister(self.shutdown)
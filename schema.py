@@ -0,0 +1,398 @@
+import sys
+import json
+from admin.session import get_backend
+from data.standings import season
+
+
+# the normalized schema consists of a fixed set of tables, regardless of the number of leagues and teams. Every league is stored once per season, and teams and players belong to a league season;
+# hence, all fixtures, teams, players and events can be queried (and indexed) across teams and leagues
+
+TABLES = ('leagues', 'teams', 'fixtures', 'players', 'events')
+
+SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS leagues (
+
+    LeagueId INT NOT NULL AUTO_INCREMENT PRIMARY KEY,
+    Name VARCHAR(50) NOT NULL,
+    Season CHAR(9) NOT NULL,
+    CONSTRAINT league_season UNIQUE (Name, Season)
+
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS teams (
+
+    TeamId INT NOT NULL AUTO_INCREMENT PRIMARY KEY,
+    LeagueId INT NOT NULL,
+    Name VARCHAR(50) NOT NULL,
+    CONSTRAINT league_team UNIQUE (LeagueId, Name),
+    INDEX team_name (Name)
+
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS fixtures (
+
+    FixtureId INT NOT NULL AUTO_INCREMENT PRIMARY KEY,
+    LeagueId INT NOT NULL,
+    Date CHAR(10) NOT NULL,
+    HomeTeamId INT NOT NULL,
+    AwayTeamId INT NOT NULL,
+    HomeScore INT NOT NULL,
+    AwayScore INT NOT NULL,
+    Result VARCHAR(10) NOT NULL,
+    CONSTRAINT league_fixture UNIQUE (LeagueId, Date, HomeTeamId, AwayTeamId),
+    INDEX fixture_date (Date),
+    INDEX fixture_home (HomeTeamId),
+    INDEX fixture_away (AwayTeamId)
+
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS players (
+
+    PlayerId INT NOT NULL AUTO_INCREMENT PRIMARY KEY,
+    LeagueId INT NOT NULL,
+    TeamId INT NOT NULL,
+    Name VARCHAR(50) NOT NULL,
+    CONSTRAINT league_player UNIQUE (LeagueId, TeamId, Name),
+    INDEX player_name (Name),
+    INDEX player_team (TeamId)
+
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS events (
+
+    FixtureId INT NOT NULL,
+    Minute INT NOT NULL,
+    PlayerId INT NOT NULL,
+    Type VARCHAR(10) NOT NULL,
+    CONSTRAINT fixture_minute PRIMARY KEY (FixtureId, Minute),
+    INDEX event_player (PlayerId)
+
+    )
+    """
+)
+
+# the league table is derived from the fixtures rather than stored; each fixture is counted once from the point of view of the home team and once from the point of view of the away team
+
+STANDINGS = """
+SELECT t.Name, COUNT(*) AS Played, SUM(s.GF) AS GF, SUM(s.GA) AS GA, SUM(s.GF - s.GA) AS GD, SUM(s.GF > s.GA) AS Won, SUM(s.GF < s.GA) AS Lost, SUM(s.GF = s.GA) AS Draw,
+SUM(3 * (s.GF > s.GA) + (s.GF = s.GA)) AS Pts
+FROM (
+    SELECT HomeTeamId AS TeamId, HomeScore AS GF, AwayScore AS GA FROM fixtures WHERE LeagueId = %s
+    UNION ALL
+    SELECT AwayTeamId AS TeamId, AwayScore AS GF, HomeScore AS GA FROM fixtures WHERE LeagueId = %s
+) AS s
+JOIN teams AS t ON t.TeamId = s.TeamId
+GROUP BY t.TeamId, t.Name
+ORDER BY Pts DESC, GD DESC, GF DESC
+"""
+
+TOP_SCORERS = """
+SELECT p.Name, t.Name, SUM(e.Type = 'goal') AS Goals, SUM(e.Type = 'penalty') AS Penalties, SUM(e.Type = 'red_card') AS RedCards
+FROM events AS e
+JOIN players AS p ON p.PlayerId = e.PlayerId
+JOIN teams AS t ON t.TeamId = p.TeamId
+WHERE p.LeagueId = %s
+GROUP BY p.PlayerId, p.Name, t.Name
+ORDER BY Goals + Penalties DESC
+LIMIT %s
+"""
+
+TEAM_FIXTURES = """
+SELECT f.Date, l.Name, h.Name, a.Name, f.HomeScore, f.AwayScore
+FROM teams AS t
+JOIN fixtures AS f ON f.HomeTeamId = t.TeamId OR f.AwayTeamId = t.TeamId
+JOIN leagues AS l ON l.LeagueId = f.LeagueId
+JOIN teams AS h ON h.TeamId = f.HomeTeamId
+JOIN teams AS a ON a.TeamId = f.AwayTeamId
+WHERE t.Name = %s
+ORDER BY f.Date
+"""
+
+
+def placeholders(n):
+    """Function that returns a list of n query placeholders, for use in an IN clause"""
+
+    return ', '.join(['%s'] * n)
+
+
+def create_schema(cursor):
+    """Function used to create all tables of the normalized schema; note that existing tables are left untouched"""
+
+    for query in SCHEMA:
+        cursor.execute(query)
+
+
+def league_ids(cursor, league, seasons):
+    """Function that returns the id of a league for each of the given seasons, adding any league seasons not yet in the database
+
+    Returns
+    -------
+    ids: dict
+        dictionary of form {season: league_id}
+
+    """
+
+    seasons = sorted(set(seasons))
+
+    cursor.executemany('INSERT IGNORE INTO leagues (Name, Season) VALUES (%s, %s)', [(league, season) for season in seasons])
+
+    cursor.execute('SELECT Season, LeagueId FROM leagues WHERE Name = %s AND Season IN ({})'.format(placeholders(len(seasons))), [league] + seasons)
+
+    return dict(cursor.fetchall())
+
+
+def team_ids(cursor, teams):
+    """Function that returns the id of each team, adding any teams not yet in the database
+
+    Parameters
+    ----------
+    teams: iterable
+        iterable of (league_id, name) tuples
+
+    Returns
+    -------
+    ids: dict
+        dictionary of form {(league_id, name): team_id}
+
+    """
+
+    teams = sorted(set(teams))
+
+    cursor.executemany('INSERT IGNORE INTO teams (LeagueId, Name) VALUES (%s, %s)', teams)
+
+    ids = sorted({league_id for league_id, name in teams})
+
+    cursor.execute('SELECT LeagueId, Name, TeamId FROM teams WHERE LeagueId IN ({})'.format(placeholders(len(ids))), ids)
+
+    return {(league_id, name): team_id for league_id, name, team_id in cursor.fetchall()}
+
+
+def player_ids(cursor, players):
+    """Function that returns the id of each player, adding any players not yet in the database
+
+    Parameters
+    ----------
+    players: iterable
+        iterable of (league_id, team_id, name) tuples
+
+    Returns
+    -------
+    ids: dict
+        dictionary of form {(league_id, team_id, name): player_id}
+
+    """
+
+    players = sorted(set(players))
+
+    cursor.executemany('INSERT IGNORE INTO players (LeagueId, TeamId, Name) VALUES (%s, %s, %s)', players)
+
+    ids = sorted({league_id for league_id, team_id, name in players})
+
+    cursor.execute('SELECT LeagueId, TeamId, Name, PlayerId FROM players WHERE LeagueId IN ({})'.format(placeholders(len(ids))), ids)
+
+    return {(league_id, team_id, name): player_id for league_id, team_id, name, player_id in cursor.fetchall()}
+
+
+def write_fixtures(cursor, league, fixtures):
+    """Function that writes a batch of fixtures of one league (and all their events) to the normalized tables. Fixtures already in the database have their scores updated and their events replaced;
+    since the league table is derived from the fixtures, writing the same fixture twice never counts it twice
+
+    Parameters
+    ----------
+    cursor: cursor object
+        cursor of an open connection; note that nothing is committed
+    league: str
+        league name
+    fixtures: list
+        list of Fixture (or FixtureRecord) objects
+
+    Returns
+    -------
+    rows: int
+        number of fixtures and events written
+
+    """
+
+    if not fixtures:
+        return 0
+
+    leagues = league_ids(cursor, league, [season(fixture.date) for fixture in fixtures])
+
+    def league_of(fixture): return leagues[season(fixture.date)]
+
+    teams = team_ids(cursor, [(league_of(fixture), team) for fixture in fixtures for team in (fixture.home_team, fixture.away_team)])
+
+    def key(fixture):
+        league_id = league_of(fixture)
+        return (league_id, fixture.date, teams[league_id, fixture.home_team], teams[league_id, fixture.away_team])
+
+    cursor.executemany("""
+    INSERT INTO fixtures (LeagueId, Date, HomeTeamId, AwayTeamId, HomeScore, AwayScore, Result) VALUES (%s, %s, %s, %s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE HomeScore = VALUES(HomeScore), AwayScore = VALUES(AwayScore), Result = VALUES(Result)
+    """, [key(fixture) + (int(fixture.home_score), int(fixture.away_score), fixture.result) for fixture in fixtures])
+
+    ids = sorted(leagues.values())
+
+    cursor.execute('SELECT LeagueId, Date, HomeTeamId, AwayTeamId, FixtureId FROM fixtures WHERE LeagueId IN ({}) AND Date IN ({})'.format(
+        placeholders(len(ids)), placeholders(len({fixture.date for fixture in fixtures}))), ids + sorted({fixture.date for fixture in fixtures}))
+
+    fixture_ids = {tuple(row[:4]): row[4] for row in cursor.fetchall()}
+
+    # the events of each fixture are then replaced as a whole, so that events that have since been removed from the fixture do not linger
+
+    events = []
+
+    for fixture in fixtures:
+
+        league_id, date, home_id, away_id = key(fixture)
+
+        for event in fixture.time_line.values():
+            events.append((fixture_ids[league_id, date, home_id, away_id], event.time, (league_id, home_id if event.home else away_id, event.player), event.type))
+
+    batch = sorted(set(fixture_ids[key(fixture)] for fixture in fixtures))
+
+    cursor.execute('DELETE FROM events WHERE FixtureId IN ({})'.format(placeholders(len(batch))), batch)
+
+    if events:
+        players = player_ids(cursor, [player for _, _, player, _ in events])
+
+        cursor.executemany('INSERT INTO events (FixtureId, Minute, PlayerId, Type) VALUES (%s, %s, %s, %s)',
+                           [(fixture_id, minute, players[player], kind) for fixture_id, minute, player, kind in events])
+
+    return len(fixtures) + len(events)
+
+
+def standings(cursor, league_id):
+    """Function that returns the league table of a league season, sorted by points, goal difference and goals scored
+
+    Returns
+    -------
+    rows: list
+        list of (team, played, GF, GA, GD, won, lost, draw, pts) tuples
+
+    """
+
+    cursor.execute(STANDINGS, (league_id, league_id))
+
+    return cursor.fetchall()
+
+
+def top_scorers(cursor, league_id, limit=20):
+    """Function that returns the players of a league season with the most goals (including penalties)"""
+
+    cursor.execute(TOP_SCORERS, (league_id, limit))
+
+    return cursor.fetchall()
+
+
+def team_fixtures(cursor, team):
+    """Function that returns all fixtures of a team across all leagues and seasons, ordered by date"""
+
+    cursor.execute(TEAM_FIXTURES, (team,))
+
+    return cursor.fetchall()
+
+
+def legacy_leagues(tables):
+    """Function that returns the names of all leagues stored in the previous layout, i.e. all leagues that have a league table, a fixtures table and a players table"""
+
+    tables = set(tables)
+
+    return sorted(table for table in tables if table + 'Fixtures' in tables and table + 'Players' in tables)
+
+
+def migrate(backend=None, drop=False):
+    """Function that copies all data from the previous layout (three tables per league and one table per team) into the normalized schema. Fixtures are copied from the fixtures table of each league;
+    events are restored from the ledger, which holds the full content of every fixture loaded since the ledger was introduced. Note that the previous layout only holds aggregated player statistics
+    for fixtures loaded before the ledger existed, which cannot be split into events; these players are copied without events
+
+    Parameters
+    ----------
+    backend: Backend() Object
+        storage backend holding the data; the backend chosen with session.configure() is used if None
+    drop: boolean
+        if True, the tables of the previous layout are dropped once the data has been copied
+
+    """
+
+    from data.records import FixtureRecord, EventRecord
+    from data.store_data import LEDGER, team_name
+
+    backend = backend or get_backend()
+
+    with backend.borrow() as connection:
+
+        cursor = backend.cursor(connection)
+
+        tables = backend.tables(cursor)
+
+        create_schema(cursor)
+
+        for league in legacy_leagues(tables):
+
+            cursor.execute('SELECT Date, HomeTeam, AwayTeam, HomeScore, AwayScore FROM {}Fixtures'.format(league))
+            rows = cursor.fetchall()
+
+            content = {}
+
+            if LEDGER in tables:
+                cursor.execute('SELECT Date, HomeTeam, AwayTeam, Content FROM {} WHERE League = %s'.format(LEDGER), (league,))
+                content = {tuple(row[:3]): json.loads(row[3]) for row in cursor.fetchall()}
+
+            fixtures = []
+
+            for date, home_team, away_team, home_score, away_score in rows:
+
+                _, _, events = content.get((date, home_team, away_team), (None, None, []))
+
+                fixtures.append(FixtureRecord(date, home_team, str(home_score), away_team, str(away_score), [EventRecord(*event) for event in events]))
+
+            rows = write_fixtures(cursor, league, fixtures)
+
+            # players without events are attached to the latest season of their team
+
+            cursor.execute('SELECT Name, Team FROM {}Players'.format(league))
+
+            names = {team_name(team): team for fixture in fixtures for team in (fixture.home_team, fixture.away_team)}
+            latest = {}
+
+            for fixture in sorted(fixtures, key=lambda fixture: fixture.date):
+                for team in (fixture.home_team, fixture.away_team):
+                    latest[team] = season(fixture.date)
+
+            players = [(name, names[team_name(team)]) for name, team in cursor.fetchall() if team_name(team) in names]
+
+            if players:
+                leagues = league_ids(cursor, league, latest.values())
+                teams = team_ids(cursor, [(leagues[latest[team]], team) for name, team in players])
+
+                player_ids(cursor, [(leagues[latest[team]], teams[leagues[latest[team]], team], name) for name, team in players])
+
+            connection.commit()
+
+            print('Migrated {}: {} fixtures, {} rows'.format(league, len(fixtures), rows))
+
+            # note that MySQL implicitly commits when tables are dropped; hence, this is only done once the league has been committed
+
+            if drop:
+                teams = {team_name(team) for fixture in fixtures for team in (fixture.home_team, fixture.away_team)} & set(tables)
+
+                for table in [league, league + 'Fixtures', league + 'Players'] + sorted(teams):
+                    cursor.execute('DROP TABLE IF EXISTS {}'.format(table))
+
+        cursor.close()
+
+
+if __name__ == '__main__':
+
+    # usage: python -m data.schema migrate [--drop]; note that the backend is chosen with the BBC_BACKEND and BBC_DATABASE environment variables
+
+    if sys.argv[1:2] == ['migrate']:
+        migrate(drop='--drop' in sys.argv)
+    else:
+        print('usage: python -m data.schema migrate [--drop]')
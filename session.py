@@ -1,5 +1,303 @@
-
+import os
+import re
+import sqlite3
 import pymysql
+import threading
+from contextlib import contextmanager
+from data.connection_pool import ConnectionPool
+
+
+class SQLError(Exception):
+    pass
+
+
+# settings used to connect to the MySQL server; note that every database gets its own pool of connections, which is shared by all sessions using that database
+
+DB_CONFIG = {'host': 'localhost', 'user': 'root', 'password': 'Shadowguy!89'}
+DEFAULT_DB = 'football_project'
+
+POOL_SIZE = 5
+POOL_RECYCLE = 3600
+POOL_HEALTH_CHECK = True
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db=DEFAULT_DB):
+    """Function that returns the connection pool of a database, creating it on first use
+
+    Parameters
+    ----------
+    db: str
+        name of the database
+
+    """
+
+    with _pools_lock:
+        if db not in _pools or _pools[db].closed:
+            _pools[db] = ConnectionPool(lambda: pymysql.connect(db=db, **DB_CONFIG), size=POOL_SIZE, recycle=POOL_RECYCLE, health_check=POOL_HEALTH_CHECK)
+
+        return _pools[db]
+
+
+def shutdown_pools():
+    """Function used to close the connection pools of all databases"""
+
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.shutdown()
+
+        _pools.clear()
+
+
+# the storage backend is chosen once, at startup, with configure(); if it is not, the backend is taken from the BBC_BACKEND and BBC_DATABASE environment variables, e.g. BBC_BACKEND=sqlite
+
+BACKEND = None
+DATABASE = None
+
+
+def configure(backend=None, database=None):
+    """Function used to choose the storage backend used by all sessions created from now on
+
+    Parameters
+    ----------
+    backend: str
+        name of the backend, i.e. one of the keys of BACKENDS
+    database: str
+        name of the database (MySQL) or path of the database file (SQLite); the default of the backend is used if None
+
+    """
+
+    global BACKEND, DATABASE
+
+    if backend is not None:
+        if backend not in BACKENDS:
+            raise ValueError('Unknown backend {}; expecting one of {}'.format(backend, ', '.join(BACKENDS)))
+
+        BACKEND = backend
+
+    DATABASE = database
+
+
+def get_backend(backend=None, database=None):
+    """Function that returns an instance of the chosen storage backend; the backend set with configure() is used if no backend is given"""
+
+    backend = backend or BACKEND or os.environ.get('BBC_BACKEND', 'mysql')
+
+    return BACKENDS[backend](database or DATABASE or os.environ.get('BBC_DATABASE'))
+
+
+class DialectCursor():
+    """Cursor that translates every query from the MySQL dialect used throughout the project into the dialect of another database before running it. Note that a single query may be translated into
+    several statements, e.g. when the indexes defined within a CREATE TABLE statement have to be created seperately
+
+    Parameters
+    ----------
+    cursor: cursor object
+        DB-API cursor of the underlying database
+    translate: func object
+        function that takes a query and returns a list of translated statements
+
+    """
+
+    def __init__(self, cursor, translate):
+
+        self.cursor = cursor
+        self.translate = translate
+
+    def __getattr__(self, attr):
+        return getattr(self.cursor, attr)
+
+    def execute(self, query, args=()):
+
+        for statement in self.translate(query):
+            self.cursor.execute(statement, tuple(args or ()))
+
+        return self.cursor.rowcount
+
+    def executemany(self, query, args):
+
+        statement, = self.translate(query)
+
+        self.cursor.executemany(statement, [tuple(row) for row in args])
+
+        return self.cursor.rowcount
+
+
+class Backend():
+    """Storage backend used by a session. The backend opens and closes the connections, and hides any differences between the databases; all queries are written in the MySQL dialect and translated
+    by the cursor of the backend if necessary
+
+    Parameters
+    ----------
+    database: str
+        name or path of the database; the default of the backend is used if None
+
+    """
+
+    default = None
+
+    def __init__(self, database=None):
+
+        self.database = database or self.default
+
+    def connect(self):
+        """Method that returns an open connection to the database"""
+
+        raise NotImplementedError
+
+    def release(self, connection, discard=False):
+        """Method used to hand back a connection obtained from connect()"""
+
+        connection.close()
+
+    def cursor(self, connection):
+        """Method that returns a cursor of the connection that accepts queries in the MySQL dialect"""
+
+        return connection.cursor()
+
+    def begin(self, connection):
+        """Method used to start a transaction"""
+
+        connection.begin()
+
+    def tables(self, cursor):
+        """Method that returns the names of all tables in the database"""
+
+        cursor.execute('SHOW TABLES')
+
+        return [row[0] for row in cursor.fetchall()]
+
+    def primary_key(self, cursor, table):
+        """Method that returns the columns of the primary key of a table, in the order of the key"""
+
+        cursor.execute("SHOW KEYS FROM {} WHERE Key_name = 'PRIMARY'".format(table))
+
+        return [row[4] for row in sorted(cursor.fetchall(), key=lambda row: row[3])]
+
+    def rekey(self, cursor, table, columns):
+        """Method that replaces the primary key of a table; note that the rows are kept, hence the new key has to be unique for the existing rows"""
+
+        cursor.execute('ALTER TABLE {} DROP PRIMARY KEY, ADD PRIMARY KEY ({})'.format(table, ', '.join(columns)))
+
+    @contextmanager
+    def borrow(self):
+        """Context manager that opens a connection and hands it back once the block is exited; the connection is discarded if the block raises an exception"""
+
+        connection = self.connect()
+
+        try:
+            yield connection
+
+        except BaseException:
+            self.release(connection, discard=True)
+            raise
+
+        self.release(connection)
+
+
+class MySQLBackend(Backend):
+    """Backend storing the data on a MySQL server; connections are taken from the pool of the database, see get_pool()"""
+
+    default = DEFAULT_DB
+
+    def connect(self):
+        return get_pool(self.database).acquire()
+
+    def release(self, connection, discard=False):
+        get_pool(self.database).release(connection, discard)
+
+
+class SQLiteBackend(Backend):
+    """Backend storing the data in a single SQLite file, so that the project runs without a database server. Note that the connection is opened in autocommit mode, so that transactions are only
+    started explicitly by begin(), as is the case for MySQL"""
+
+    default = 'football_project.db'
+
+    def connect(self):
+        return sqlite3.connect(self.database, isolation_level=None, check_same_thread=False)
+
+    def cursor(self, connection):
+        return DialectCursor(connection.cursor(), sqlite_dialect)
+
+    def begin(self, connection):
+        connection.execute('BEGIN')
+
+    def primary_key(self, cursor, table):
+
+        cursor.execute('PRAGMA table_info({})'.format(table))
+
+        return [row[1] for row in sorted((row for row in cursor.fetchall() if row[5]), key=lambda row: row[5])]
+
+    def rekey(self, cursor, table, columns):
+
+        # SQLite cannot alter the primary key of a table; hence, the table is rebuilt under the new key, and the rows are copied over within a savepoint, so that the table is left untouched if
+        # anything fails
+
+        cursor.execute('PRAGMA table_info({})'.format(table))
+
+        definitions = ['{} {}{}'.format(name, kind, ' NOT NULL' if not_null else '') for _, name, kind, not_null, _, _ in cursor.fetchall()]
+
+        cursor.execute('SAVEPOINT rekey')
+
+        try:
+            cursor.execute('CREATE TABLE {}_rekey ({}, PRIMARY KEY ({}))'.format(table, ', '.join(definitions), ', '.join(columns)))
+            cursor.execute('INSERT INTO {0}_rekey SELECT * FROM {0}'.format(table))
+            cursor.execute('DROP TABLE {}'.format(table))
+            cursor.execute('ALTER TABLE {0}_rekey RENAME TO {0}'.format(table))
+
+        except Exception:
+            cursor.execute('ROLLBACK TO rekey')
+            raise
+
+        finally:
+            cursor.execute('RELEASE rekey')
+
+
+def sqlite_dialect(query):
+    """Function that translates a query from the MySQL dialect into the SQLite dialect; only the constructs used by the project are translated
+
+    Parameters
+    ----------
+    query: str
+        query in the MySQL dialect
+
+    Returns
+    -------
+    statements: list
+        list of statements in the SQLite dialect
+
+    """
+
+    if query.strip().rstrip(';').upper() == 'SHOW TABLES':
+        return ["SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%' ORDER BY name"]
+
+    query = query.replace('%s', '?').replace('INSERT IGNORE', 'INSERT OR IGNORE')
+    query = query.replace('INT NOT NULL AUTO_INCREMENT PRIMARY KEY', 'INTEGER PRIMARY KEY AUTOINCREMENT')
+
+    # SQLite only supports the upsert with a conflict target, or without one as the last clause; the latter is used here, and the new values are referred to via the 'excluded' table
+
+    query = re.sub(r'ON DUPLICATE KEY UPDATE(.*)', lambda match: 'ON CONFLICT DO UPDATE SET' + re.sub(r'VALUES\((\w+)\)', r'excluded.\1', match.group(1)), query, flags=re.S)
+
+    # indexes cannot be defined within a CREATE TABLE statement; hence, these are created by seperate statements once the table exists
+
+    statements = [query]
+
+    table = re.search(r'CREATE TABLE IF NOT EXISTS (\w+)', query)
+
+    if table:
+        for name, columns in INDEX.findall(query):
+            statements.append('CREATE INDEX IF NOT EXISTS {} ON {} ({})'.format(name, table.group(1), columns))
+
+        statements[0] = INDEX.sub('', query)
+
+    return statements
+
+
+INDEX = re.compile(r',\s*INDEX (\w+) \(([^)]*)\)')
+
+BACKENDS = {'mysql': MySQLBackend, 'sqlite': SQLiteBackend}
 
 
 class SessionAbstract():
@@ -9,6 +307,8 @@ class SessionAbstract():
     ----------
     self.conduit: DBInteraction() Object
         object that handles all contact with the SQL server
+    self.backend: Backend() Object
+        storage backend the session connects to
 
     """
 
@@ -34,15 +334,14 @@ class SessionAbstract():
             super().__setattr__(attr, val)
 
     def __enter__(self):
-        """Method used to initiate the Connection to the MySQL database"""
+        """Method used to initiate the Connection to the database"""
 
-        # the connection to the server is first made
+        # a connection is first obtained from the backend; note that the MySQL backend takes the connection from the shared pool, and only opens a new connection if no idle connection is available
 
         try:
-            self.db = pymysql.connect(host='localhost', user='root',
-                                      password='Shadowguy!89', db='football_project')
+            self.db = self.backend.connect()
 
-            self.cursor = self.db.cursor()
+            self.cursor = self.backend.cursor(self.db)
 
         except Exception as err:
             raise SQLError(err)
@@ -52,8 +351,7 @@ class SessionAbstract():
         # all the current tables are then retrieved
 
         try:
-            self.cursor.execute('SHOW TABLES;')
-            self.tables = [i[0] for i in self.cursor.fetchall()]
+            self.tables = self.backend.tables(self.cursor)
 
         except Exception as err:
             print(err)
@@ -63,13 +361,16 @@ class SessionAbstract():
     def __exit__(self, exc_type, exc_val, tb):
         """Method used to close the connection properly"""
 
+        # the connection is handed back to the backend (i.e. returned to the pool in the case of MySQL); if the block raised an exception, the connection is discarded instead
+
         try:
-            self.db.commit()
+            if exc_type is None:
+                self.db.commit()
 
             del(self.conduit)
 
             self.cursor.close()
-            self.db.close()
+            self.backend.release(self.db, discard=exc_type is not None)
 
         except Exception as err:
             print(err)
@@ -0,0 +1,347 @@
+import os
+import pickle
+from bisect import bisect_right
+from collections import namedtuple
+import numpy as np
+
+
+# columns of a league table; note that these are the same columns (in the same order) as those of the league tables in the database
+
+COLUMNS = ('Played', 'GF', 'GA', 'GD', 'Won', 'Lost', 'Draw', 'Pts')
+
+# default order of a league table, i.e. by points, then by goal difference, then by goals scored
+
+ORDER = ('Pts', 'GD', 'GF')
+
+# the fields of a fixture needed by the standings
+
+FixtureScore = namedtuple('FixtureScore', ['date', 'home_team', 'away_team', 'home_score', 'away_score'])
+
+
+def season(date):
+    """Function that returns the season a date belongs to; seasons are assumed to start in July, e.g. both '2018-08-11' and '2019-02-23' belong to the season '2018/2019'
+
+    Parameters
+    ----------
+    date: str
+        date of form 'YYYY-MM-DD'
+
+    """
+
+    year, month = int(date[:4]), int(date[5:7])
+
+    if month < 7:
+        year -= 1
+
+    return '{}/{}'.format(year, year + 1)
+
+
+def results(scored, conceded):
+    """Function that returns the add-on values of a series of results, i.e. the values that are added to the league table of a team for each fixture it has played
+
+    Parameters
+    ----------
+    scored: numpy.ndarray
+        goals scored by the team in each fixture
+    conceded: numpy.ndarray
+        goals conceded by the team in each fixture
+
+    Returns
+    -------
+    rows: numpy.ndarray
+        array of shape (len(scored), len(COLUMNS))
+
+    """
+
+    won, lost, draw = scored > conceded, scored < conceded, scored == conceded
+
+    return np.column_stack([np.ones_like(scored), scored, conceded, scored - conceded, won, lost, draw, 3 * won + draw])
+
+
+class Standings():
+    """Materialized league table of a single league. The table is held as an array with one row per team and one column per entry of COLUMNS, and is updated in place as each fixture is added;
+    hence, reading the table never requires the fixtures to be processed again. Note that the table starts from zero every season; the current table only holds the fixtures of the latest season,
+    and earlier seasons are only kept as the change of the table on every match day. These changes are summed up into an array holding the table as it stood after every match day; the table on
+    any date is then a single slice of that array
+
+    Parameters
+    ----------
+    league: str
+        league name
+
+    Attributes
+    ----------
+    self.teams: list
+        team names, in the order of the rows of self.totals
+    self.totals: numpy.ndarray
+        league table of the latest season, of shape (len(self.teams), len(COLUMNS))
+    self.season: str
+        latest season, e.g. '2018/2019'
+    self.seasons: dict
+        dictionary of form {season: set of rows}, holding the rows of the teams that played in each season
+    self.deltas: dict
+        dictionary of form {date: numpy.ndarray}, holding the change of the league table on each match day; note that the arrays only cover the teams known on that day
+    self.fixtures: dict
+        dictionary of form {(date, home_team, away_team): (home_score, away_score)} holding every fixture added so far
+    self.days: list
+        sorted match days, i.e. the dates of the first axis of the cumulative array
+
+    """
+
+    def __init__(self, league=None):
+
+        self.league = league
+
+        self.teams = []
+        self.index = {}
+        self.totals = np.zeros((0, len(COLUMNS)), dtype=np.int64)
+
+        self.season = None
+        self.seasons = {}
+
+        self.deltas = {}
+        self.fixtures = {}
+
+        self.days = []
+
+        self._order = {}
+        self._cumulative = None
+
+    @classmethod
+    def from_fixtures(cls, fixtures, league=None):
+        """Method used to build the standings of a league from an iterable of Fixture objects"""
+
+        standings = cls(league)
+
+        for fixture in fixtures:
+            standings.add_fixture(fixture)
+
+        return standings
+
+    @classmethod
+    def load(cls, path):
+        """Method used to load standings previously stored with save()"""
+
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+
+    def save(self, path):
+        """Method used to store the standings in a file"""
+
+        with open(path, 'wb') as f:
+            pickle.dump(self, f)
+
+    def team(self, name):
+        """Method that returns the row of a team, adding an empty row if the team is not yet in the table"""
+
+        if name not in self.index:
+            self.index[name] = len(self.teams)
+            self.teams.append(name)
+            self.totals = np.vstack([self.totals, np.zeros((1, len(COLUMNS)), dtype=np.int64)])
+
+        return self.index[name]
+
+    def add_fixture(self, fixture):
+        """Method used to add a fixture to the table. A fixture that has already been added is ignored, unless its score has changed, in which case the old result is replaced by the new one
+
+        Parameters
+        ----------
+        fixture: Fixture object
+            fixture object containing details of the fixture
+
+        Returns
+        -------
+        changed: boolean
+            True if the table has changed, False otherwise
+
+        """
+
+        key = (fixture.date, fixture.home_team, fixture.away_team)
+        score = (int(fixture.home_score), int(fixture.away_score))
+
+        old = self.fixtures.get(key)
+
+        if old == score:
+            return False
+
+        rows = results(np.array(score), np.array(score[::-1]))
+
+        if old is not None:
+            rows -= results(np.array(old), np.array(old[::-1]))
+
+        teams = [self.team(fixture.home_team), self.team(fixture.away_team)]
+
+        # the current table is reset when the first fixture of a new season is added; fixtures of earlier seasons only change the table of their match day
+
+        current = season(fixture.date)
+
+        self.seasons.setdefault(current, set()).update(teams)
+
+        if self.season is None or current > self.season:
+            self.season = current
+            self.totals = np.zeros_like(self.totals)
+
+        if current == self.season:
+            self.totals[teams] += rows
+
+        # the change is also added to the delta of the match day; note that the delta is padded if teams have been added since it was created
+
+        delta = self.deltas.get(fixture.date, np.zeros((0, len(COLUMNS)), dtype=np.int64))
+
+        if len(delta) < len(self.teams):
+            delta = np.vstack([delta, np.zeros((len(self.teams) - len(delta), len(COLUMNS)), dtype=np.int64)])
+
+        delta[teams] += rows
+
+        self.deltas[fixture.date] = delta
+        self.fixtures[key] = score
+
+        self._order = {}
+        self._cumulative = None
+
+        return True
+
+    def cumulative(self):
+        """Method that returns the league table as it stood after every match day, as an array of shape (len(self.days), len(self.teams), len(COLUMNS)); the changes are summed up within each
+        season only, so that every table starts from zero at the first match day of its season. Note that the array is only rebuilt after the standings have changed, which happens once per
+        ingest rather than once per query"""
+
+        if self._cumulative is None:
+
+            self.days = sorted(self.deltas)
+
+            stacked = np.zeros((len(self.days), len(self.teams), len(COLUMNS)), dtype=np.int64)
+
+            for i, day in enumerate(self.days):
+                stacked[i, :len(self.deltas[day])] = self.deltas[day]
+
+            # the match days of each season are a contiguous slice of the sorted days
+
+            seasons = [season(day) for day in self.days]
+            starts = [i for i in range(len(self.days)) if not i or seasons[i] != seasons[i - 1]]
+
+            for start, end in zip(starts, starts[1:] + [len(self.days)]):
+                stacked[start:end] = np.cumsum(stacked[start:end], axis=0)
+
+            self._cumulative = stacked
+
+        return self._cumulative
+
+    def as_of(self, date):
+        """Method that returns the league table as it stood at the end of the given date; the last match day up to and including the date is found by bisection, and its row of the cumulative
+        array is returned. If that match day belongs to an earlier season, the season of the date has not started yet, and the table is empty
+
+        Parameters
+        ----------
+        date: str
+            date of form 'YYYY-MM-DD'
+
+        Returns
+        -------
+        totals: numpy.ndarray
+            array of shape (len(self.teams), len(COLUMNS))
+
+        """
+
+        cumulative = self.cumulative()
+
+        i = bisect_right(self.days, date)
+
+        if not i or season(self.days[i - 1]) != season(date):
+            return np.zeros_like(self.totals)
+
+        return cumulative[i - 1]
+
+    def order(self, totals=None, columns=ORDER):
+        """Method that returns the rows of the table sorted in descending order by the given columns; note that the order of the current table is only computed once after each change
+
+        Parameters
+        ----------
+        totals: numpy.ndarray
+            table to sort; the current table is used if None
+        columns: tuple
+            names of the columns to sort by, most significant first
+
+        """
+
+        if totals is None:
+            if columns not in self._order:
+                self._order[columns] = self.order(self.totals, columns)
+
+            return self._order[columns]
+
+        # np.lexsort() sorts by the last key first, in ascending order; hence the keys are reversed and negated
+
+        return np.lexsort([-totals[:, COLUMNS.index(column)] for column in reversed(columns)])
+
+    def table(self, date=None, columns=ORDER):
+        """Method that returns the sorted league table
+
+        Parameters
+        ----------
+        date: str
+            if given, the table as it stood at the end of this date is returned; the current table is returned otherwise
+        columns: tuple
+            names of the columns to sort by, most significant first
+
+        Returns
+        -------
+        rows: list
+            list of (team, row) tuples, where row is an array of the values of COLUMNS
+
+        """
+
+        totals = self.totals if date is None else self.as_of(date)
+
+        order = self.order(None if date is None else totals, columns)
+
+        # teams that had not played yet on the given date are left out, as are teams that did not play in the latest season
+
+        current = self.seasons.get(self.season, ())
+
+        return [(self.teams[i], totals[i]) for i in order if totals[i, 0] or (date is None and i in current)]
+
+    def frame(self, date=None, columns=ORDER):
+        """Method that returns the sorted league table as a pandas DataFrame, indexed by team name"""
+
+        import pandas as pd
+
+        rows = self.table(date, columns)
+
+        return pd.DataFrame([row for team, row in rows], index=[team for team, row in rows], columns=COLUMNS)
+
+
+def update_standings(directory, processed_data):
+    """Function that adds a batch of processed fixtures to the stored standings of each league; the standings of each league are stored in their own file in the given directory
+
+    Parameters
+    ----------
+    directory: str
+        directory holding the standings files
+    processed_data: dict
+        dictionary of form {league_name: {i: Fixture}}, as returned by gather_data.process_data()
+
+    Returns
+    -------
+    changed: int
+        number of fixtures that changed the standings
+
+    """
+
+    # note that a single file holds every season of a league, since the standings are kept per season themselves
+
+    os.makedirs(directory, exist_ok=True)
+
+    changed = 0
+
+    for league, data in processed_data.items():
+
+        path = os.path.join(directory, '{}.standings'.format(league.replace(' ', '')))
+
+        standings = Standings.load(path) if os.path.exists(path) else Standings(league)
+
+        changed += sum(standings.add_fixture(fixture) for fixture in (data.values() if isinstance(data, dict) else data))
+
+        standings.save(path)
+
+    return changed
@@ -1,33 +1,197 @@
 import numpy as np
-import pymysql
 import datetime
-from admin.session import SessionAbstract
+import time
+import json
+import hashlib
+from admin.session import SessionAbstract, SQLError, get_backend
+from data.records import FixtureRecord, EventRecord
+from data import schema
+from data.standings import results
 
 
-class SQLError(Exception):
-    pass
+# name of the table that keeps track of every fixture that has been loaded into the database
 
+LEDGER = 'ingest_ledger'
 
-class Connection():
+# primary keys of the tables kept per league, of form {table: (old_key, key)}; tables created with the old key by earlier versions are moved onto the current key by add_tables()
 
-    def __init__(self, name, sess):
+KEYS = {'{}Fixtures': (['HomeTeam', 'AwayTeam'], ['Date', 'HomeTeam', 'AwayTeam']), '{}Players': (['Name'], ['Name', 'Team'])}
 
-        self.name = name
-        self.sess = sess
 
-        self.db = pymysql.connect(host='localhost', user='root', password='Shadowguy!89', db=name)
+def team_name(team):
+    """Function that converts a team name into the form used in the database; all team names are converted to lowercase and all spaces and apostrophes are removed so that the table names are
+    valid"""
+
+    return team.replace(' ', '').replace('\'', '').lower()
+
+
+def fixture_results(fixture, team):
+    """Function that defines a list of results; note that the league table where the data is stored is of form (team, games_played, GF, GA, GD, Won, Lost, Draw, Pts). A list of add-on values is
+    defined based on the fixture results. One can then simply do an operation like current_stats = old_stats + fixture_stats to update the league table
+
+    Parameters
+    ----------
+    fixture: Fixture object
+        fixture object containing details of the fixture
+    team: str
+        team name, either as given in the fixture or converted by team_name()
+
+    Returns
+    -------
+    (home, scored, conceded, results): tuple
+        whether the team played at home, the goals scored and conceded by the team, and the list of add-on values
+
+    """
+
+    if team_name(team) == team_name(fixture.home_team):
+        home, scored, conceded = True, int(fixture.home_score), int(fixture.away_score)
+    else:
+        home, scored, conceded = False, int(fixture.away_score), int(fixture.home_score)
+
+    # note; True evaluates to 1 while False evaluates to 0
+
+    results = [1, scored, conceded, (scored - conceded), int(scored > conceded), int(conceded > scored), int(scored == conceded)]
+
+    # the number of points earned in the game is then appened to the list
+
+    if scored > conceded:
+        results.append(3)
+    elif conceded > scored:
+        results.append(0)
+    else:
+        results.append(1)
+
+    return home, scored, conceded, results
+
+
+def team_deltas(fixtures):
+    """Function that aggregates the add-on values of a whole batch of fixtures in memory, so that each team only has to be written to the league table once. The values are stored in an array
+    with one row per team and one column per league table column, i.e. (games_played, GF, GA, GD, Won, Lost, Draw, Pts)
+
+    Parameters
+    ----------
+    fixtures: iterable
+        iterable of Fixture objects
+
+    Returns
+    -------
+    (teams, deltas): tuple
+        list of team names (converted by team_name()) and array of shape (len(teams), 8) holding the summed add-on values of each team
+
+    """
+
+    fixtures = list(fixtures)
+
+    teams = sorted({team_name(team) for fixture in fixtures for team in (fixture.home_team, fixture.away_team)})
+    index = {team: i for i, team in enumerate(teams)}
+
+    home = np.array([index[team_name(fixture.home_team)] for fixture in fixtures], dtype=np.intp)
+    away = np.array([index[team_name(fixture.away_team)] for fixture in fixtures], dtype=np.intp)
+
+    home_score = np.array([int(fixture.home_score) for fixture in fixtures], dtype=np.int64)
+    away_score = np.array([int(fixture.away_score) for fixture in fixtures], dtype=np.int64)
+
+    # note that np.add.at() is used rather than simple indexing, since a team may appear more than once in a batch and every one of its fixtures has to be counted
+
+    deltas = np.zeros((len(teams), 8), dtype=np.int64)
+
+    np.add.at(deltas, home, results(home_score, away_score))
+    np.add.at(deltas, away, results(away_score, home_score))
+
+    return teams, deltas
+
+
+def player_stats(fixtures):
+    """Function that aggregates the statistics of all players involved in a batch of fixtures, so that each player only has to be written to the database once. Note that players are grouped by
+    name and team, since two players of the same name may play for different teams
+
+    Parameters
+    ----------
+    fixtures: iterable
+        iterable of Fixture objects
+
+    Returns
+    -------
+    stats: dict
+        dictionary of form {(name, team): [goals, penalties, red_cards]}
+
+    """
+
+    stats = {}
+
+    for fixture in fixtures:
+        for event in fixture.time_line.values():
+
+            team = fixture.home_team if event.home else fixture.away_team
+
+            # note that apostrophes are stripped from the names, as has always been the case; the rows already stored hold the stripped names, and a player would otherwise be split over two rows
 
-        self.cursor = self.db.cursor()
+            values = stats.setdefault((event.player.replace('\'', ''), team.replace(' ', '')), [0, 0, 0])
 
-    def close(self):
+            if event.type == 'goal':
+                values[0] += 1
+            elif event.type == 'penalty':
+                values[1] += 1
+            else:
+                values[2] += 1
+
+    return stats
+
+
+def fixture_key(league, fixture):
+    """Function that returns the key under which a fixture is stored in the ledger, i.e. (league, date, home_team, away_team)"""
+
+    return (league, fixture.date, fixture.home_team, fixture.away_team)
 
-        self.cursor.close()
-        self.db.close()
+
+def fixture_content(fixture):
+    """Function that serializes everything about a fixture that is written to the database (the scores and all events) into a JSON string; the string is stored in the ledger so that the
+    contribution of the fixture can be reversed if the fixture changes later on
+
+    Parameters
+    ----------
+    fixture: Fixture object
+        fixture object containing details of the fixture
+
+    """
+
+    events = sorted([event.player, event.time, event.type, event.home] for event in fixture.time_line.values())
+
+    return json.dumps([fixture.home_score, fixture.away_score, events])
+
+
+def fixture_hash(content):
+    """Function that returns the hash of the serialized content of a fixture, as returned by fixture_content()"""
+
+    return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+
+def stored_fixture(key, content):
+    """Function that rebuilds a fixture from its ledger entry. Note that a FixtureRecord is returned, which can be passed to team_deltas() and player_stats() just like a Fixture object
+
+    Parameters
+    ----------
+    key: tuple
+        ledger key of form (league, date, home_team, away_team)
+    content: str
+        serialized content of the fixture, as returned by fixture_content()
+
+    """
+
+    league, date, home_team, away_team = key
+    home_score, away_score, events = json.loads(content)
+
+    return FixtureRecord(date, home_team, home_score, away_team, away_score, [EventRecord(*event) for event in events])
 
 
 class Session(SessionAbstract):
     """Session object that handles the flow of data in and out of the database. Note that the actual interaction with the database is delegated via a DBInteraction() object, and hence the Session acts as a sort of Proxy. This will later allow tight control over what attributes and methods are public and which are private, as opposed to simple inheritance
 
+    Parameters
+    ----------
+    backend: Backend() Object
+        storage backend to connect to; the backend chosen with session.configure() is used if None
+
     Attributes
     ----------
     self.conduit: DBInteraction() Object
@@ -37,8 +201,9 @@ class Session(SessionAbstract):
 
     _connections = []
 
-    def __init__(self):
+    def __init__(self, backend=None):
 
+        self.backend = backend or get_backend()
         self.login_time = datetime.datetime.now()
         self.conduit = DBInteraction(self, self.login_time)
 
@@ -56,30 +221,73 @@ class Session(SessionAbstract):
 
         league_name = league.replace(' ', '').lower()
 
-        if league_name not in self.tables:
-            print('Adding League')
-            self.add_league(league_name)
-
         print('Updating Data for {}'.format(league))
         print('-' * 50, end='\n')
 
-        for fixture in data:
+        data = list(data.values()) if isinstance(data, dict) else list(data)
 
-            # the fixture is then added to the database
+        self.add_tables(league_name, data)
 
-            result = self.add_fixture(league_name, fixture)
+        # the fixtures, the league tables, the individual team tables and the player statistics are then updated for all fixtures at once; note that fixtures that have already been loaded are skipped
 
-            # the league tables and the individual team tables are then updated
+        try:
+            self.load_fixtures(league_name, data)
+            self.db.commit()
 
-            for team in (fixture.home_team, fixture.away_team):
+        except Exception as err:
+            self.db.rollback()
+            self.conduit.ledger = None
+            print(err)
+
+    def bulk_update_database(self, processed_data):
+        """Method that loads a whole batch of fixtures (typically all leagues of one day) into the database in a single transaction. As opposed to update_database(), the rows are written with
+        executemany() and the transaction is committed once, at the end of the batch; if anything fails, the whole batch is rolled back
 
-                self.update_team(league_name, team.replace(' ', '').lower(), fixture)
+        Parameters
+        ----------
+        processed_data: dict
+            dictionary of form {league_name: {i: Fixture}}, as returned by gather_data.process_data()
+
+        Returns
+        -------
+        (rows, elapsed): tuple
+            number of rows written and number of seconds taken
+
+        """
 
-            for time, event in fixture.time_line.items():
+        start = time.perf_counter()
 
-                team = fixture.home_team if event.home else fixture.away_team
+        batch = {league.replace(' ', '').lower(): list(data.values()) if isinstance(data, dict) else list(data)
+                 for league, data in processed_data.items()}
 
-                self.update_player(league_name, team.replace(' ', ''), event)
+        # note that MySQL implicitly commits the current transaction whenever a table is created; hence, all missing tables are created before the transaction is started
+
+        for league_name, fixtures in batch.items():
+            self.add_tables(league_name, fixtures)
+
+        rows = 0
+
+        try:
+            self.backend.begin(self.db)
+
+            for league_name, fixtures in batch.items():
+                rows += self.load_fixtures(league_name, fixtures)
+
+            self.db.commit()
+
+        except Exception as err:
+
+            # the in-memory ledger may already contain entries of the batch; hence, it is discarded and reloaded from the database when it is next needed
+
+            self.db.rollback()
+            self.conduit.ledger = None
+            raise SQLError(err)
+
+        elapsed = time.perf_counter() - start
+
+        print('Loaded {} rows in {:.2f} s --> {:.0f} rows/s'.format(rows, elapsed, rows / elapsed if elapsed else 0))
+
+        return rows, elapsed
 
 
 class DBInteraction():
@@ -98,6 +306,77 @@ class DBInteraction():
         self.sess = sess
         self.timestamp = timestamp
 
+        # dictionary of form {(league, date, home_team, away_team): hash} holding every fixture in the ledger; note that the ledger is only read from the database when it is first needed
+
+        self.ledger = None
+
+        # leagues whose tables are known to use the current primary keys
+
+        self.keyed = set()
+
+    @property
+    def normalized(self):
+        """True if the database uses the normalized schema (see schema.py), in which case no tables are created per league or per team"""
+
+        return all(table in self.sess.tables for table in schema.TABLES)
+
+    def add_tables(self, league, fixtures):
+        """Method that creates any tables missing for a batch of fixtures of one league; note that MySQL implicitly commits the current transaction whenever a table is created, hence this has to be
+        done before the batch is loaded
+
+        Parameters
+        ----------
+        league: str
+            league name
+        fixtures: list
+            list of Fixture objects
+
+        """
+
+        if LEDGER not in self.sess.tables:
+            self.add_ledger()
+
+        if self.normalized:
+            return
+
+        if league not in self.sess.tables:
+            print('Adding League')
+            self.add_league(league)
+            self.sess.tables.append(league)
+
+        elif league not in self.keyed:
+            self.migrate_keys(league)
+
+        self.keyed.add(league)
+
+        self.add_teams(league, {team_name(team) for fixture in fixtures for team in (fixture.home_team, fixture.away_team)})
+
+    def migrate_keys(self, league):
+        """Method that moves the tables of a league created by earlier versions onto the current primary keys, see KEYS; any other key is left alone and an error is raised, since rows would
+        silently be dropped otherwise
+
+        Parameters
+        ----------
+        league: str
+            league name
+
+        """
+
+        for table, (old_key, key) in KEYS.items():
+
+            table = table.format(league)
+
+            current = self.sess.backend.primary_key(self.sess.cursor, table)
+
+            if current == key:
+                continue
+
+            if current != old_key:
+                raise SQLError('Table {} has the unexpected primary key ({})'.format(table, ', '.join(current)))
+
+            print('Migrating the primary key of {}'.format(table))
+            self.sess.backend.rekey(self.sess.cursor, table, key)
+
     def add_league(self, league):
         """Method used to add a new league to the database. Note that 3 new tables are created; one for the fixtures in the league, one for the league table itself and one for the
         individual teams in the league
@@ -119,7 +398,7 @@ class DBInteraction():
         HomeScore INT NOT NULL,
         AwayScore INT NOT NULL,
         Result VARCHAR(10) NOT NULL,
-        CONSTRAINT teams PRIMARY KEY (HomeTeam, AwayTeam)
+        CONSTRAINT fixture PRIMARY KEY (Date, HomeTeam, AwayTeam)
 
         )
 
@@ -143,11 +422,12 @@ class DBInteraction():
         query3 = """
         CREATE TABLE IF NOT EXISTS {}Players (
 
-        Name VARCHAR(50) NOT NULL PRIMARY KEY,
+        Name VARCHAR(50) NOT NULL,
         Team VARCHAR(50) NOT NULL,
         Goals INT NOT NULL,
         Penalties INT NOT NULL,
-        RedCards INT NOT NULL
+        RedCards INT NOT NULL,
+        CONSTRAINT player PRIMARY KEY (Name, Team)
 
         )
         """.format(league)
@@ -163,78 +443,277 @@ class DBInteraction():
         except Exception as err:
             print(err)
 
-    def add_fixture(self, league, fixture):
-        """Method used to add a fixture to the current database
+    def add_ledger(self):
+        """Method used to create the ledger table, which holds the key, hash and content of every fixture that has been loaded into the database"""
+
+        self.sess.cursor.execute("""
+        CREATE TABLE IF NOT EXISTS {} (
+
+        League VARCHAR(50) NOT NULL,
+        Date CHAR(10) NOT NULL,
+        HomeTeam VARCHAR(50) NOT NULL,
+        AwayTeam VARCHAR(50) NOT NULL,
+        Hash CHAR(40) NOT NULL,
+        Content TEXT NOT NULL,
+        CONSTRAINT fixture PRIMARY KEY (League, Date, HomeTeam, AwayTeam)
+
+        )
+        """.format(LEDGER))
+
+        self.sess.db.commit()
+        self.sess.tables.append(LEDGER)
+
+    def load_ledger(self):
+        """Method that returns the in-memory ledger, reading it from the database if necessary
+
+        Returns
+        -------
+        ledger: dict
+            dictionary of form {(league, date, home_team, away_team): hash}
+
+        """
+
+        if self.ledger is None:
+
+            self.sess.cursor.execute('SELECT League, Date, HomeTeam, AwayTeam, Hash FROM {}'.format(LEDGER))
+
+            self.ledger = {tuple(key): digest for *key, digest in self.sess.cursor.fetchall()}
+
+        return self.ledger
+
+    def pending_fixtures(self, league, fixtures):
+        """Method that sorts a batch of fixtures by comparing them against the ledger. Fixtures whose key is in the ledger with the same hash have already been loaded and are skipped; fixtures
+        whose key is in the ledger with a different hash have changed since they were loaded
+
+        Parameters
+        ----------
+        league: str
+            league name
+        fixtures: list
+            list of Fixture objects
+
+        Returns
+        -------
+        (new, changed, adopted): tuple
+            lists of fixtures that have never been loaded, of fixtures that have changed, and of fixtures that are already in the fixtures table but not in the ledger (i.e. that were loaded
+            before the ledger existed)
+
+        """
+
+        ledger = self.load_ledger()
+
+        new, changed, seen = [], [], set()
+
+        for fixture in fixtures:
+
+            key = fixture_key(league, fixture)
+
+            # note that a fixture that appears more than once in the batch is only counted once
+
+            if key in seen:
+                continue
+
+            seen.add(key)
+
+            if key not in ledger:
+                new.append(fixture)
+            elif ledger[key] != fixture_hash(fixture_content(fixture)):
+                changed.append(fixture)
+
+        # note that the normalized schema needs no such check, since writing a fixture to it twice never counts the fixture twice
+
+        if not new or self.normalized:
+            return new, changed, []
+
+        # the fixtures table is then checked for any new fixtures, since these might have been loaded before the ledger was introduced. Note that the date has to match as well; the same two
+        # teams meet again every season, and a later meeting is a new fixture
+
+        home_teams = sorted({fixture.home_team for fixture in new})
+
+        self.sess.cursor.execute("""
+        SELECT Date, HomeTeam, AwayTeam FROM {}Fixtures WHERE HomeTeam IN ({})
+        """.format(league, ', '.join(['%s'] * len(home_teams))), home_teams)
+
+        stored = {tuple(row) for row in self.sess.cursor.fetchall()}
+
+        adopted = [fixture for fixture in new if (fixture.date, fixture.home_team, fixture.away_team) in stored]
+        new = [fixture for fixture in new if (fixture.date, fixture.home_team, fixture.away_team) not in stored]
+
+        return new, changed, adopted
 
+    def reverse_fixtures(self, league, fixtures):
+        """Method that removes the contribution of previously loaded fixtures from the database, so that the fixtures can be loaded again with their new content. The old content is taken from the
+        ledger; the league table and player statistics are decremented by the old values, and the rows of the fixtures table and the team tables are deleted
 
+        Parameters
+        ----------
+        league: str
+            league name
+        fixtures: list
+            list of Fixture objects whose content has changed
+
+        Returns
+        -------
+        rows: int
+            number of rows written
 
         """
 
+        old = []
+
+        for fixture in fixtures:
+
+            key = fixture_key(league, fixture)
+
+            self.sess.cursor.execute("""
+            SELECT Content FROM {} WHERE League = %s AND Date = %s AND HomeTeam = %s AND AwayTeam = %s
+            """.format(LEDGER), key)
+
+            old.append(stored_fixture(key, self.sess.cursor.fetchall()[0][0]))
+
+        if not old:
+            return 0
+
+        teams, deltas = team_deltas(old)
+
+        rows = self.upsert_teams(league, teams, -deltas)
+        rows += self.upsert_players(league, {player: [-value for value in values] for player, values in player_stats(old).items()})
+
+        for fixture in old:
+
+            self.sess.cursor.execute('DELETE FROM {}Fixtures WHERE Date = %s AND HomeTeam = %s AND AwayTeam = %s'.format(league),
+                                     (fixture.date, fixture.home_team, fixture.away_team))
+
+            for team in (fixture.home_team, fixture.away_team):
+                self.sess.cursor.execute('DELETE FROM {} WHERE Date = %s'.format(team_name(team)), (fixture.date,))
+
+        return rows
+
+    def record_fixtures(self, league, fixtures):
+        """Method that adds a batch of fixtures to the ledger, or updates their hash and content if they are already in the ledger
+
+        Parameters
+        ----------
+        league: str
+            league name
+        fixtures: list
+            list of Fixture objects
+
+        Returns
+        -------
+        rows: int
+            number of fixtures recorded
+
+        """
+
+        if not fixtures:
+            return 0
+
+        entries = {}
+
+        for fixture in fixtures:
+
+            content = fixture_content(fixture)
+
+            entries[fixture_key(league, fixture)] = (fixture_hash(content), content)
+
         query = """
-        INSERT INTO {0}Fixtures (Date, HomeTeam, AwayTeam, HomeScore, AwayScore, Result) VALUES('{1.date}', '{1.home_team}', '{1.away_team}', '{1.home_score}', '{1.away_score}', '{1.result}');
-        """.format(league, fixture)
+        INSERT INTO {} (League, Date, HomeTeam, AwayTeam, Hash, Content) VALUES (%s, %s, %s, %s, %s, %s)
+        ON DUPLICATE KEY UPDATE Hash = VALUES(Hash), Content = VALUES(Content)
+        """.format(LEDGER)
 
-        try:
-            self.sess.cursor.execute(query)
+        self.sess.cursor.executemany(query, [key + entry for key, entry in entries.items()])
 
-        except Exception as err:
-            print(err)
+        self.load_ledger().update({key: digest for key, (digest, content) in entries.items()})
 
-    def update_team(self, league, team, fixture):
-        """Method that updates the data for a team after a fixture has been played. Note that this consists of updating the overall league table and the teams individual team table. In order
-        to keep the database as consistent as possible, all team names are converted to lowercase and all spaces are removed so that the tables names are valid
+        return len(entries)
+
+    def load_fixtures(self, league, fixtures):
+        """Method that loads a batch of fixtures of one league, within the current transaction. Only new and changed fixtures are written; changed fixtures are first reversed and then loaded
+        again, and all loaded fixtures are recorded in the ledger. Hence, loading the same batch twice leaves the database unchanged
 
         Parameters
         ----------
         league: str
             league name
-        team: str
-            team name
-        fixture Fixture Object
-            fixture object containing details of the fixture
+        fixtures: list
+            list of Fixture objects
+
+        Returns
+        -------
+        rows: int
+            number of rows written
 
         """
 
-        home, scored, conceded = True, 0, 0
+        new, changed, adopted = self.pending_fixtures(league, fixtures)
 
-        def map_results():
-            """Function that defines a list of results; note that the league table where the data is stored is of form (team, games_played, GF, GA, GD, Won, Lost, Draw, Pts). A list of add-on values is defined based on the fixture results. One can then simply do an operation like current_stats = old_stats + fixture_stats to update the league table
+        # in the normalized schema, the league table is derived from the fixtures; hence, changed fixtures are simply overwritten
 
-            """
+        if self.normalized:
+            return schema.write_fixtures(self.sess.cursor, league, new + changed) + self.record_fixtures(league, new + changed)
 
-            nonlocal home, scored, conceded
+        rows = self.reverse_fixtures(league, changed)
 
-            if team == fixture.home_team.replace(' ', '').lower():
-                home, scored, conceded = True, int(fixture.home_score), int(fixture.away_score)
-            else:
-                home, scored, conceded = False, int(fixture.away_score), int(fixture.home_score)
+        fixtures = new + changed
 
-            # note; True evaluates to 1 while False evaluates to 0
+        rows += self.bulk_add_fixtures(league, fixtures)
+        rows += self.bulk_update_teams(league, fixtures)
+        rows += self.bulk_update_players(league, fixtures)
 
-            results = [1, scored, conceded, (scored - conceded), scored
-                       > conceded, conceded > scored, scored == conceded]
+        # note that fixtures loaded before the ledger existed are only recorded, since their statistics are already in the database
 
-            # the number of points earned in the game is then appened to the list
+        rows += self.record_fixtures(league, fixtures + adopted)
 
-            if scored > conceded:
-                results.append(3)
-            elif conceded > scored:
-                results.append(0)
-            else:
-                results.append(1)
+        return rows
+
+    def bulk_add_fixtures(self, league, fixtures):
+        """Method used to add a batch of fixtures to the database with a single statement; note that fixtures already in the database are ignored rather than raising an error
+
+        Parameters
+        ----------
+        league: str
+            league name
+        fixtures: list
+            list of Fixture objects
+
+        Returns
+        -------
+        rows: int
+            number of fixtures inserted
 
-            return results
+        """
 
-        # if the team has no table, the team is added to the league table and a an individual team table is also created
+        query = """
+        INSERT IGNORE INTO {}Fixtures (Date, HomeTeam, AwayTeam, HomeScore, AwayScore, Result) VALUES (%s, %s, %s, %s, %s, %s)
+        """.format(league)
 
-        if team.lower() not in self.sess.tables:
+        rows = [(fixture.date, fixture.home_team, fixture.away_team, fixture.home_score, fixture.away_score, fixture.result) for fixture in fixtures]
 
-            query1 = """
+        if not rows:
+            return 0
 
-            INSERT INTO {0} (Team, Played, GF, GA, GD, Won, Lost, Draw, Pts) VALUES('{1}', '0', '0', '0', '0', '0', '0', '0', '0')
-            """.format(league, team)
+        return self.sess.cursor.executemany(query, rows)
 
-            query2 = """
+    def add_teams(self, league, teams):
+        """Method that creates the individual team tables of any teams not yet in the database. Note that the rows of the league table are created by upsert_teams() when the team is first written
+
+        Parameters
+        ----------
+        league: str
+            league name
+        teams: iterable
+            team names, converted by team_name()
+
+        """
+
+        new_teams = [team for team in teams if team not in self.sess.tables]
+
+        if not new_teams:
+            return
+
+        for team in new_teams:
+            self.sess.cursor.execute("""
             CREATE TABLE IF NOT EXISTS {} (
 
             Date CHAR(10) NOT NULL PRIMARY KEY,
@@ -243,97 +722,137 @@ class DBInteraction():
             Conceded INT NOT NULL
 
             )
-            """.format(team)
+            """.format(team))
 
-            self.sess.cursor.execute(query1)
-            self.sess.cursor.execute(query2)
-            self.sess.db.commit()
+        self.sess.db.commit()
+        self.sess.tables.extend(new_teams)
 
-        # first, the current state of the team is retrieved
+    def upsert_teams(self, league, teams, deltas):
+        """Method that adds the aggregated add-on values to the league table with a single statement. Teams without a row are inserted with the add-on values, all others are incremented in place;
+        since the increment is done by the database itself, no SELECT is needed and concurrent ingests cannot overwrite each other
 
-        self.sess.cursor.execute('SELECT * FROM {0} WHERE {0}.Team = "{1}"'.format(league, team))
-        name, *args = self.sess.cursor.fetchall()[0]
+        Parameters
+        ----------
+        league: str
+            league name
+        teams: list
+            team names, converted by team_name()
+        deltas: numpy.ndarray
+            array of shape (len(teams), 8), as returned by team_deltas()
 
-        # the state is then updated
+        Returns
+        -------
+        rows: int
+            number of teams written
 
-        new_state = [i + j for i, j in zip(args, map_results())]
+        """
 
-        # the league table is then updated with the new state
+        if not teams:
+            return 0
 
-        query1 = """
+        query = """
+        INSERT INTO {} (Team, Played, GF, GA, GD, Won, Lost, Draw, Pts) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+        ON DUPLICATE KEY UPDATE Played = Played + VALUES(Played), GF = GF + VALUES(GF), GA = GA + VALUES(GA), GD = GD + VALUES(GD), Won = Won + VALUES(Won), Lost = Lost + VALUES(Lost),
+        Draw = Draw + VALUES(Draw), Pts = Pts + VALUES(Pts)
+        """.format(league)
 
-        UPDATE {} SET Played = '{}', GF = '{}', GA = '{}', GD = '{}', Won = '{}', Lost = '{}', Draw = '{}', Pts = '{}' WHERE {}.Team = '{}'
-        """.format(league, *new_state, league, team)
+        # note that pymysql sends an executemany() of an INSERT statement as a single multi-row INSERT
 
-        # the individual team table is then updated
+        self.sess.cursor.executemany(query, [(team,) + tuple(int(value) for value in row) for team, row in zip(teams, deltas)])
 
-        def opposition(x): return fixture.away_team if x else fixture.home_team
+        return len(teams)
 
-        query2 = """
-        INSERT INTO {0} (Date, Team, Scored, Conceded) VALUES ('{1}', '{2}', '{3}', '{4}')
+    def bulk_update_teams(self, league, fixtures):
+        """Method that updates the league table and the individual team tables for a batch of fixtures. Note that the add-on values are aggregated per team with team_deltas() first, so that each
+        team is written to the league table exactly once
 
-        """.format(team, fixture.date, opposition(home), scored, conceded)
+        Parameters
+        ----------
+        league: str
+            league name
+        fixtures: list
+            list of Fixture objects
 
-        self.sess.cursor.execute(query1)
+        Returns
+        -------
+        rows: int
+            number of rows written
 
-        try:
-            self.sess.cursor.execute(query2)
-        except pymysql.err.IntegrityError:
-            print('Ignoring Duplicate')
+        """
 
-        self.sess.db.commit()
+        if not fixtures:
+            return 0
+
+        rows = self.upsert_teams(league, *team_deltas(fixtures))
+
+        team_rows = {}
+
+        for fixture in fixtures:
+            for team in (fixture.home_team, fixture.away_team):
+
+                home, scored, conceded, results = fixture_results(fixture, team)
+
+                opposition = fixture.away_team if home else fixture.home_team
+
+                team_rows.setdefault(team_name(team), []).append((fixture.date, opposition, scored, conceded))
+
+        # each team has its own table; hence, one statement is issued per team
 
-    def update_player(self, league, team, event):
-        """Method used to update the statistics of a player
+        for team, values in team_rows.items():
+            rows += self.sess.cursor.executemany("""
+            INSERT IGNORE INTO {} (Date, Team, Scored, Conceded) VALUES (%s, %s, %s, %s)
+            """.format(team), values)
+
+        return rows
+
+    def bulk_update_players(self, league, fixtures):
+        """Method that updates the statistics of all players involved in a batch of fixtures; the statistics are first aggregated per player with player_stats() and then written with upsert_players()
 
         Parameters
         ----------
         league: str
             league name
-        team: str
-            team name
-        event: Event object
-            event object containing details of the event
-
-        """
-
-        name = event.player.replace('\'', '')
+        fixtures: list
+            list of Fixture objects
 
-        # the players current stats are retrieved from the database; note that if the palyer has no entry, an enrty is created
+        Returns
+        -------
+        rows: int
+            number of players written
 
-        try:
-            self.sess.cursor.execute(
-                'SELECT * FROM {0}Players WHERE {0}Players.name = "{1}"'.format(league, name))
-            *args, goals, pens, reds = self.sess.cursor.fetchall()[0]
-
-        except:
-            print('Adding Player', name, team)
-            query = """
+        """
 
-            INSERT INTO {}Players (Name, Team, Goals, Penalties, RedCards) VALUES ('{}', '{}', '0', '0', '0')
-            """.format(league, name, team)
+        return self.upsert_players(league, player_stats(fixtures))
 
-            self.sess.cursor.execute(query)
-            self.sess.db.commit()
+    def upsert_players(self, league, stats):
+        """Method that adds aggregated player statistics to the database with a single statement. Players without an entry are inserted, all others have their statistics incremented by the database
+        itself
 
-            return self.update_player(league, team, event)
+        Parameters
+        ----------
+        league: str
+            league name
+        stats: dict
+            dictionary of form {(name, team): [goals, penalties, red_cards]}, as returned by player_stats()
 
-        # the type of event is then determined
+        Returns
+        -------
+        rows: int
+            number of players written
 
-        if event.type == 'goal':
-            goals += 1
-        elif event.type == 'penalty':
-            pens += 1
-        else:
-            reds += 1
+        """
 
-        # the players statstics are updated
+        if not stats:
+            return 0
 
         query = """
-        UPDATE {}Players SET Goals = '{}', Penalties = '{}', RedCards = '{}'
-        """.format(league, goals, pens, reds)
+        INSERT INTO {}Players (Name, Team, Goals, Penalties, RedCards) VALUES (%s, %s, %s, %s, %s)
+        ON DUPLICATE KEY UPDATE Goals = Goals + VALUES(Goals), Penalties = Penalties + VALUES(Penalties), RedCards = RedCards + VALUES(RedCards)
+        """.format(league)
 
-        self.sess.db.commit()
+        self.sess.cursor.executemany(query, [key + tuple(values) for key, values in stats.items()])
+
+        return len(stats)
 
     def clear_system(self):
         """Method Used to clear the Database of all Data"""
@@ -0,0 +1,18 @@
+import os
+import sys
+import types
+
+
+# the modules of the project are imported both as 'data.<module>' and 'admin.session' (as laid out on the server) and as top-level modules (as the user interface imports them). The repository root
+# is therefore put on the path, and registered as both packages, so that the tests run from a plain checkout
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+sys.path.insert(0, ROOT)
+
+for name in ('data', 'admin'):
+    if name not in sys.modules:
+        package = types.ModuleType(name)
+        package.__path__ = [ROOT]
+
+        sys.modules[name] = package
@@ -0,0 +1,28 @@
+import pytest
+from data.event_decoder import decode_event, decode_events
+
+
+@pytest.mark.parametrize('text, expected', [
+    ("12'", (12, 'goal')),
+    ("45' +2'", (47, 'goal')),
+    ("90' +10'", (100, 'goal')),
+    ("23' pen", (23, 'penalty')),
+    ("Dismissed at 67'", (67, 'red_card')),
+    ("Dismissed at 90' +4'", (94, 'red_card')),
+    ('no event', None)
+])
+def test_decode_event(text, expected):
+    assert decode_event(text) == expected
+
+
+def test_duplicated_events_are_read_once():
+
+    # note that the HTML source holds every event twice
+
+    assert decode_events("90' +10'90' +10'") == [(100, 'goal')]
+    assert decode_events("23' pen23' pen, 45'45'") == [(23, 'penalty'), (45, 'goal')]
+    assert decode_events("45' +2', 90'45' +2', 90'") == [(47, 'goal'), (90, 'goal')]
+
+
+def test_no_events():
+    assert decode_events('') == []
@@ -0,0 +1,72 @@
+import random
+import pytest
+from data import gather_data
+
+
+# synthetic page following the markup of the BBC fixtures page; note that every character of an event string is wrapped in its own span, and that every event is written twice
+
+def chars(text):
+    return ''.join('<span>{}</span>'.format(c) for c in text)
+
+
+def scorers(events):
+    return ''.join('<li class="sp-c-fixture__scorer"><span class="sp-c-fixture__player-name">{}</span>{}</li>'.format(player, chars(text)) for player, text in events)
+
+
+def fixture(home, away, home_score, away_score, home_events, away_events):
+    return ('<article class="sp-c-fixture"><div>'
+            '<span class="sp-c-fixture__team sp-c-fixture__team--home"><span><abbr title="{0}">{0}</abbr></span></span>'
+            '<span class="sp-c-fixture__number sp-c-fixture__number--home sp-c-fixture__number--ft">{2}</span>'
+            '<span class="sp-c-fixture__number sp-c-fixture__number--away sp-c-fixture__number--ft">{3}</span>'
+            '<span class="sp-c-fixture__team sp-c-fixture__team--away"><span><abbr title="{1}">{1}</abbr></span></span>'
+            '</div><aside class="sp-c-fixture__aside"><ul><ul class="x--home">{4}</ul></ul><ul class="x--away">{5}</ul></aside></article>').format(
+        home, away, home_score, away_score, scorers(home_events), scorers(away_events))
+
+
+def page(seed=0):
+
+    rng = random.Random(seed)
+
+    def event():
+        text = "{}'".format(rng.randint(1, 90)) + rng.choice(['', " +2'", " +10'"]) + rng.choice(['', ' pen'])
+        return rng.choice([text, 'Dismissed at ' + text.replace(' pen', '')])
+
+    def events(team):
+        return [("{} O'Player {}".format(team, i), ', '.join(2 * [event()])) for i in range(rng.randint(0, 3))]
+
+    blocks = []
+
+    for league in ('Premier League', 'German Bundesliga', 'Champions League'):
+
+        fixtures = [fixture(home, away, rng.randint(0, 5), rng.randint(0, 5), events(home), events(away))
+                    for home, away in (('{} Home {}'.format(league, i), '{} Away {}'.format(league, i)) for i in range(6))]
+
+        blocks.append('<div class="qa-match-block"><h3>{}</h3><ul>{}</ul></div>'.format(league, ''.join('<li>{}</li>'.format(f) for f in fixtures)))
+
+    return '<html><body>{}</body></html>'.format(''.join(blocks))
+
+
+def as_text(parsed_data):
+    return {league: [str(fixture) for fixture in fixtures.values()] for league, fixtures in parsed_data.items()}
+
+
+def processed(page_source, backend):
+
+    parsed_data = {}
+
+    for league, data in gather_data.parse_leagues(page_source, gather_data.DEFAULT_LEAGUES, backend).items():
+        parsed_data = gather_data.process_data('2019-02-23', league, data, parsed_data, backend=backend)
+
+    return as_text(parsed_data)
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_lxml_backend_matches_bs4(seed):
+
+    source = page(seed)
+
+    expected = processed(source, 'bs4')
+
+    assert expected and all(expected.values())
+    assert processed(source, 'lxml') == expected
+    assert as_text(gather_data.fixtures_from_records('2019-02-23', gather_data.page_records(source, gather_data.DEFAULT_LEAGUES))) == expected
@@ -0,0 +1,42 @@
+import time
+import pickle
+import threading
+from types import SimpleNamespace
+import league_cache
+from league_cache import LeagueCache
+from standings import FixtureScore
+
+
+def test_league_is_unpickled_once(tmp_path, monkeypatch):
+
+    fixture = FixtureScore('2019-08-10', 'Arsenal', 'Burnley', 1, 1)
+
+    with open(tmp_path / 'PremierLeague.dat', 'wb') as f:
+        pickle.dump(SimpleNamespace(fixtures={fixture.date: {0: fixture}}), f)
+
+    loads, load = [], pickle.load
+
+    def slow_load(f):
+        loads.append(f.name)
+        time.sleep(0.05)
+
+        return load(f)
+
+    monkeypatch.setattr(league_cache.pickle, 'load', slow_load)
+
+    cache = LeagueCache(str(tmp_path))
+    results = []
+
+    # e.g. a prefetch and the selection of the league by the user
+
+    threads = [threading.Thread(target=lambda: results.append(cache.load('Premier League'))) for _ in range(4)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert len(loads) == 1
+    assert all(result is results[0] for result in results)
+    assert cache.fixtures['Premier League'].on('2019-08-10') == [fixture]
@@ -0,0 +1,93 @@
+import threading
+import pytest
+from data.driver_pool import DriverPool
+from data.connection_pool import ConnectionPool
+
+
+class Driver():
+
+    current_url = 'about:blank'
+
+    def quit(self):
+        pass
+
+
+class Connection():
+
+    def rollback(self):
+        pass
+
+    def ping(self, reconnect=False):
+        pass
+
+    def close(self):
+        pass
+
+
+def wait_for(pool):
+    """Function that acquires a resource from another thread, and returns the thread along with the list the resource is put in"""
+
+    acquired = []
+
+    thread = threading.Thread(target=lambda: acquired.append(pool.acquire(timeout=5)))
+    thread.start()
+
+    return thread, acquired
+
+
+def test_recycled_driver_wakes_waiter():
+
+    pool = DriverPool(Driver, size=1, max_pages=1)
+
+    driver = pool.acquire()
+    thread, acquired = wait_for(pool)
+
+    # the driver has rendered max_pages pages, and is hence closed rather than returned
+
+    pool.release(driver)
+    thread.join()
+
+    assert acquired and acquired[0] is not driver
+
+    pool.shutdown()
+
+
+def test_expired_connection_wakes_waiter():
+
+    pool = ConnectionPool(Connection, size=1, recycle=0)
+
+    connection = pool.acquire()
+    thread, acquired = wait_for(pool)
+
+    pool.release(connection)
+    thread.join()
+
+    assert acquired and acquired[0] is not connection
+
+    pool.shutdown()
+
+
+def test_discard_wakes_waiter():
+
+    pool = ConnectionPool(Connection, size=1)
+
+    connection = pool.acquire()
+    thread, acquired = wait_for(pool)
+
+    pool.release(connection, discard=True)
+    thread.join()
+
+    assert acquired
+
+    pool.shutdown()
+
+
+def test_timeout():
+
+    pool = DriverPool(Driver, size=1)
+    pool.acquire()
+
+    with pytest.raises(TimeoutError):
+        pool.acquire(timeout=0.01)
+
+    pool.shutdown()
@@ -0,0 +1,127 @@
+import pytest
+from admin.session import get_backend
+from data import schema
+from data.records import FixtureRecord, EventRecord
+from data.store_data import Session
+
+
+@pytest.fixture
+def backend(tmp_path):
+    return get_backend('sqlite', str(tmp_path / 'football.db'))
+
+
+@pytest.fixture
+def cursor(backend):
+
+    with backend.borrow() as connection:
+        cursor = backend.cursor(connection)
+        schema.create_schema(cursor)
+
+        yield cursor
+
+
+FIXTURES = [
+    FixtureRecord('2018-09-01', 'Arsenal', '2', 'Chelsea', '1', [EventRecord('Aubameyang', 10, 'goal', True), EventRecord('Hazard', 50, 'penalty', False),
+                                                                  EventRecord('Aubameyang', 70, 'goal', True)]),
+    FixtureRecord('2019-03-02', 'Chelsea', '0', 'Arsenal', '0'),
+    FixtureRecord('2019-09-01', 'Arsenal', '1', 'Chelsea', '3')
+]
+
+
+def league_id(cursor, season):
+
+    cursor.execute('SELECT LeagueId FROM leagues WHERE Name = %s AND Season = %s', ('premierleague', season))
+
+    return cursor.fetchall()[0][0]
+
+
+def test_season():
+
+    assert schema.season('2018-08-11') == schema.season('2019-02-23') == '2018/2019'
+    assert schema.season('2019-07-01') == '2019/2020'
+
+
+def test_write_fixtures(cursor):
+
+    assert schema.write_fixtures(cursor, 'premierleague', FIXTURES) == 6
+
+    # each season is a league of its own
+
+    assert schema.standings(cursor, league_id(cursor, '2018/2019')) == [('Arsenal', 2, 2, 1, 1, 1, 0, 1, 4), ('Chelsea', 2, 1, 2, -1, 0, 1, 1, 1)]
+    assert schema.standings(cursor, league_id(cursor, '2019/2020')) == [('Chelsea', 1, 3, 1, 2, 1, 0, 0, 3), ('Arsenal', 1, 1, 3, -2, 0, 1, 0, 0)]
+
+    assert schema.top_scorers(cursor, league_id(cursor, '2018/2019')) == [('Aubameyang', 'Arsenal', 2, 0, 0), ('Hazard', 'Chelsea', 0, 1, 0)]
+
+    assert [row[0] for row in schema.team_fixtures(cursor, 'Arsenal')] == ['2018-09-01', '2019-03-02', '2019-09-01']
+
+
+def test_write_fixtures_twice(cursor):
+
+    schema.write_fixtures(cursor, 'premierleague', FIXTURES)
+
+    # a fixture written again replaces its score and events rather than being counted twice
+
+    corrected = FixtureRecord('2018-09-01', 'Arsenal', '1', 'Chelsea', '1', [EventRecord('Aubameyang', 10, 'goal', True), EventRecord('Hazard', 50, 'penalty', False)])
+
+    schema.write_fixtures(cursor, 'premierleague', FIXTURES[1:2] + [corrected])
+
+    assert schema.standings(cursor, league_id(cursor, '2018/2019')) == [('Arsenal', 2, 1, 1, 0, 0, 0, 2, 2), ('Chelsea', 2, 1, 1, 0, 0, 0, 2, 2)]
+    assert schema.top_scorers(cursor, league_id(cursor, '2018/2019')) == [('Aubameyang', 'Arsenal', 1, 0, 0), ('Hazard', 'Chelsea', 0, 1, 0)]
+
+    cursor.execute('SELECT COUNT(*) FROM fixtures')
+
+    assert cursor.fetchall() == [(3,)]
+
+
+def legacy(backend):
+    """Function that loads the fixtures into the previous layout, i.e. three tables per league and one table per team"""
+
+    with Session(backend) as sess:
+        sess.bulk_update_database({'Premier League': FIXTURES})
+
+    with backend.borrow() as connection:
+        return backend.tables(backend.cursor(connection))
+
+
+@pytest.mark.parametrize('drop', [False, True])
+def test_migrate(backend, drop):
+
+    before = legacy(backend)
+
+    schema.migrate(backend, drop=drop)
+
+    with backend.borrow() as connection:
+        cursor = backend.cursor(connection)
+
+        tables = backend.tables(cursor)
+
+        assert set(schema.TABLES) <= set(tables)
+        assert ('premierleagueFixtures' in tables) != drop
+        assert ('arsenal' in tables) != drop
+        assert 'ingest_ledger' in tables
+
+        # the events are restored from the ledger
+
+        cursor.execute('SELECT COUNT(*) FROM fixtures')
+        assert cursor.fetchall() == [(3,)]
+
+        assert schema.top_scorers(cursor, league_id(cursor, '2018/2019'))[0] == ('Aubameyang', 'Arsenal', 2, 0, 0)
+
+        assert set(tables) - set(before) == set(schema.TABLES)
+
+
+def test_migrate_twice(backend):
+
+    legacy(backend)
+
+    schema.migrate(backend)
+    schema.migrate(backend)
+
+    with backend.borrow() as connection:
+        cursor = backend.cursor(connection)
+
+        cursor.execute('SELECT COUNT(*) FROM fixtures')
+        assert cursor.fetchall() == [(3,)]
+
+        cursor.execute('SELECT COUNT(*) FROM events')
+        assert cursor.fetchall() == [(3,)]
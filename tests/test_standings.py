@@ -0,0 +1,71 @@
+from data.standings import Standings, FixtureScore, COLUMNS, season
+
+
+FIXTURES = [
+    FixtureScore('2018-09-01', 'Arsenal', 'Burnley', 2, 0),
+    FixtureScore('2019-03-01', 'Chelsea', 'Arsenal', 1, 0),
+    FixtureScore('2019-08-10', 'Arsenal', 'Burnley', 1, 1),
+    FixtureScore('2019-08-17', 'Burnley', 'Everton', 3, 0)
+]
+
+
+def rows(table):
+    return {team: dict(zip(COLUMNS, map(int, row))) for team, row in table}
+
+
+def test_current_table_holds_latest_season_only():
+
+    standings = Standings.from_fixtures(FIXTURES)
+
+    table = rows(standings.table())
+
+    assert standings.season == season('2019-08-17') == '2019/2020'
+
+    # Chelsea did not play in the latest season, and Arsenal's points of the previous season are not counted
+
+    assert set(table) == {'Arsenal', 'Burnley', 'Everton'}
+    assert table['Arsenal']['Played'] == 1 and table['Arsenal']['Pts'] == 1
+    assert table['Burnley']['Pts'] == 4
+
+
+def test_fixture_of_earlier_season_leaves_current_table():
+
+    standings = Standings.from_fixtures(FIXTURES[2:])
+    current = standings.totals.copy()
+
+    assert standings.add_fixture(FIXTURES[0])
+    assert (standings.totals[:len(current)] == current).all()
+
+
+def test_table_on_date_holds_its_season_only():
+
+    standings = Standings.from_fixtures(FIXTURES)
+
+    # the first match day of the 2019/2020 season
+
+    table = rows(standings.table('2019-08-10'))
+
+    assert set(table) == {'Arsenal', 'Burnley'}
+    assert table['Arsenal']['Pts'] == table['Burnley']['Pts'] == 1
+
+    # the end of the 2018/2019 season
+
+    table = rows(standings.table('2019-06-30'))
+
+    assert table['Arsenal']['Played'] == 2 and table['Arsenal']['Pts'] == 3
+    assert table['Chelsea']['Pts'] == 3
+
+    # a date of the new season before its first match day
+
+    assert standings.table('2019-07-15') == []
+
+
+def test_table_on_date_matches_fixtures_up_to_date():
+
+    standings = Standings.from_fixtures(FIXTURES)
+
+    for date in ('2018-09-01', '2019-03-01', '2019-08-10', '2019-08-17', '2020-01-01'):
+
+        expected = Standings.from_fixtures(fixture for fixture in FIXTURES if season(fixture.date) == season(date) and fixture.date <= date)
+
+        assert rows(standings.table(date)) == rows(expected.table(date))
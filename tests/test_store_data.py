@@ -0,0 +1,121 @@
+import pytest
+from admin.session import get_backend
+from data.records import FixtureRecord, EventRecord
+from data.store_data import Session
+
+
+LEAGUE = 'premierleague'
+
+
+@pytest.fixture
+def backend(tmp_path):
+    return get_backend('sqlite', str(tmp_path / 'football.db'))
+
+
+def query(backend, sql, args=()):
+
+    with backend.borrow() as connection:
+        cursor = backend.cursor(connection)
+        cursor.execute(sql, args)
+
+        return cursor.fetchall()
+
+
+def load(backend, *fixtures):
+
+    with Session(backend) as sess:
+        sess.bulk_update_database({'Premier League': list(fixtures)})
+
+
+def legacy_fixture(backend, fixture):
+    """Function that writes a fixture the way it was written before the ledger existed, i.e. to the fixtures table and the league table, without any entry in the ledger"""
+
+    with Session(backend) as sess:
+        sess.add_league(LEAGUE)
+        sess.cursor.execute('INSERT INTO {}Fixtures (Date, HomeTeam, AwayTeam, HomeScore, AwayScore, Result) VALUES (%s, %s, %s, %s, %s, %s)'.format(LEAGUE),
+                            (fixture.date, fixture.home_team, fixture.away_team, fixture.home_score, fixture.away_score, fixture.result))
+        sess.cursor.execute('INSERT INTO {} (Team, Played, GF, GA, GD, Won, Lost, Draw, Pts) VALUES (%s, 1, 1, 0, 1, 1, 0, 0, 3)'.format(LEAGUE), ('arsenal',))
+
+
+def legacy_table(backend, table, columns):
+    """Function that replaces a table of the league by the version of earlier releases, created with the given column definitions"""
+
+    with Session(backend) as sess:
+        sess.add_league(LEAGUE)
+        sess.cursor.execute('DROP TABLE {}'.format(table))
+        sess.cursor.execute('CREATE TABLE {} ({})'.format(table, columns))
+
+
+def primary_key(backend, table):
+
+    with backend.borrow() as connection:
+        return backend.primary_key(backend.cursor(connection), table)
+
+
+def points(backend, team):
+    return query(backend, 'SELECT Played, Pts FROM {} WHERE Team = %s'.format(LEAGUE), (team,))[0]
+
+
+def test_legacy_fixture_is_adopted(backend):
+
+    fixture = FixtureRecord('2018-09-01', 'Arsenal', '1', 'Chelsea', '0')
+
+    legacy_fixture(backend, fixture)
+
+    load(backend, fixture)
+
+    assert points(backend, 'arsenal') == (1, 3)
+    assert len(query(backend, 'SELECT * FROM ingest_ledger')) == 1
+
+
+def test_rematch_of_legacy_fixture_is_loaded(backend):
+
+    legacy_fixture(backend, FixtureRecord('2018-09-01', 'Arsenal', '1', 'Chelsea', '0'))
+
+    load(backend, FixtureRecord('2019-09-01', 'Arsenal', '2', 'Chelsea', '0', [EventRecord('Aubameyang', 10, 'goal', True)]))
+
+    assert points(backend, 'arsenal') == (2, 6)
+    assert points(backend, 'chelsea') == (1, 0)
+    assert query(backend, 'SELECT Goals FROM {}Players WHERE Name = %s'.format(LEAGUE), ('Aubameyang',)) == [(1,)]
+    assert len(query(backend, 'SELECT * FROM {}Fixtures'.format(LEAGUE))) == 2
+
+
+def test_corrected_rematch_keeps_first_meeting(backend):
+
+    load(backend, FixtureRecord('2018-09-01', 'Arsenal', '1', 'Chelsea', '0'))
+    load(backend, FixtureRecord('2019-09-01', 'Arsenal', '2', 'Chelsea', '0'))
+    load(backend, FixtureRecord('2019-09-01', 'Arsenal', '2', 'Chelsea', '1'))
+
+    assert query(backend, 'SELECT Date, AwayScore FROM {}Fixtures ORDER BY Date'.format(LEAGUE)) == [('2018-09-01', 0), ('2019-09-01', 1)]
+    assert points(backend, 'arsenal') == (2, 6)
+
+
+def test_fixtures_table_is_keyed_by_date(backend):
+
+    legacy_table(backend, LEAGUE + 'Fixtures', 'Date CHAR(10) NOT NULL, Time CHAR(5), HomeTeam VARCHAR(50) NOT NULL, AwayTeam VARCHAR(50) NOT NULL, HomeScore INT NOT NULL, '
+                                                'AwayScore INT NOT NULL, Result VARCHAR(10) NOT NULL, PRIMARY KEY (HomeTeam, AwayTeam)')
+
+    load(backend, FixtureRecord('2018-09-01', 'Arsenal', '1', 'Chelsea', '0'), FixtureRecord('2019-09-01', 'Arsenal', '2', 'Chelsea', '0'))
+
+    assert primary_key(backend, LEAGUE + 'Fixtures') == ['Date', 'HomeTeam', 'AwayTeam']
+    assert len(query(backend, 'SELECT * FROM {}Fixtures'.format(LEAGUE))) == 2
+
+
+def test_loading_twice_changes_nothing(backend):
+
+    fixture = FixtureRecord('2019-09-01', 'Arsenal', '2', 'Chelsea', '0')
+
+    load(backend, fixture)
+    load(backend, fixture)
+
+    assert points(backend, 'arsenal') == (1, 3)
+
+
+def test_players_table_is_keyed_by_team(backend):
+
+    legacy_table(backend, LEAGUE + 'Players', 'Name VARCHAR(50) NOT NULL PRIMARY KEY, Team VARCHAR(50) NOT NULL, Goals INT NOT NULL, Penalties INT NOT NULL, RedCards INT NOT NULL')
+
+    load(backend, FixtureRecord('2019-09-01', 'Arsenal', '1', 'Chelsea', '1', [EventRecord('Silva', 10, 'goal', True), EventRecord('Silva', 20, 'goal', False)]))
+
+    assert primary_key(backend, LEAGUE + 'Players') == ['Name', 'Team']
+    assert query(backend, 'SELECT Team, Goals FROM {}Players ORDER BY Team'.format(LEAGUE)) == [('Arsenal', 1), ('Chelsea', 1)]
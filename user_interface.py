@@ -1,11 +1,11 @@
 import tkinter as tk
 from tkinter import ttk
 import sys
-import datetime
-import numpy as np
-import pandas as pd
-import pickle
-from get_data import League, LeagueTable, PlayerTable
+import argparse
+import importlib
+from league_cache import LeagueCache
+from worker import Worker
+from prefetch import Prefetcher
 from widgets import *
 
 SMALL_FONT = ('Verdana', 8)
@@ -17,10 +17,22 @@ class Application(tk.Tk):
 
     """
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, data_dir=None, **kwargs):
 
         super().__init__(*args, **kwargs)
 
+        # all leagues are loaded through a single cache, which is shared by all frames and widgets
+
+        self.cache = LeagueCache(data_dir)
+
+        # all file I/O and database queries are run by the worker, so that the main loop never blocks
+
+        self.worker = Worker(self)
+
+        # the views around the current selection are prepared in the background, so that the next selection can usually be displayed at once
+
+        self.prefetcher = Prefetcher(self.cache, self.worker, LeagueBarWidget.leagues)
+
         # the container frame is defined and packed into the main window; note that all frame objects require some sort of parent, and the container acts as said parent.
 
         container = tk.Frame(self)
@@ -48,6 +60,10 @@ class Application(tk.Tk):
 
         self.show_frame(MainPage)
 
+        # pandas is only needed once a league table is displayed; hence, it is imported by the worker while the window is being drawn rather than before
+
+        self.worker.submit('import', importlib.import_module, 'pandas')
+
     def show_frame(self, container):
         """Method Used to raise a frame to the front
 
@@ -89,21 +105,20 @@ class MainPage(tk.Frame):
         self.fixtures = LeagueFixtureWidget(self, controller)
         self.fixtures.grid(row=2, column=0, sticky='nsew', pady=5, padx=5)
 
-        # a copy of all the league tables are then created; note that because these are only created once, they are created while loading and stored for retrieval to save time. Note that these are stacked and the proper table is raised when called
-
-        self.league_tables = {}
-        self.league_objects = {}
+        # the league tables are created the first time a league is selected, once the league has been loaded. Note that these are stacked and the proper table is raised when called; while a
+        # league is loading, a placeholder is raised instead
 
-        leagues = ['Premier League', 'German Bundesliga',
-                   'Spanish La Liga', 'Italian Serie A']
+        self.controller = controller
+        self.cache = controller.cache
+        self.prefetcher = controller.prefetcher
 
-        for league in leagues:
+        self.league_tables = {}
 
-            with open(r'D:\PythonCode\WebProject\user_interface\data\{}.dat'.format(league.replace(' ', '')), 'rb') as f:
-                self.league_objects[league] = pickle.load(f)
+        self.league = None
+        self.date = None
 
-            self.league_tables[league] = LeagueTableWidget(self, controller, league)
-            self.league_tables[league].grid(row=2, column=1, sticky='nsew', pady=5, padx=5)
+        self.placeholder = ttk.Label(self, text='', font=('Verdana', 10), anchor='center', relief=tk.RAISED)
+        self.placeholder.grid(row=2, column=1, sticky='nsew', pady=5, padx=5)
 
         # the league selection bar is then added
 
@@ -112,18 +127,94 @@ class MainPage(tk.Frame):
 
         # finally the date selection bar is added
 
-        datebar = DateWidget(self, controller)
-        datebar.grid(row=1, sticky='nsew', columnspan=2)
+        self.datebar = DateWidget(self, controller)
+        self.datebar.grid(row=1, sticky='nsew', columnspan=2)
+
+    def select_league(self, league):
+        """Method called from the LeagueBarWidget object when a new league is selected. If the league has not been loaded yet, it is loaded by the worker and a placeholder is shown until the
+        league is available. Note that any load or query still running for the previously selected league is cancelled"""
+
+        self.league = league
+
+        self.controller.worker.cancel('date')
+
+        if self.cache.is_loaded(league):
+            self.controller.worker.cancel('league')
+            self.show_league(league)
+            return
+
+        self.placeholder['text'] = 'Loading {}...'.format(league)
+        self.placeholder.tkraise()
+
+        self.controller.worker.submit('league', self.cache.load, league, callback=lambda data: self.show_league(league),
+                                      errback=lambda err: self.placeholder.configure(text='Could not load {}: {}'.format(league, err)))
+
+    def show_league(self, league):
+        """Method that displays the fixtures and league table of a loaded league"""
+
+        if league not in self.league_tables:
+            self.league_tables[league] = LeagueTableWidget(self, self.controller, league)
+            self.league_tables[league].grid(row=2, column=1, sticky='nsew', pady=5, padx=5)
+
+        self.fixtures.select_league(league)
+
+        self.view_table(league)
+
+        # the match days of the league are highlighted in the date bar
+
+        self.datebar.fill_buttons()
+
+        if self.date is not None:
+            self.display_date(self.date)
+        else:
+            self.prefetcher.prefetch(league, None)
 
     def view_table(self, league):
-        """Method that raises the corresponding league table; note that this method is called from the LeagueBarWidget object when a new league is selected"""
+        """Method that raises the corresponding league table"""
 
         self.league_tables[league].tkraise()
 
+    def display_date(self, date):
+        """Method that displays the fixtures of a date, along with the league table as it stood at the end of that date; note that this method is called from the DateWidget object. If the view
+        has been prefetched, it is displayed at once; otherwise, it is built by the worker, and a view still being built for a previously selected date is cancelled"""
+
+        self.date = date
+
+        # if the selected league is still loading, the date is displayed once the league has been loaded
+
+        if self.league not in self.league_tables:
+            return
+
+        league = self.league
+
+        view = self.prefetcher.get(league, date)
+
+        if view is not None:
+            self.controller.worker.cancel('date')
+            self.show_date(league, date, view)
+        else:
+            self.controller.worker.submit('date', self.prefetcher.build, league, date, callback=lambda view: self.show_date(league, date, view))
+
+        self.prefetcher.prefetch(league, date)
+
+    def show_date(self, league, date, view):
+        """Method that displays the fixtures of a date and the league table, as held by a View object"""
+
+        self.fixtures.display_date(date, view.cells)
+
+        self.league_tables[league].display_table(view.table)
+
 
 def main():
 
-    app = Application()
+    # note that the user interface reads the league files only, and never connects to the database
+
+    parser = argparse.ArgumentParser(description='Football results viewer')
+    parser.add_argument('--data-dir', default=None, help='directory holding the league files')
+
+    args = parser.parse_args()
+
+    app = Application(data_dir=args.data_dir)
     app.geometry('800x600')
     app.mainloop()
 
@@ -1,13 +1,12 @@
 import tkinter as tk
 from tkinter import ttk
-import pickle
 import datetime
-import pandas as pd
-import numpy as np
+from prefetch import cell_models
 
 
 class DateWidget(tk.Frame):
-    """Widget that shows displays a series of date buttons that can be clicked in order to view data from different days
+    """Widget that shows displays a series of date buttons that can be clicked in order to view data from different days. The arrow buttons move the dates by a single day, while the double arrow
+    buttons jump straight to the previous or next match day of the selected league, which may be in another season
 
     Parameters
     ----------
@@ -23,6 +22,10 @@ class DateWidget(tk.Frame):
 
     days = {0: 'Mon', 1: 'Tue', 2: 'Wed', 3: 'Thur', 4: 'Fri', 5: 'Sat', 6: 'Sun'}
 
+    # number of date buttons
+
+    count = 8
+
     def __init__(self, parent, controller):
 
         self.parent = parent
@@ -33,57 +36,77 @@ class DateWidget(tk.Frame):
 
         self.grid_rowconfigure(0, weight=1)
 
-        # a series of dates is first defined
+        # match days of the selected league are shown in a different colour
 
         style = ttk.Style()
         style.configure('my.TButton', font=('Verdana', 7, 'bold'))
+        style.configure('match.my.TButton', foreground='#1f4e9c')
 
-        # a new grid column is then generated for each date; a button is then placed in the newly created grid column, with the date as the button text.
+        # a new grid column is generated for each date, plus two columns on either side for the arrow buttons. Note that the buttons are only created once; scrolling only changes their dates
 
-        for i in range(10):
+        for i in range(self.count + 4):
             self.grid_columnconfigure(i, weight=1)
 
+        arrows = [('<<', lambda: self.jump(0)), ('<', lambda: self.scroll(0)), ('>', lambda: self.scroll(1)), ('>>', lambda: self.jump(1))]
+
+        for column, (text, command) in zip((0, 1, self.count + 2, self.count + 3), arrows):
+            tk.Button(self, text=text, command=command).grid(row=0, column=column, sticky='nsew')
+
+        self.buttons = []
+
+        for i in range(self.count):
+            self.buttons.append(ttk.Button(self, style='my.TButton'))
+            self.buttons[i].grid(row=0, column=i + 2, sticky='nsew')
+
+        self.dates = []
+
         self.fill_buttons()
 
     def fill_buttons(self, dates=None):
-        """Method that fills the Buttons on the widget with the corresponding dates; note that the first and last button contain arrows used for scrolling through dates. Scrolling through the dates works by deleting all the current
-        Buttons and recreating them with the new dates. Hence, the fill_boxes() method is called eveytime the user clicks on the next date
+        """Method that fills the Buttons on the widget with the corresponding dates; the buttons of dates on which the selected league has fixtures are highlighted
 
         Parameters
         ----------
         dates: iterator
-            iterator containing the dates the buttons should display
+            iterator containing the datetime.date objects the buttons should display; the dates currently displayed are used if None, or the days up to yesterday if no dates are displayed yet
 
         """
 
-        self.buttons = []
+        if dates is not None:
+            self.dates = list(dates)
+        elif not self.dates:
+            self.dates = self.ending(datetime.date.today() - datetime.timedelta(days=1))
 
-        if dates is None:
-            dates = reversed([str(datetime.date.today() - datetime.timedelta(days=i))
-                              for i in range(1, 11)])
+        # the match days within the displayed dates are found with a single range query on the fixtures of the selected league
 
-        for i, date in enumerate(dates):
+        store = self.store()
 
-            # Note that the first and last buttons are arrows used to go to cycle between dates; hence the first and last dates are NOT displayed
+        match_days = set() if store is None else {date for date, fixtures in store.window(self.dates[0], self.dates[-1])}
 
-            if not i:
-                self.buttons.append(tk.Button(self, text='<', command=lambda: self.scroll(0)))
-                self.buttons[i].grid(row=0, column=i, sticky='nsew')
-            elif i == 9:
-                self.buttons.append(tk.Button(self, text='>', command=lambda: self.scroll(1)))
-                self.buttons[i].grid(row=0, column=i, sticky='nsew')
-            else:
-                date_str = self.convert_date(date)
-                self.buttons.append(ttk.Button(
-                    self, text='{}\n{} {}'.format(date_str[0], date_str[1], date_str[2]), style='my.TButton', command=lambda date=date: self.parent.fixtures.display_date(date)))
-                self.buttons[i].grid(row=0, column=i, sticky='nsew')
+        for button, date in zip(self.buttons, self.dates):
+
+            date = str(date)
+            date_str = self.convert_date(date)
+
+            button.configure(text='{}\n{} {} {}'.format(*date_str), style='match.my.TButton' if date in match_days else 'my.TButton',
+                             command=lambda date=date: self.parent.display_date(date))
+
+    def ending(self, date):
+        """Method that returns the dates displayed when the given date is the last date displayed"""
+
+        return [date - datetime.timedelta(days=i) for i in reversed(range(self.count))]
+
+    def store(self):
+        """Method that returns the FixtureStore of the selected league, or None if no league has been loaded yet"""
+
+        return self.parent.cache.fixtures.get(self.parent.league)
 
     def convert_date(self, date):
         """Function used to convert from YYYY-MM-DD date format to string Weekday, Day, Month
 
         Returns
         -------
-        returns formated date in tuple (weekday, day of month, month name)
+        returns formated date in tuple (weekday, day of month, month name, year)
 
         """
 
@@ -92,11 +115,10 @@ class DateWidget(tk.Frame):
 
         day = datetime.date(int(comps[0]), int(comps[1]), int(comps[2])).weekday()
 
-        return (self.days[day], comps[2], month)
+        return (self.days[day], comps[2], month, comps[0])
 
     def scroll(self, delta):
-        """Method called when a user clicks on the arrow button that takes the user to the next date. Note that the new dates are displayed by deleting the current buttons and generating them again using the fill_buttons() method. The job of
-        the following method is to generate the new date iterator
+        """Method called when a user clicks on the arrow button that takes the user to the next date. Note that the buttons are not recreated; only their dates are moved by one day
 
         Parameters
         ----------
@@ -105,37 +127,36 @@ class DateWidget(tk.Frame):
 
         """
 
-        # a reverse mapping between months numers and month names is generated
+        step = datetime.timedelta(days=1 if delta else -1)
 
-        months_reversed = {month: num for num, month in self.months.items()}
+        self.fill_buttons(date + step for date in self.dates)
 
-        # the date on the last button is then retrieved; note that this is the starting point of the date iterator
+    def jump(self, delta):
+        """Method called when a user clicks on the double arrow button that takes the user to the next or previous match day of the selected league. The match day is searched from the selected
+        date (or from the last date displayed, if no date has been selected yet), is displayed as the last date, and is selected
 
-        current_date = (self.buttons[8]['text']).replace('\n', ' ').split(' ')
-
-        # the string is converted into a datetime object
-
-        date = datetime.date(2019, int(months_reversed[current_date[2]]), int(current_date[1]))
+        Parameters
+        ----------
+        delta: int
+            If delta == 1, the next match day is selected. Else, if delta == 0, the previous match day is selected.
 
-        # the old buttons are then deleted
+        """
 
-        del self.buttons
+        store = self.store()
 
-        # the new starting point for the iterator is defined. Note that, because the first and last dates in the date iterator are ignored, number of days added/subtracted from the starting date may not be intuitive
+        if store is None:
+            return
 
-        if delta:
-            start = date + datetime.timedelta(days=3)
-        else:
-            start = date + datetime.timedelta(days=1)
+        current = self.parent.date or self.dates[-1]
 
-        # the new iterator is then created using the new starting date
+        date = store.next(current) if delta else store.previous(current)
 
-        dates = reversed([str(start - datetime.timedelta(days=i))
-                          for i in range(1, 11)])
+        if date is None:
+            return
 
-        # the new buttons are then created with the new iterator
+        self.fill_buttons(self.ending(datetime.date.fromisoformat(date)))
 
-        self.fill_buttons(dates=dates)
+        self.parent.display_date(date)
 
 
 class LeagueBarWidget(tk.Frame):
@@ -150,6 +171,8 @@ class LeagueBarWidget(tk.Frame):
 
     """
 
+    leagues = ['Premier League', 'German Bundesliga', 'Spanish La Liga', 'Italian Serie A', 'Champions League']
+
     def __init__(self, parent, controller):
 
         self.parent = parent
@@ -161,16 +184,13 @@ class LeagueBarWidget(tk.Frame):
         style = ttk.Style()
         style.configure('my.TButton', font=('Verdana', 10, 'bold'))
 
-        leagues = ['Premier League', 'German Bundesliga',
-                   'Spanish La Liga', 'Italian Serie A', 'Champions League']
-
         buttons = {}
 
         self.grid_rowconfigure(0, weight=1)
 
         # A button is created for each league
 
-        for i, league in enumerate(leagues):
+        for i, league in enumerate(self.leagues):
             self.grid_columnconfigure(i, weight=1)
 
             buttons['league'] = ttk.Button(
@@ -180,14 +200,28 @@ class LeagueBarWidget(tk.Frame):
         self.display_league('Premier League')
 
     def display_league(self, league):
-        """Callback Method that is called when a league button is clicked"""
-
-        self.parent.fixtures.select_league(league)
+        """Callback Method that is called when a league button is clicked; note that the league is only loaded when it is first selected"""
 
-        self.parent.view_table(league)
+        self.parent.select_league(league)
 
 
 class LeagueFixtureWidget(tk.Frame):
+    """Widget that displays the fixtures of the selected league on the selected date. Note that the fixture cells are only created once; the widget holds a pool of cells (one for each visible row)
+    and, whenever the date changes or the list is scrolled, the cells are reconfigured in place to show the fixtures that are currently visible. Hence, the cost of a redraw does not depend on the
+    number of fixtures, nor on the number of dates displayed before
+
+    Parameters
+    ----------
+    parent: tk.Frame
+        container frame
+    controller: Application Object
+        the root tk.Tk application object
+
+    """
+
+    # number of fixtures visible at once, i.e. the number of cells in the pool
+
+    rows = 10
 
     def __init__(self, parent, controller):
 
@@ -225,101 +259,259 @@ class LeagueFixtureWidget(tk.Frame):
         self.body_frame = tk.Frame(self, relief=tk.RAISED, borderwidth=2)
         self.body_frame.grid(row=1, column=0, sticky='nsew')
 
-        self.body_frame.grid_columnconfigure(0, weight=1)
         self.body_frame.grid_columnconfigure(0, weight=1)
 
-        for i in range(10):
+        for i in range(self.rows):
             self.body_frame.grid_rowconfigure(i, weight=1)
 
+        # the scrollbar only appears when there are more fixtures than visible rows
+
+        self.scrollbar = ttk.Scrollbar(self.body_frame, orient=tk.VERTICAL, command=self.scroll)
+        self.scrollbar.grid(row=0, column=1, rowspan=self.rows, sticky='ns')
+        self.scrollbar.grid_remove()
+
+        self.no_fix = ttk.Label(self.body_frame, text='No Fixtures for Selected Day', font=('Verdana', 10))
+
+        # the mouse wheel scrolls the list while the pointer is over the fixtures
+
+        self.body_frame.bind('<Enter>', self.bind_wheel)
+        self.body_frame.bind('<Leave>', self.unbind_wheel)
+
         self.cells = []
+        self.items = []
+        self.first = 0
 
     def select_league(self, league):
 
         self.title['text'] = league
 
-        self.data = self.parent.league_objects[league]
+        self.data = self.parent.cache.fixtures[league]
 
-    def display_date(self, date):
+    def display_date(self, date, cells=None):
+        """Method that displays the fixtures of a date
 
-        self.date['text'] = date
+        Parameters
+        ----------
+        date: str
+            date of form 'YYYY-MM-DD'
+        cells: list
+            models of the cells to display, e.g. as prefetched by the Prefetcher; if None, the fixtures are looked up in the date-indexed store of the league
 
-        try:
-            self.fixtures = self.data.fixtures[date]
-        except KeyError:
+        """
 
-            self.fixtures = None
+        self.date['text'] = date
 
-        self.display_fixtures(date)
+        if cells is None:
+            cells = cell_models(self.data.on(date))
 
-    def display_fixtures(self, date):
+        self.display_fixtures(cells)
 
-        if self.cells:
-            for cell in self.cells:
-                cell.destroy()
+    def display_fixtures(self, cells):
 
-        self.cells = []
+        self.items = cells
+        self.first = 0
 
-        if self.fixtures is None:
-            self.no_fix = ttk.Label(
-                self.body_frame, text='No Fixtures for Selected Day', font=('Verdana', 10))
+        if self.items:
+            self.no_fix.grid_remove()
+        else:
             self.no_fix.grid(row=0, columnspan=2)
 
+        self.refresh()
+
+    def refresh(self):
+        """Method that reconfigures the cells of the pool to show the fixtures from self.first onwards; cells are only created while the pool is smaller than the number of visible rows"""
+
+        for k in range(min(self.rows, len(self.items))):
+            if k == len(self.cells):
+                self.cells.append(FixtureCell(self.body_frame))
+                self.cells[k].grid(row=k, column=0, sticky='ew', padx=5, pady=5)
+
+                # the cells cover the body frame; hence, the pointer entering and leaving the cells is also tracked
+
+                self.cells[k].bind('<Enter>', self.bind_wheel)
+                self.cells[k].bind('<Leave>', self.unbind_wheel)
+
+        for k, cell in enumerate(self.cells):
+            i = self.first + k
+
+            if i < len(self.items):
+                cell.show(self.items[i])
+                cell.grid()
+            else:
+                cell.grid_remove()
+
+        if len(self.items) > self.rows:
+            self.scrollbar.grid()
+            self.scrollbar.set(self.first / len(self.items), (self.first + self.rows) / len(self.items))
         else:
-            try:
-                del self.no_fix
-            except AttributeError:
-                pass
+            self.scrollbar.grid_remove()
+
+    def scroll(self, action, amount, unit=None):
+        """Callback method of the scrollbar; note that the arguments follow the protocol of the Tk scrollbar, i.e. ('moveto', fraction) or ('scroll', number, 'units' or 'pages')"""
+
+        if action == 'moveto':
+            first = round(float(amount) * len(self.items))
+        elif unit == 'pages':
+            first = self.first + int(amount) * self.rows
+        else:
+            first = self.first + int(amount)
+
+        first = max(0, min(first, len(self.items) - self.rows))
+
+        if first != self.first:
+            self.first = first
+            self.refresh()
 
-            for i, fixture in enumerate(self.fixtures.values()):
-                self.cells.append(FixtureCell(self.body_frame, fixture))
-                self.cells[i].grid(row=i, column=0, sticky='ew', padx=5, pady=5)
+    def bind_wheel(self, event):
+        self.bind_all('<MouseWheel>', self.on_wheel)
+        self.bind_all('<Button-4>', self.on_wheel)
+        self.bind_all('<Button-5>', self.on_wheel)
+
+    def unbind_wheel(self, event):
+        self.unbind_all('<MouseWheel>')
+        self.unbind_all('<Button-4>')
+        self.unbind_all('<Button-5>')
+
+    def on_wheel(self, event):
+
+        # note that Windows reports the wheel via event.delta, while X11 reports it as button 4 (up) and button 5 (down)
+
+        if event.num == 4 or getattr(event, 'delta', 0) > 0:
+            self.scroll('scroll', -1)
+        else:
+            self.scroll('scroll', 1)
 
 
 class LeagueTableWidget(tk.Frame):
+    """Widget that displays the league table of a league. The whole table is rendered by a single ttk.Treeview, with one item per team; when the table changes (e.g. for another date), the items are
+    updated and moved in place rather than recreated, and the rows that have changed are highlighted. Clicking a column heading sorts the table by that column
+
+    Parameters
+    ----------
+    parent: tk.Frame
+        container frame
+    controller: Application Object
+        the root tk.Tk application object
+    league: str
+        league name
+
+    """
 
     def __init__(self, parent, controller, league):
 
         super().__init__(parent, relief=tk.RAISED, borderwidth=1)
 
+        self.league = league
+
         self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(0, weight=1)
 
-        for i in range(9):
-            self.grid_columnconfigure(i, weight=1)
+        self.tree = ttk.Treeview(self, show='headings', selectmode='browse')
+        self.tree.grid(row=0, column=0, sticky='nsew')
+
+        self.tree.tag_configure('changed', background='#fff2a8')
+
+        # the values currently displayed for each team, used to find the rows that change
+
+        self.values = {}
+
+        self.sort_column = None
+        self.descending = True
 
         self.select_league(league)
 
-    def display_league(self):
-        """Method called when the league is changed in the LeagueBarWidget"""
+    def display_league(self, highlight=True):
+        """Method called when the league is changed in the LeagueBarWidget, or when a new table has to be displayed for the league
+
+        Parameters
+        ----------
+        highlight: boolean
+            if True, the rows whose values differ from those displayed before are highlighted
+
+        """
+
+        # the columns are only configured the first time a table is displayed
 
-        self.teams = []
+        if not self.tree['columns']:
+            columns = ('Team',) + tuple(self.data.columns)
 
-        for i, column in enumerate(self.data, start=1):
+            self.tree['columns'] = columns
 
-            label = ttk.Label(self, text=column, font=('Verdana', 6, 'bold'))
-            label.grid(column=i, row=0)
+            for column in columns:
+                self.tree.heading(column, text=column, command=lambda column=column: self.sort_by(column))
+                self.tree.column(column, width=140 if column == 'Team' else 40, anchor='w' if column == 'Team' else 'center', stretch=column == 'Team')
 
-        for j in range(self.data.shape[0]):
-            team = self.data.iloc[j, :]
-            self.grid_rowconfigure(j + 1, weight=1)
+        rows = [(team,) + tuple(int(val) for val in values) for team, values in zip(self.data.index, self.data.values)]
 
-            self.teams.append(ttk.Button(self, text=team.name))
-            self.teams[j].grid(row=j + 1, column=0, sticky='nsew')
+        if self.sort_column is not None:
+            i = self.tree['columns'].index(self.sort_column)
+            rows.sort(key=lambda row: row[i], reverse=self.descending)
 
-            for k, val in enumerate(team):
-                label = ttk.Label(self, text=str(val), font=('Verdana', 8))
-                label.grid(row=j+1, column=k + 1)
+        values = {}
 
-    def select_league(self, league):
-        league = league.replace(' ', '')
-        with open(r'D:\PythonCode\WebProject\user_interface\data\{}.dat'.format(league), 'rb') as f:
-            self.data = pickle.load(f).table._data
+        for index, row in enumerate(rows):
+
+            team = row[0]
+            values[team] = row
+
+            changed = highlight and bool(self.values) and self.values.get(team) != row
+
+            if team in self.values:
+                self.tree.item(team, values=row, tags=('changed',) if changed else ())
+                self.tree.move(team, '', index)
+            else:
+                self.tree.insert('', index, iid=team, values=row, tags=('changed',) if changed else ())
+
+        # teams that are no longer in the table (i.e. that had not played yet on the selected date) are removed
+
+        for team in set(self.values) - set(values):
+            self.tree.delete(team)
+
+        self.values = values
+
+    def sort_by(self, column):
+        """Callback method of the column headings; clicking the same heading again reverses the order, and clicking the team heading twice restores the order of the league table"""
+
+        if column == self.sort_column:
+            if column == 'Team' and not self.descending:
+                self.sort_column = None
+            else:
+                self.descending = not self.descending
+        else:
+            self.sort_column, self.descending = column, column != 'Team'
+
+        # the rows are only reordered; hence, nothing is highlighted
+
+        self.display_league(highlight=False)
+
+    def select_league(self, league, date=None):
+
+        # the table is read from the materialized standings of the league, which are built once when the application is loaded. Note that the table of any past date is a single slice of the
+        # cumulative standings, and hence no fixtures are processed when a date is selected
+
+        self.data = self.master.cache.standings[league].frame(date)
+
+        self.display_league()
+
+    def display_table(self, data):
+        """Method that displays a league table that has already been built, e.g. by the worker
+
+        Parameters
+        ----------
+        data: pandas.DataFrame
+            league table, as returned by Standings.frame()
+
+        """
+
+        self.data = data
 
         self.display_league()
 
 
 class FixtureCell(tk.Frame):
+    """Cell displaying a single fixture; note that cells are reused for different fixtures by LeagueFixtureWidget, hence the labels are created once and updated by show()"""
 
-    def __init__(self, parent, fixture):
+    def __init__(self, parent, cell=None):
 
         super().__init__(parent)
 
@@ -334,10 +526,8 @@ class FixtureCell(tk.Frame):
         team_frame.grid_rowconfigure(0, weight=1)
         team_frame.grid_columnconfigure(0, weight=1)
 
-        fixture_title = '{} vs {}'.format(fixture.home_team, fixture.away_team)
-
-        title = ttk.Label(team_frame, text=fixture_title, font=('Verdana', '10'))
-        title.grid(row=0, column=0, padx=5, pady=5)
+        self.title = ttk.Label(team_frame, font=('Verdana', '10'))
+        self.title.grid(row=0, column=0, padx=5, pady=5)
 
         home_frame = tk.Frame(self, relief=tk.RAISED, borderwidth=2)
         home_frame.grid(row=1, column=0, sticky='nsew')
@@ -346,9 +536,8 @@ class FixtureCell(tk.Frame):
         home_frame.grid_columnconfigure(0, weight=3)
         home_frame.grid_columnconfigure(1, weight=1)
 
-        home_score = ttk.Label(home_frame, text=str(
-            fixture.home_score), font=('Verdana', 10, 'bold'))
-        home_score.grid(row=0, column=1)
+        self.home_score = ttk.Label(home_frame, font=('Verdana', 10, 'bold'))
+        self.home_score.grid(row=0, column=1)
 
         away_frame = tk.Frame(self, relief=tk.RAISED, borderwidth=2)
         away_frame.grid(row=1, column=1, sticky='nsew')
@@ -357,6 +546,23 @@ class FixtureCell(tk.Frame):
         away_frame.grid_columnconfigure(1, weight=3)
         away_frame.grid_columnconfigure(0, weight=1)
 
-        home_score = ttk.Label(away_frame, text=str(
-            fixture.away_score), font=('Verdana', 10, 'bold'))
-        home_score.grid(row=0, column=0)
+        self.away_score = ttk.Label(away_frame, font=('Verdana', 10, 'bold'))
+        self.away_score.grid(row=0, column=0)
+
+        if cell is not None:
+            self.show(cell)
+
+    def show(self, cell):
+        """Method used to display a fixture in the cell
+
+        Parameters
+        ----------
+        cell: CellModel object
+            texts of the fixture, as returned by prefetch.cell_models()
+
+        """
+
+        self.title['text'] = cell.title
+
+        self.home_score['text'] = cell.home_score
+        self.away_score['text'] = cell.away_score
@@ -0,0 +1,157 @@
+import queue
+from concurrent.futures import ThreadPoolExecutor
+
+
+class Task():
+    """Handle of a job submitted to a Worker
+
+    Parameters
+    ----------
+    key: str
+        key the job was submitted under
+    callback: func object
+        function called with the result of the job, on the Tk main loop
+    errback: func object
+        function called with the exception raised by the job, on the Tk main loop
+
+    """
+
+    def __init__(self, key, callback=None, errback=None):
+
+        self.key = key
+        self.callback = callback
+        self.errback = errback
+
+        self.cancelled = False
+        self.future = None
+
+    def cancel(self):
+        """Method used to cancel the job; a job that has not started yet is never run, and the result of a job that is already running is discarded"""
+
+        self.cancelled = True
+
+        if self.future is not None:
+            self.future.cancel()
+
+
+class Worker():
+    """Worker layer of the user interface. Jobs (e.g. loading a league or querying the database) are run in a pool of threads, and their results are put on a queue; the queue is polled from the Tk
+    main loop with the after() method, so that the callbacks, which update the widgets, always run on the main loop. Note that Tk widgets must never be touched from any other thread
+
+    Parameters
+    ----------
+    widget: tk.Widget object
+        any widget of the application; used to schedule the polling of the queue
+    workers: int
+        number of threads
+    interval: int
+        number of milliseconds between two polls of the queue
+
+    """
+
+    def __init__(self, widget, workers=4, interval=25):
+
+        self.widget = widget
+        self.interval = interval
+
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.results = queue.Queue()
+
+        self.pending = {}
+        self.polling = False
+
+    def submit(self, key, func, *args, callback=None, errback=None):
+        """Method used to run a job in the background. Only the latest job of each key is kept; hence, submitting a job cancels any job of the same key that has not finished yet, e.g. the load of
+        the previously selected league when the user selects another league
+
+        Parameters
+        ----------
+        key: str
+            key of the job, e.g. 'league' or 'date'
+        func: func object
+            function to run in the background
+        args: tuple
+            arguments of the function
+        callback: func object
+            function called with the result of func, on the Tk main loop
+        errback: func object
+            function called with the exception raised by func, on the Tk main loop; the exception is printed if None
+
+        Returns
+        -------
+        task: Task object
+            handle that can be used to cancel the job
+
+        """
+
+        self.cancel(key)
+
+        task = Task(key, callback, errback)
+        task.future = self.executor.submit(self.run, task, func, args)
+
+        self.pending[key] = task
+
+        if not self.polling:
+            self.polling = True
+            self.widget.after(self.interval, self.poll)
+
+        return task
+
+    def run(self, task, func, args):
+        """Method run in the worker thread; note that the result is only put on the queue, and never handed to the widgets directly"""
+
+        if task.cancelled:
+            return
+
+        try:
+            self.results.put((task, func(*args), None))
+
+        except Exception as err:
+            self.results.put((task, None, err))
+
+    def poll(self):
+        """Method run on the Tk main loop, which hands the results of all finished jobs to their callbacks; the results of cancelled jobs are discarded"""
+
+        while True:
+            try:
+                task, result, err = self.results.get_nowait()
+            except queue.Empty:
+                break
+
+            if task.cancelled:
+                continue
+
+            if self.pending.get(task.key) is task:
+                del self.pending[task.key]
+
+            if err is not None:
+                if task.errback is not None:
+                    task.errback(err)
+                else:
+                    print(err)
+
+            elif task.callback is not None:
+                task.callback(result)
+
+        # the queue is only polled while jobs are pending, so that an idle application does not wake up needlessly
+
+        if self.pending:
+            self.widget.after(self.interval, self.poll)
+        else:
+            self.polling = False
+
+    def cancel(self, key):
+        """Method used to cancel the pending job of a key, if any"""
+
+        task = self.pending.pop(key, None)
+
+        if task is not None:
+            task.cancel()
+
+    def shutdown(self):
+        """Method used to cancel all pending jobs and stop the threads"""
+
+        for key in list(self.pending):
+            self.cancel(key)
+
+        self.executor.shutdown(wait=False)